@@ -0,0 +1,183 @@
+# Batched.py
+"""
+Simplex por lotes sobre una pila 3-D de tablas.
+Resuelve K problemas de la misma forma (mismos m y n) a la vez: la tabla k de
+la pila es la tabla de crear_tabla (o de construir_tabla_big_m, ver
+resolver_big_m_lote) del problema k, con forma K x (m+1) x columnas. La elección
+de columna, la prueba de razón y el pivoteo se hacen para todos los problemas
+activos en una sola operación vectorizada; los que ya terminaron (óptimos o no
+acotados) se retiran de la pila de trabajo. Con Big M, cada tabla que termina
+con una artificial básica positiva se informa como INFACTIBLE.
+Las reglas de elección son las mismas que en Simplex.py (Dantzig y primera fila
+de razón mínima), por lo que cada problema recorre los mismos pivotes que con
+resolver_simplex.
+"""
+
+import numpy as np
+
+from .Revised import TOL_PIVOTE, base_identidad
+from .Simplex import construir_tabla_big_m
+
+OPTIMO = "optimo"
+NO_ACOTADO = "no_acotado"
+INFACTIBLE = "infactible"
+LIMITE_ITERACIONES = "limite_iteraciones"
+# Valor mínimo de una artificial básica para declarar infactible (como es_infactible_big_m)
+TOL_ARTIFICIAL = 1e-8
+
+
+def crear_tablas(c, A, b):
+    """Pila de tablas iniciales para max c_k^T x, A_k x <= b_k, x >= 0.
+    c: K x n, A: K x m x n, b: K x m (c o b de una sola fila se repiten)."""
+    A = np.asarray(A, dtype=float)
+    K, m, n = A.shape
+    c = np.broadcast_to(np.asarray(c, dtype=float), (K, n))
+    b = np.broadcast_to(np.asarray(b, dtype=float), (K, m))
+    tablas = np.zeros((K, m + 1, n + m + 1))
+    tablas[:, :m, :n] = A
+    tablas[:, np.arange(m), n + np.arange(m)] = 1.0  # variables de holgura
+    tablas[:, :m, -1] = b
+    tablas[:, -1, :n] = -c
+    return tablas
+
+
+def pivotear_lote(tablas, filas, columnas, trabajo=None):
+    """Pivotea en el lugar la tabla k de la pila en (filas[k], columnas[k]),
+    con la misma actualización de rango 1 que Simplex.pivotear."""
+    K = len(tablas)
+    k = np.arange(K)
+    fila = tablas[k, filas]  # copia: K x columnas
+    fila /= fila[k, columnas][:, None]
+    factores = tablas[k, :, columnas]  # K x (m+1)
+    if trabajo is None:
+        trabajo = np.empty_like(tablas)
+    np.multiply(factores[:, :, None], fila[:, None, :], out=trabajo)
+    tablas -= trabajo
+    tablas[k, filas] = fila
+
+
+def _extraer_soluciones(tablas, num_vars, bases):
+    """Versión vectorizada de Simplex.extraer_solucion para toda la pila: el valor
+    de cada variable básica se lee del LD de su fila en `bases` (K x m)."""
+    solucion = np.zeros((len(tablas), num_vars))
+    k, filas = np.nonzero(bases < num_vars)
+    solucion[k, bases[k, filas]] = tablas[k, filas, -1]
+    return solucion
+
+
+def resolver_simplex_lote_desde_tablas(tablas, num_vars, max_iteraciones=None, bases=None,
+                                       artificiales=None):
+    """Itera el simplex sobre una pila de tablas iniciales (K x (m+1) x columnas).
+    bases: columnas básicas iniciales (K x m, o m si son las mismas para todas);
+    si no se dan, se detectan en cada tabla (ver Revised.base_identidad).
+    artificiales: índices de las columnas artificiales de Big M (las mismas en
+    todas las tablas); una tabla óptima con alguna de ellas básica y positiva
+    queda INFACTIBLE. Sin ellas no se puede distinguir un Big M infactible de un
+    óptimo, así que las pilas de Big M deben darlas.
+
+    Devuelve un diccionario con arreglos de longitud K:
+    estado (OPTIMO, NO_ACOTADO, INFACTIBLE o LIMITE_ITERACIONES), solucion (K x num_vars),
+    valor (LD de la fila Z), iteraciones (pivotes de cada problema), bases
+    (K x m, la columna básica de cada fila al terminar) y tablas (la pila final;
+    las tablas no acotadas quedan en el último pivote aplicado).
+    """
+    tablas = np.array(tablas, dtype=float)
+    K = len(tablas)
+    if bases is None:
+        bases = np.array([base_identidad(tabla) for tabla in tablas], dtype=int).reshape(K, -1)
+    else:
+        bases = np.array(np.broadcast_to(bases, (K, tablas.shape[1] - 1)), dtype=int)
+    estado = np.full(K, OPTIMO, dtype=object)
+    iteraciones = np.zeros(K, dtype=int)
+
+    activos = np.arange(K)           # índice original de cada tabla de trabajo
+    trabajo_tablas = tablas
+    trabajo = np.empty_like(trabajo_tablas)
+    iteracion = 0
+    while len(activos):
+        if max_iteraciones is not None and iteracion >= max_iteraciones:
+            estado[activos] = LIMITE_ITERACIONES
+            break
+        fila_z = trabajo_tablas[:, -1, :-1]
+        columnas = np.argmin(fila_z, axis=1)
+        k = np.arange(len(activos))
+        continuar = fila_z[k, columnas] < -TOL_PIVOTE
+
+        # Prueba de razón mínima para todas las tablas a la vez
+        columna = trabajo_tablas[k, :-1, columnas]  # K x m
+        rhs = trabajo_tablas[:, :-1, -1]
+        positivos = columna > TOL_PIVOTE
+        razones = np.divide(rhs, columna, out=np.full_like(rhs, np.inf), where=positivos)
+        filas = np.argmin(razones, axis=1)
+        no_acotado = continuar & ~positivos.any(axis=1)
+        estado[activos[no_acotado]] = NO_ACOTADO
+        continuar &= ~no_acotado
+
+        # Retirar de la pila de trabajo las tablas que terminaron
+        if not continuar.all():
+            tablas[activos] = trabajo_tablas
+            activos, columnas, filas = activos[continuar], columnas[continuar], filas[continuar]
+            if not len(activos):
+                break
+            trabajo_tablas = trabajo_tablas[continuar]
+            trabajo = trabajo[:len(activos)]
+
+        pivotear_lote(trabajo_tablas, filas, columnas, trabajo)
+        bases[activos, filas] = columnas
+        iteraciones[activos] += 1
+        iteracion += 1
+    if len(activos):
+        tablas[activos] = trabajo_tablas
+
+    if artificiales is not None and len(artificiales):
+        es_artificial = np.zeros(tablas.shape[2] - 1, dtype=bool)
+        es_artificial[np.asarray(artificiales, dtype=int)] = True
+        positivas = es_artificial[bases] & (tablas[:, :-1, -1] > TOL_ARTIFICIAL)
+        estado[(estado == OPTIMO) & positivas.any(axis=1)] = INFACTIBLE
+
+    optimos = estado == OPTIMO
+    solucion = _extraer_soluciones(tablas, num_vars, bases)
+    valor = tablas[:, -1, -1].copy()
+    solucion[~optimos] = np.nan
+    valor[~optimos] = np.nan
+    return {
+        "estado": estado,
+        "solucion": solucion,
+        "valor": valor,
+        "iteraciones": iteraciones,
+        "bases": bases,
+        "tablas": tablas,
+    }
+
+
+def resolver_simplex_lote(c, A, b, max_iteraciones=None):
+    """Resuelve K problemas max c_k^T x, A_k x <= b_k, x >= 0 de la misma forma
+    (ver crear_tablas y resolver_simplex_lote_desde_tablas)."""
+    A = np.asarray(A, dtype=float)
+    _, m, n = A.shape
+    return resolver_simplex_lote_desde_tablas(crear_tablas(c, A, b), n, max_iteraciones,
+                                              np.arange(n, n + m))
+
+
+def resolver_big_m_lote(c, A, b, ops, M=1e6, max_iteraciones=None):
+    """Resuelve K problemas max c_k^T x, A_k x (ops) b_k, x >= 0 con Big M sobre
+    una pila de tablas de construir_tabla_big_m. ops es común a todos los
+    problemas y los signos de b deben coincidir entre ellos, para que las tablas
+    tengan las mismas columnas de holgura, exceso y artificiales. Los problemas
+    infactibles quedan con estado INFACTIBLE."""
+    A = np.asarray(A, dtype=float)
+    K, m, n = A.shape
+    c = np.broadcast_to(np.asarray(c, dtype=float), (K, n))
+    b = np.broadcast_to(np.asarray(b, dtype=float), (K, m))
+    if K and ((b < 0) != (b[0] < 0)).any():
+        raise ValueError("Los lados derechos deben tener el mismo signo en todos los problemas.")
+    tablas = col_names = None
+    for k in range(K):
+        tabla, col_names = construir_tabla_big_m(c[k], A[k], b[k], ops, M)
+        if tablas is None:
+            tablas = np.empty((K,) + tabla.shape)
+        tablas[k] = tabla
+    if tablas is None:
+        raise ValueError("La pila de problemas está vacía.")
+    artificiales = [j for j, nombre in enumerate(col_names[:-1]) if nombre.startswith("a")]
+    return resolver_simplex_lote_desde_tablas(tablas, n, max_iteraciones, artificiales=artificiales)
@@ -1,15 +1,21 @@
-import questionary
-from rich.console import Console
-from rich.table import Table
-from copy import deepcopy
-from pyfiglet import Figlet
-from .Simplex import construir_tabla_big_m
+import time
+from fractions import Fraction
+
+import numpy as np
+from .Simplex import DEGENERADOS_MAX, construir_tabla_big_m, pivotear
+from .Exact import M_EXACTA, TablaExacta, construir_tabla_big_m_exacta
+from .Revised import base_identidad
+from .errors import LimiteAlcanzado, ProblemaNoAcotado
+from .modelo import ProgramaLineal, Resultado, calcular_duales
 from .table_display import fmt_num
-
-console = Console()
+from .consola import banner, console
 
 # Función para imprimir una tabla simplex y esperar a que el usuario presione enter
+# (devuelve los segundos que tardó en dibujarla, sin contar la espera)
 def print_table(headers, rows, title="Tabla Simplex"):
+    from rich.table import Table
+
+    inicio = time.perf_counter()
     table = Table(title=title)
 
     # Primera columna fija: "VB" (Variable Básica)
@@ -33,9 +39,11 @@ def print_table(headers, rows, title="Tabla Simplex"):
     console.print("a: artificial")
     console.print("e: exceso")
     console.print("s: holgura")
+    tiempo = time.perf_counter() - inicio
 
     console.print("[dim]Presione ENTER para continuar...[/dim]")
     input()
+    return tiempo
 
 # Formateador opcional para mostrar términos con M (solo visual)
 def fmt_with_M(value, M=1e6, ndigits=4):
@@ -44,8 +52,12 @@ def fmt_with_M(value, M=1e6, ndigits=4):
             return fmt_num(value, ndigits)
         k = round(value / M)
         remainder = value - k * M
-        # Si es prácticamente múltiplo de M
-        if abs(remainder) < max(1e-8 * max(1.0, abs(value)), 1e-6):
+        # Si es prácticamente múltiplo de M (exactamente, con Fraction)
+        if isinstance(value, Fraction):
+            multiplo_de_M = remainder == 0
+        else:
+            multiplo_de_M = abs(remainder) < max(1e-8 * max(1.0, abs(value)), 1e-6)
+        if multiplo_de_M:
             if k == 0:
                 return "0"
             if k == 1:
@@ -72,6 +84,8 @@ def fmt_with_M(value, M=1e6, ndigits=4):
 
 # Formateador que muestra enteros sin decimales y decimales con 4 dígitos; clamp a 0 cercano
 def fmt_intsmart(x, ndigits=4, eps=5e-5):
+    if isinstance(x, Fraction):
+        return str(x)
     try:
         if abs(x) < eps:
             return f"{0}"
@@ -83,7 +97,8 @@ def fmt_intsmart(x, ndigits=4, eps=5e-5):
         return f"{x}"
 
 # Función para encontrar la columna pivote (máximo coeficiente negativo en Z, para maximización)
-def find_pivot_column(tableau, var_names, is_maximize):
+# Con bland=True se usa la regla de Bland (primera columna que mejora) para evitar ciclos.
+def find_pivot_column(tableau, var_names, is_maximize, bland=False):
     z_row = tableau[0][:-1]
     candidates = []
 
@@ -96,6 +111,12 @@ def find_pivot_column(tableau, var_names, is_maximize):
     if not candidates:
         return -1
 
+    if bland:
+        for val, col in candidates:
+            if (val < -1e-8) if is_maximize else (val > 1e-8):
+                return col
+        return -1
+
     if is_maximize:
         min_val, min_col = min(candidates, key=lambda x: x[0])
         if min_val >= -1e-8:
@@ -187,7 +208,9 @@ def format_expression(coeficientes, n_vars, is_objective=False):
     return ' '.join(partes)
 
 # Función para encontrar la fila pivote (mínima razón no negativa)
-def find_pivot_row(tableau, pivot_col):
+# basic_idx: índice de columna de la variable básica de cada fila; si se da, los
+# empates se resuelven por el menor índice (regla de Bland).
+def find_pivot_row(tableau, pivot_col, basic_idx=None):
     ratios = []
     for i in range(1, len(tableau)):
         if tableau[i][pivot_col] > 0:
@@ -198,27 +221,116 @@ def find_pivot_row(tableau, pivot_col):
     if not ratios or all(r[0] == float('inf') for r in ratios):
         return -1  # Problema no acotado
     min_ratio = min(ratios, key=lambda x: x[0])
+    if basic_idx is not None:
+        ties = [i for ratio, i in ratios if ratio <= min_ratio[0] + 1e-9]
+        return min(ties, key=lambda i: basic_idx[i - 1])
     return min_ratio[1]
 
-# Función para realizar la operación de pivoteo
-def pivot(tableau, pivot_row, pivot_col):
-    # Hacer 1 el elemento pivote
-    divisor = tableau[pivot_row][pivot_col]
-    for j in range(len(tableau[pivot_row])):
-        tableau[pivot_row][j] /= divisor
+def preparar_big_m(programa, exacto=False):
+    """
+    Tabla del ciclo de big_m(): la de construir_tabla_big_m (o la exacta de
+    Methods/Exact.py) con la fila Z movida al inicio. Devuelve (tableau, var_names,
+    base, M), con base el índice de la columna básica de cada fila de restricción
+    (detectada una sola vez en la tabla inicial).
+    """
+    # construir_tabla_big_m asume maximización: se usa -c si se minimiza
+    coef_obj = programa.costos_max()
+    if exacto:
+        # Tabla de enteros con denominador común (Methods/Exact.py); se lee como Fraction
+        M = M_EXACTA
+        tabla_np, col_names = construir_tabla_big_m_exacta(coef_obj, programa.A, programa.b, programa.ops, M=M)
+    else:
+        M = 1e6
+        tabla_np, col_names = construir_tabla_big_m(coef_obj, programa.A, programa.b, programa.ops, M=M)
+
+    base = base_identidad(tabla_np)
+
+    # Mover la fila Z (última) al inicio para nuestro ciclo de pivoteo (sin pasar a listas)
+    tableau = np.vstack((tabla_np[-1:], tabla_np[:-1]))
+    if exacto:
+        tableau = TablaExacta(tableau)
+
+    # Nombres de variables de columnas (sin el término independiente LD/R)
+    var_names = col_names[:-1]
+    return tableau, var_names, base, M
+
+
+def iterar_big_m(tableau, var_names, base, max_iteraciones=None, tiempo_limite=None,
+                 al_iterar=None):
+    """
+    Ciclo de pivoteo de big_m() sin mostrar nada, sobre la tabla de preparar_big_m.
+    Generador: antes de cada pivoteo produce (iteracion, pivot_col, pivot_row) para
+    que se pueda mostrar la tabla con el pivote resaltado; al pedir el siguiente
+    paso pivotea y actualiza base (columna básica de cada fila) en el lugar. Termina en el óptimo y lanza
+    ProblemaNoAcotado si la columna entrante no tiene razón finita. Tras
+    DEGENERADOS_MAX pivoteos seguidos sin cambio en Z usa la regla de Bland, de
+    modo que no cicla.
+    max_iteraciones / tiempo_limite (segundos desde el inicio, como en
+    Simplex.iterar_simplex): si se alcanzan antes del óptimo se lanza
+    LimiteAlcanzado; la tabla queda en la última solución básica.
+    al_iterar(evento) se llama tras cada pivoteo con las claves de los registros
+    de Simplex.iterar_simplex, sin tabla ni base (fila_pivote sin contar la fila Z).
+    """
+    trabajo = None if isinstance(tableau, TablaExacta) else np.empty_like(tableau)
+    inicio = time.perf_counter()
+    iteracion = 1
+    degenerados = 0  # pivoteos seguidos sin cambio en Z; al acumularse se usa Bland
+    while True:
+        # Encontrar columna pivote en el estado ACTUAL de la tabla (antes de pivotear)
+        t_inicio = time.perf_counter()
+        bland = degenerados >= DEGENERADOS_MAX
+        pivot_col = find_pivot_column(tableau, var_names, True, bland)
+        t_pricing = time.perf_counter()
+        if pivot_col == -1:
+            return
+        if max_iteraciones is not None and iteracion > max_iteraciones:
+            raise LimiteAlcanzado("limite_iteraciones")
+        if tiempo_limite is not None and time.perf_counter() - inicio > tiempo_limite:
+            raise LimiteAlcanzado("limite_tiempo")
+
+        # Encontrar fila pivote (con Bland, los empates por menor índice básico)
+        pivot_row = find_pivot_row(tableau, pivot_col, base if bland else None)
+        if pivot_row == -1:
+            raise ProblemaNoAcotado("Problema no acotado")
+        t_razon = time.perf_counter()
+
+        yield iteracion, pivot_col, pivot_row
+
+        # Aplicar el pivote y actualizar la base
+        t_pivoteo = time.perf_counter()
+        valor_pivote = tableau[pivot_row][pivot_col]
+        base[pivot_row - 1] = pivot_col
+        z_anterior = tableau[0][-1]
+        if trabajo is None:
+            tableau.pivotear(pivot_row, pivot_col)
+        else:
+            pivotear(tableau, pivot_row, pivot_col, trabajo)
+        degenerado = abs(tableau[0][-1] - z_anterior) <= 1e-9 * (1 + abs(z_anterior))
+        degenerados = degenerados + 1 if degenerado else 0
+        if al_iterar is not None:
+            al_iterar({
+                "iteracion": iteracion,
+                "col_pivote": pivot_col,
+                "fila_pivote": pivot_row - 1,
+                "valor_pivote": valor_pivote,
+                "objetivo": tableau[0][-1],
+                "tiempos": {
+                    "pricing": t_pricing - t_inicio,
+                    "razon": t_razon - t_pricing,
+                    "pivoteo": time.perf_counter() - t_pivoteo,
+                },
+                "degenerado": degenerado,
+            })
+        iteracion += 1
 
-    # Hacer 0 los demás elementos de la columna pivote
-    for i in range(len(tableau)):
-        if i != pivot_row:
-            factor = tableau[i][pivot_col]
-            for j in range(len(tableau[i])):
-                tableau[i][j] -= factor * tableau[pivot_row][j]
 
 # Función principal del método Big M
-def big_m():
+# max_iteraciones / tiempo_limite: límites del ciclo de pivoteo (ver iterar_big_m)
+def big_m(al_iterar=None, max_iteraciones=500, tiempo_limite=None):
+    import questionary
+
     console.clear()
-    f = Figlet(font='big')
-    console.print(f.renderText('Metodo Big M'), style="bold blue")
+    console.print(banner('Metodo Big M'), style="bold blue")
     console.print("[bold green]🚀 Método Big M para Programación Lineal[/bold green]\n")
 
     # Preguntar objetivo
@@ -233,28 +345,24 @@ def big_m():
     n_vars = int(questionary.text("Número de variables de decisión:").ask())
 
     # Coeficientes de la función objetivo
-    coef_obj = []
-    coef_obj_original = []
+    coef_obj_original = np.empty(n_vars)
     for i in range(n_vars):
-        coef = float(questionary.text(f"Coeficiente de x{i+1} en Z:").ask())
-        coef_obj_original.append(coef) 
-        coef_obj.append(coef if is_maximize else -coef)  # Convertimos si es minimizar
+        coef_obj_original[i] = float(questionary.text(f"Coeficiente de x{i+1} en Z:").ask())
     
     console.print(f"[bold green]→ {'Maximizar' if is_maximize else 'Minimizar'} Z = {format_expression(coef_obj_original, n_vars, is_objective=True)}[/bold green] \n")
 
     # Número de restricciones
     n_restricciones = int(questionary.text("Número de restricciones:").ask())
 
-    restricciones = []
-    tipos = []
-    r = []
+    restricciones = np.empty((n_restricciones, n_vars))
+    tipos = np.empty(n_restricciones, dtype="<U1")
+    r = np.empty(n_restricciones)
 
     for i in range(n_restricciones):
         console.print(f"\n[bold]Restricción {i+1}[/bold]")
-        coef_restriccion = []
+        coef_restriccion = restricciones[i]
         for j in range(n_vars):
-            c = float(questionary.text(f"Coeficiente de x{j+1}:").ask())
-            coef_restriccion.append(c)
+            coef_restriccion[j] = float(questionary.text(f"Coeficiente de x{j+1}:").ask())
         tipo = questionary.select(
             "Tipo de restricción:",
             choices=["≤", "≥", "="]
@@ -264,9 +372,8 @@ def big_m():
         restriccion_str = format_restriccion(coef_restriccion, tipo, b, n_vars)
         console.print(f"[green]→ {restriccion_str}[/green]")
 
-        restricciones.append(coef_restriccion)
-        tipos.append(tipo)
-        r.append(b)
+        tipos[i] = tipo
+        r[i] = b
 
     # MOSTRAR RESUMEN DEL PROBLEMA
     console.print("\n" + "═" * 60)
@@ -285,34 +392,15 @@ def big_m():
     
     console.print("═" * 60 + "\n")
 
-    # Construcción del tableau usando la implementación validada en Simplex.py
-    # Mapear operadores unicode a ASCII requeridos por construir_tabla_big_m
-    op_map = {"≤": "<=", "≥": ">=", "=": "="}
-    ops_ascii = [op_map[t] for t in tipos]
+    exacto = questionary.confirm("¿Usar aritmética exacta (fracciones)?", default=False).ask()
 
-    # construir_tabla_big_m asume maximización; ya ajustamos coef_obj para minimizar si aplica
-    M = 1e6
-    tabla_np, col_names = construir_tabla_big_m(coef_obj, restricciones, r, ops_ascii, M=M)
-
-    # Convertir a listas y mover la fila Z (última) al inicio para nuestro ciclo de pivoteo
-    tabla_list = tabla_np.tolist()
-    tableau = [tabla_list[-1]] + tabla_list[:-1]
-
-    # Nombres de variables de columnas (sin el término independiente LD/R)
-    var_names = col_names[:-1]
+    # Construcción del tableau usando la implementación validada en Simplex.py
+    # (ProgramaLineal pasa los operadores unicode a '<=', '>=' y '=')
+    programa = ProgramaLineal(coef_obj_original, restricciones, r, tipos, objetivo)
 
-    # Detectar variables básicas automáticamente por columna identidad en las filas de restricciones
+    tableau, var_names, base, M = preparar_big_m(programa, exacto)
     num_rows = len(tableau) - 1  # sin la fila Z
     num_cols = len(var_names)
-    basic_vars = []
-    for r_idx in range(1, num_rows + 1):
-        vb = ""
-        for c_idx in range(num_cols):
-            col_vec = [tableau[row][c_idx] for row in range(1, num_rows + 1)]
-            if col_vec.count(0.0) == num_rows - 1 and abs(col_vec[r_idx - 1] - 1.0) < 1e-8:
-                vb = var_names[c_idx]
-                break
-        basic_vars.append(vb if vb else f"fila{r_idx}")
 
     # Construir mapeo de nombres para variables agregadas en el orden de las restricciones:
     # Por cada fila de restricción i, si hay holgura (h*) con coef 1 o exceso (e*) con coef -1,
@@ -372,7 +460,7 @@ def big_m():
     disp_pivot_col0 = display_cols.index(pivot_col0) if pivot_col0 != -1 and pivot_col0 in display_cols else -1
 
     for i in range(1, len(tableau)):
-        vb_disp = map_var(basic_vars[i-1])
+        vb_disp = map_var(var_names[base[i-1]])
         row_vals = []
         for k, j in enumerate(display_cols):
             val_str = fmt_intsmart(tableau[i][j])
@@ -386,87 +474,97 @@ def big_m():
     rows.append(["Z"] + z_vals)
     print_table(headers, rows, "Tabla Inicial")
 
-    iteracion = 1
-    while True:
-        # Encontrar columna pivote en el estado ACTUAL de la tabla (antes de pivotear)
-        pivot_col = find_pivot_column(tableau, var_names, True)
-        if pivot_col == -1:
-            # Mostrar tabla final sin resaltar pivote y con el LD de Z resaltado
+    # Con al_iterar, cada evento lleva además el tiempo de mostrar la tabla de esa iteración
+    tiempos_dibujo = []
+
+    def al_pivotear(evento):
+        evento["tiempos"]["dibujo"] = tiempos_dibujo.pop() if tiempos_dibujo else 0.0
+        al_iterar(evento)
+
+    pivoteos = 0
+    try:
+        for iteracion, pivot_col, pivot_row in iterar_big_m(tableau, var_names, base,
+                                                            max_iteraciones, tiempo_limite,
+                                                            al_iterar=al_pivotear if al_iterar else None):
+            inicio = time.perf_counter()
+            # Variables entrante/saliente (con nombres visuales)
+            entering_var = var_names[pivot_col]
+            leaving_var = var_names[base[pivot_row - 1]]
+
+            console.print(f"\n[bold yellow]Iteración {iteracion}[/bold yellow]")
+            # Mostrar SOLO el valor del elemento pivote como pediste
+            pivot_val_disp = fmt_intsmart(tableau[pivot_row][pivot_col])
+            console.print(f"Variable entrante: {map_var(entering_var)}, Variable saliente: {map_var(leaving_var)}, Elemento pivote: ({pivot_val_disp})")
+
+            # Mostrar tabla actual destacando el pivote (ANTES de pivotear)
             rows = []
+            disp_pivot_col = display_cols.index(pivot_col) if pivot_col in display_cols else -1
             for i in range(1, len(tableau)):
-                vb_disp = map_var(basic_vars[i-1])
-                row_vals = [fmt_intsmart(tableau[i][j]) for j in display_cols] + [fmt_intsmart(tableau[i][-1])]
+                vb_disp = map_var(var_names[base[i-1]])
+                row_vals = []
+                for k, j in enumerate(display_cols):
+                    val_str = fmt_intsmart(tableau[i][j])
+                    if i == pivot_row and k == disp_pivot_col:
+                        val_str = f"[black on bright_yellow]{val_str}[/]"
+                    row_vals.append(val_str)
+                row_vals.append(fmt_intsmart(tableau[i][-1]))
                 rows.append([vb_disp] + row_vals)
             z_display = tableau[0][:]
             if not is_maximize:
                 z_display = [-v for v in z_display]
             z_vals = [fmt_with_M(z_display[j], M) for j in display_cols] + [fmt_with_M(z_display[-1], M)]
-            # Resaltar valor óptimo en LD
-            z_vals[-1] = f"[black on bright_cyan]{z_vals[-1]}[/]"
-            console.print(f"\n[bold yellow]Iteración FINAL[/bold yellow]")
-            print_table([map_var(var_names[j]) for j in display_cols] + ["R"], rows + [["Z"] + z_vals], "FINAL")
-            console.print("\n[green bold]✅ ¡Solución óptima encontrada![/green bold]")
-            break
-
-        # Encontrar fila pivote
-        pivot_row = find_pivot_row(tableau, pivot_col)
-        if pivot_row == -1:
-            console.print("\n[red bold]❌ Problema no acotado[/red bold]")
-            return
-
-        # Variables entrante/saliente (con nombres visuales)
-        entering_var = var_names[pivot_col]
-        leaving_var = basic_vars[pivot_row - 1]
-
-        console.print(f"\n[bold yellow]Iteración {iteracion}[/bold yellow]")
-        # Mostrar SOLO el valor del elemento pivote como pediste
-        pivot_val_disp = fmt_intsmart(tableau[pivot_row][pivot_col])
-        console.print(f"Variable entrante: {map_var(entering_var)}, Variable saliente: {map_var(leaving_var)}, Elemento pivote: ({pivot_val_disp})")
-
-        # Mostrar tabla actual destacando el pivote (ANTES de pivotear)
-        rows = []
-        disp_pivot_col = display_cols.index(pivot_col) if pivot_col in display_cols else -1
-        for i in range(1, len(tableau)):
-            vb_disp = map_var(basic_vars[i-1])
-            row_vals = []
-            for k, j in enumerate(display_cols):
-                val_str = fmt_intsmart(tableau[i][j])
-                if i == pivot_row and k == disp_pivot_col:
-                    val_str = f"[black on bright_yellow]{val_str}[/]"
-                row_vals.append(val_str)
-            row_vals.append(fmt_intsmart(tableau[i][-1]))
-            rows.append([vb_disp] + row_vals)
-        z_display = tableau[0][:]
-        if not is_maximize:
-            z_display = [-v for v in z_display]
-        z_vals = [fmt_with_M(z_display[j], M) for j in display_cols] + [fmt_with_M(z_display[-1], M)]
-        rows.append(["Z"] + z_vals)
-        print_table(headers, rows, f"Iteración {iteracion}")
-
-        # Ahora sí, aplicar el pivote y actualizar la base
-        basic_vars[pivot_row - 1] = entering_var
-        pivot(tableau, pivot_row, pivot_col)
+            rows.append(["Z"] + z_vals)
+            armado = time.perf_counter() - inicio
+            tiempos_dibujo.append(armado + print_table(headers, rows, f"Iteración {iteracion}"))
+            # Al pedir la siguiente iteración, iterar_big_m aplica el pivote y actualiza la base
+            pivoteos = iteracion
+    except LimiteAlcanzado as e:
+        limite = (f"{max_iteraciones} iteraciones" if e.estado == "limite_iteraciones"
+                  else f"{tiempo_limite} segundos")
+        console.print(f"\n[red bold]⚠️  Se alcanzó el límite de {limite} sin llegar al óptimo.[/red bold]")
+        return Resultado(e.estado, iteraciones=pivoteos)
+    except ProblemaNoAcotado:
+        console.print("\n[red bold]❌ Problema no acotado[/red bold]")
+        return Resultado("no_acotado", iteraciones=pivoteos)
+
+    # Mostrar tabla final sin resaltar pivote y con el LD de Z resaltado
+    rows = []
+    for i in range(1, len(tableau)):
+        vb_disp = map_var(var_names[base[i-1]])
+        row_vals = [fmt_intsmart(tableau[i][j]) for j in display_cols] + [fmt_intsmart(tableau[i][-1])]
+        rows.append([vb_disp] + row_vals)
+    z_display = tableau[0][:]
+    if not is_maximize:
+        z_display = [-v for v in z_display]
+    z_vals = [fmt_with_M(z_display[j], M) for j in display_cols] + [fmt_with_M(z_display[-1], M)]
+    # Resaltar valor óptimo en LD
+    z_vals[-1] = f"[black on bright_cyan]{z_vals[-1]}[/]"
+    console.print(f"\n[bold yellow]Iteración FINAL[/bold yellow]")
+    print_table([map_var(var_names[j]) for j in display_cols] + ["R"], rows + [["Z"] + z_vals], "FINAL")
+    console.print("\n[green bold]✅ ¡Solución óptima encontrada![/green bold]")
 
-        iteracion += 1
-        
     # Mostrar solución
     # Verificar si hay variables artificiales en la solución final con valor > 0 (infactibilidad)
-    for i, bv in enumerate(basic_vars):
-        if bv.startswith('a') and abs(tableau[i+1][-1]) > 1e-5:
+    for i, col in enumerate(base):
+        if var_names[col].startswith('a') and abs(tableau[i+1][-1]) > 1e-5:
             console.print("\n[red bold]❌ SOLUCIÓN INFACTIBLE: Variable artificial en base con valor positivo.[/red bold]")
-            return
+            return Resultado("infactible", iteraciones=pivoteos)
 
     console.print("\n[bold green]📈 SOLUCIÓN ÓPTIMA[/bold green]")
     solution = {var: 0.0 for var in var_names}
-    for i in range(len(basic_vars)):
-        solution[basic_vars[i]] = tableau[i+1][-1]
+    for i, col in enumerate(base):
+        solution[var_names[col]] = tableau[i+1][-1]
+
+    duales = calcular_duales(programa.costos_max(), programa.A, programa.b, programa.ops, base)
+    resultado = Resultado("optimo", [solution[var] for var in var_names[:n_vars]],
+                          tableau[0][-1] if is_maximize else -tableau[0][-1], base,
+                          duales if is_maximize else -duales, pivoteos)
 
     console.print("Valores de las variables:")
-    for var in var_names[:n_vars]:  # Solo variables de decisión originales
-        console.print(f"  {var} = {fmt_num(solution[var])}")
+    for var, valor in zip(var_names[:n_vars], resultado.x):  # Solo variables de decisión originales
+        console.print(f"  {var} = {fmt_num(valor)}")
 
-    optimal_value = tableau[0][-1] if is_maximize else -tableau[0][-1]
-    console.print(f"\n[bold]Valor óptimo de Z: {fmt_num(optimal_value)}[/bold]")
+    console.print(f"\n[bold]Valor óptimo de Z: {fmt_num(resultado.objetivo)}[/bold]")
     console.print("Presione ENTER para continuar...")
     input()
 
@@ -474,4 +572,5 @@ def big_m():
     for name in var_names:
         if isinstance(name, str) and name.startswith('a'):
             if solution.get(name, 0.0) > 1e-5:
-                console.print("[red]⚠️  ATENCIÓN: Variable artificial en solución final. El problema original es infactible.[/red]")
\ No newline at end of file
+                console.print("[red]⚠️  ATENCIÓN: Variable artificial en solución final. El problema original es infactible.[/red]")
+    return resultado
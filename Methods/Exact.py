@@ -0,0 +1,296 @@
+# Exact.py
+"""
+Modo exacto del método Simplex con aritmética racional sin fracciones.
+La tabla se guarda como una matriz de enteros de Python T con un denominador
+común d (la tabla verdadera es T / d) y se pivotea con la regla de Bareiss:
+
+    T'[i, j] = (p T[i, j] - T[i, k] T[r, j]) / d   para i != r,   d' = p
+
+donde p = T[r, k] es el pivote. La división es exacta (cada entrada es un
+menor de la matriz inicial), así que no se calcula ningún máximo común divisor
+por entrada y el tamaño de los enteros crece de forma controlada, a diferencia
+de una tabla de fractions.Fraction. Las entradas se convierten a Fraction solo
+al leerlas (para mostrarlas o extraer la solución).
+
+Los datos de entrada se convierten a racionales exactos; los float se toman por
+su representación decimal (0.1 -> 1/10).
+"""
+
+import math
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from .Simplex import DEGENERADOS_MAX, construir_tabla_big_m
+from .Revised import base_identidad
+from .pivot_log import HistorialPivotes
+from .sparse import como_dispersa, es_dispersa
+from .errors import LimiteAlcanzado, ProblemaNoAcotado
+
+M_EXACTA = 10**6  # el mismo M que construir_tabla_big_m, como entero
+
+
+def a_racional(valor):
+    """Convierte un número (int, float, Fraction, Decimal o texto 'a/b') a Fraction."""
+    if isinstance(valor, (float, np.floating)):
+        return Fraction(repr(float(valor)))
+    if isinstance(valor, np.integer):
+        return Fraction(int(valor))
+    return Fraction(valor)
+
+
+def tabla_racional(tabla):
+    """Matriz (arreglo de objetos) de Fraction a partir de cualquier tabla."""
+    filas = [[a_racional(v) for v in fila] for fila in tabla]
+    matriz = np.empty((len(filas), len(filas[0]) if filas else 0), dtype=object)
+    matriz[:] = filas
+    return matriz
+
+
+class TablaExacta:
+    """Tabla T / d con T entera. Se indexa como un arreglo y devuelve Fraction."""
+
+    def __init__(self, tabla, _enteros=None, _d=None):
+        if _enteros is not None:
+            self.enteros, self.d = _enteros, _d
+            return
+        fracciones = tabla if isinstance(tabla, np.ndarray) and tabla.dtype == object \
+            else tabla_racional(tabla)
+        # Escala de cada fila: mcm de sus denominadores. Con d = producto de las
+        # escalas, T = d * tabla es la matriz que dejaría Bareiss tras pivotear en
+        # las columnas básicas de la tabla inicial escalada, así que las divisiones
+        # de los pivoteos siguientes son exactas.
+        escalas = [math.lcm(*(f.denominator for f in fila)) if len(fila) else 1 for fila in fracciones]
+        self.d = math.prod(escalas)
+        self.enteros = np.empty(fracciones.shape, dtype=object)
+        for i, fila in enumerate(fracciones):
+            self.enteros[i] = [f.numerator * (self.d // f.denominator) for f in fila]
+
+    @property
+    def shape(self):
+        return self.enteros.shape
+
+    def __len__(self):
+        return len(self.enteros)
+
+    def __getitem__(self, clave):
+        valores = self.enteros[clave]
+        if isinstance(valores, np.ndarray):
+            fracciones = np.empty(valores.shape, dtype=object)
+            fracciones.flat = [Fraction(v, self.d) for v in valores.flat]
+            return fracciones
+        return Fraction(valores, self.d)
+
+    def __iter__(self):
+        for i in range(len(self.enteros)):
+            yield list(self[i])
+
+    def copy(self):
+        return TablaExacta(None, self.enteros.copy(), self.d)
+
+    def fracciones(self):
+        return self[:, :]
+
+    def a_flotantes(self):
+        return np.array([[v / self.d for v in fila] for fila in self.enteros], dtype=float)
+
+    def pivotear(self, fila_pivote, col_pivote):
+        """Pivoteo de Bareiss en el lugar (ver el docstring del módulo)."""
+        p = self.enteros[fila_pivote, col_pivote]
+        fila = self.enteros[fila_pivote].copy()
+        self.enteros = (p * self.enteros - np.outer(self.enteros[:, col_pivote], fila)) // self.d
+        self.enteros[fila_pivote] = fila
+        self.d = p
+
+
+class HistorialExacto(HistorialPivotes):
+    """HistorialPivotes sobre tablas exactas: historial[i] es una TablaExacta y
+    los valores pivote se guardan como Fraction."""
+
+    def registrar(self, col_pivote, fila_pivote, valor_pivote, tabla=None):
+        self.pivotes.append((int(col_pivote), int(fila_pivote), Fraction(valor_pivote)))
+        k = len(self.pivotes)
+        if tabla is not None and self.punto_control_cada and k % self.punto_control_cada == 0:
+            self.puntos_control[k] = tabla.copy()
+
+    def __iter__(self):
+        tabla = self.tabla_inicial.copy()
+        yield tabla.copy()
+        for k in range(len(self.pivotes)):
+            self._repetir(tabla, k, k + 1)
+            yield tabla.copy()
+
+    def _repetir(self, tabla, desde, hasta, trabajo=None):
+        for col_pivote, fila_pivote, _ in self.pivotes[desde:hasta]:
+            tabla.pivotear(fila_pivote, col_pivote)
+
+    def base(self):
+        if self.base_inicial is None:
+            self.base_inicial = base_identidad(self.tabla_inicial.a_flotantes())
+        return super().base()
+
+
+def crear_tabla_exacta(c, A, b):
+    """Versión exacta de Simplex.crear_tabla (misma disposición de columnas)."""
+    A = como_dispersa(A).toarray() if es_dispersa(A) else A
+    c, b = [a_racional(v) for v in c], [a_racional(v) for v in b]
+    m, n = len(b), len(c)
+    tabla = np.full((m + 1, n + m + 1), Fraction(0), dtype=object)
+    for i in range(m):
+        tabla[i, :n] = [a_racional(v) for v in A[i]]
+        tabla[i, n + i] = Fraction(1)
+        tabla[i, -1] = b[i]
+    tabla[-1, :n] = [-v for v in c]
+    return tabla
+
+
+def construir_tabla_big_m_exacta(c, A, b, ops, M=M_EXACTA):
+    """Versión exacta de Simplex.construir_tabla_big_m: mismas columnas y nombres,
+    con los datos y M como racionales. Devuelve (tabla de Fraction, nombres)."""
+    A = como_dispersa(A).toarray() if es_dispersa(A) else A
+    b = [a_racional(v) for v in b]
+    m, n = len(b), len(c)
+    # La estructura (holguras, excesos y artificiales con coeficientes 0 y ±1) se
+    # toma de la tabla en punto flotante, donde es exacta
+    signos = [-1.0 if v < 0 else 1.0 for v in b]
+    estructura, col_names = construir_tabla_big_m(np.zeros(n), np.zeros((m, n)), signos, ops, M=1.0)
+    tabla = tabla_racional(estructura)
+    M = a_racional(M)
+    for i in range(m):
+        signo = -1 if b[i] < 0 else 1
+        tabla[i, :n] = [signo * a_racional(v) for v in A[i]]
+        tabla[i, -1] = signo * b[i]
+    tabla[-1] = Fraction(0)
+    tabla[-1, :n] = [-a_racional(v) for v in c]
+    artificiales = [j for j, nombre in enumerate(col_names[:-1]) if nombre.startswith("a")]
+    tabla[-1, artificiales] = M
+    for j in artificiales:
+        fila = next(i for i in range(m) if tabla[i, j] == 1)
+        tabla[-1] -= M * tabla[fila]
+    return tabla, col_names
+
+
+def _fila_pivote_exacta(tabla, col_pivote, base=None):
+    """Razón mínima exacta; los empates se deciden por la menor fila o, si se da
+    `base`, por el menor índice de variable básica (regla de Bland)."""
+    T = tabla.enteros
+    mejor, mejor_razon = None, None
+    for i in range(len(T) - 1):
+        if T[i, col_pivote] > 0:
+            razon = Fraction(T[i, -1], T[i, col_pivote])
+            if mejor is None or razon < mejor_razon or (
+                    razon == mejor_razon and base is not None and base[i] < base[mejor]):
+                mejor, mejor_razon = i, razon
+    return mejor
+
+
+def iterar_simplex_exacto(tabla, con_tabla=False, max_iteraciones=None,
+                          degenerados_max=DEGENERADOS_MAX, base=None):
+    """
+    Generador equivalente a Simplex.iterar_simplex sobre una TablaExacta: pivotea
+    en el lugar y produce los mismos registros (valor_pivote y objetivo como
+    Fraction; tabla es la propia TablaExacta si con_tabla=True).
+    Usa Dantzig y, tras degenerados_max pivoteos seguidos sin mejorar el objetivo,
+    Bland (columna y desempate de la fila) hasta que el objetivo vuelva a mejorar;
+    con aritmética exacta eso basta para no ciclar.
+    """
+    base = np.array(base_identidad(tabla.a_flotantes()) if base is None else base, dtype=int)
+    vista_base = base.view()
+    vista_base.flags.writeable = False
+    degenerados = 0
+
+    def registro(iteracion, col_pivote=None, fila_pivote=None, valor_pivote=None, tiempos=None,
+                 degenerado=False):
+        return {
+            "iteracion": iteracion,
+            "col_pivote": col_pivote,
+            "fila_pivote": fila_pivote,
+            "valor_pivote": valor_pivote,
+            "objetivo": tabla[-1, -1],
+            "tabla": tabla if con_tabla else None,
+            "base": vista_base,
+            "tiempos": tiempos,
+            "degenerado": degenerado,
+        }
+
+    yield registro(0)
+    iteracion = 0
+    while True:
+        t_inicio = time.perf_counter()
+        fila_z = tabla.enteros[-1, :-1]
+        negativas = [j for j, v in enumerate(fila_z) if v < 0]
+        if not negativas:
+            return  # Solución óptima encontrada
+        if max_iteraciones is not None and iteracion >= max_iteraciones:
+            raise LimiteAlcanzado("limite_iteraciones")
+        bland = degenerados_max is not None and degenerados >= degenerados_max
+        col_pivote = negativas[0] if bland else min(negativas, key=lambda j: fila_z[j])
+        t_pricing = time.perf_counter()
+        fila_pivote = _fila_pivote_exacta(tabla, col_pivote, base if bland else None)
+        if fila_pivote is None:
+            raise ProblemaNoAcotado()
+        t_razon = time.perf_counter()
+
+        valor_pivote = tabla[fila_pivote, col_pivote]
+        objetivo_anterior = tabla[-1, -1]
+        tabla.pivotear(fila_pivote, col_pivote)
+        base[fila_pivote] = col_pivote
+        tiempos = {"pricing": t_pricing - t_inicio, "razon": t_razon - t_pricing,
+                   "pivoteo": time.perf_counter() - t_razon}
+        degenerado = tabla[-1, -1] == objetivo_anterior
+        degenerados = degenerados + 1 if degenerado else 0
+        iteracion += 1
+        yield registro(iteracion, col_pivote, fila_pivote, valor_pivote, tiempos, degenerado)
+
+
+def extraer_solucion_exacta(tabla, num_vars, base=None):
+    """Valores exactos (Fraction) de las primeras num_vars variables. Con `base`
+    (columna básica de cada fila) se leen directamente; si no, de las columnas
+    identidad de la tabla."""
+    if base is None:
+        base = base_identidad(tabla.a_flotantes())
+    solucion = [Fraction(0)] * num_vars
+    for fila, col in enumerate(base):
+        if col < num_vars:
+            solucion[col] = tabla[fila, -1]
+    return solucion
+
+
+def _resolver(tabla, base, num_vars, punto_control_cada, max_iteraciones):
+    iteraciones = HistorialExacto(tabla.copy(), punto_control_cada=punto_control_cada,
+                                  base_inicial=np.array(base))
+    try:
+        for paso in iterar_simplex_exacto(tabla, max_iteraciones=max_iteraciones, base=base):
+            if paso["col_pivote"] is not None:
+                iteraciones.registrar(paso["col_pivote"], paso["fila_pivote"], paso["valor_pivote"], tabla)
+    except LimiteAlcanzado as e:
+        iteraciones.estado = e.estado
+    iteraciones.final = tabla
+    return iteraciones, extraer_solucion_exacta(tabla, num_vars, iteraciones.base()), tabla[-1, -1]
+
+
+def resolver_simplex_exacto(c, A, b, punto_control_cada=0, max_iteraciones=None):
+    """
+    Simplex exacto para max c^T x, A x <= b, x >= 0 (b >= 0).
+    Devuelve (iteraciones, solucion_x, valor_optimo) como resolver_simplex, con
+    iteraciones como HistorialExacto y la solución y el valor como Fraction.
+    """
+    tabla = TablaExacta(crear_tabla_exacta(c, A, b))
+    m, n = len(b), len(c)
+    return _resolver(tabla, list(range(n, n + m)), n, punto_control_cada, max_iteraciones)
+
+
+def resolver_big_m_exacto(c, A, b, ops, M=M_EXACTA, punto_control_cada=0, max_iteraciones=None):
+    """
+    Big M exacto (max c^T x, restricciones '<=', '>=' y '=') sobre la tabla de
+    construir_tabla_big_m_exacta. Devuelve (iteraciones, solucion_x, valor_optimo,
+    factible); factible es False si alguna artificial queda básica con valor > 0.
+    """
+    fracciones, col_names = construir_tabla_big_m_exacta(c, A, b, ops, M)
+    tabla = TablaExacta(fracciones)
+    base = base_identidad(tabla.a_flotantes())
+    iteraciones, solucion, valor = _resolver(tabla, base, len(c), punto_control_cada, max_iteraciones)
+    factible = not any(col_names[col].startswith("a") and tabla[fila, -1] > 0
+                       for fila, col in enumerate(iteraciones.base()))
+    return iteraciones, solucion, valor, factible
@@ -1,12 +1,9 @@
 # metodo_grafico.py
 import numpy as np
-import matplotlib.pyplot as plt
-from shapely.geometry import LineString, Point
-import questionary
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from .geometria import optimizar, recortar_recta, region_factible
+from .modelo import ProgramaLineal, Resultado
+from .consola import console
 
 def validar_numero(x):
     """Valida que el input sea un número válido (entero o decimal, positivo o negativo)"""
@@ -20,11 +17,156 @@ def validar_entero_positivo(x):
     """Valida que el input sea un entero positivo"""
     return x.isdigit() and int(x) > 0
 
+def restricciones_de(programa):
+    """Restricciones (a1, a2, b, op) de un ProgramaLineal de 2 variables, con
+    x1 >= 0 y x2 >= 0 al final si el programa pide no negatividad."""
+    restricciones = list(zip(programa.A[:, 0], programa.A[:, 1], programa.b, programa.ops))
+    if programa.no_negatividad:
+        restricciones += [(1.0, 0.0, 0.0, '>='), (0.0, 1.0, 0.0, '>=')]
+    return restricciones
+
+def calcular_vertices(restricciones):
+    """Devuelve los vértices (x1, x2) de la región factible definida por
+    restricciones de la forma [a1, a2, b, op] con op en '<=', '>=', '=', en orden
+    a lo largo del borde (ver geometria.region_factible). Lista vacía si no hay
+    región factible o si no tiene vértices."""
+    region = region_factible(restricciones)
+    if region is None:
+        return []
+    return [tuple(v) for v in region.vertices.tolist()]
+
+def resolver_grafico(programa):
+    """Resuelve un ProgramaLineal de 2 variables (A densa) sin preguntas.
+    Devuelve (Resultado, región): el estado es 'optimo', 'infactible' (región
+    None) o 'no_acotado', y en ese caso informe["rayo"] es una dirección en la
+    que Z mejora sin límite (ver geometria.optimizar)."""
+    region = region_factible(restricciones_de(programa))
+    if region is None:
+        return Resultado("infactible"), None
+    estado, x, valor, rayo = optimizar(region, programa.costos_max())
+    if estado == "no_acotado":
+        return Resultado(estado, informe={"rayo": [float(v) for v in rayo]}), region
+    return Resultado(estado, x, -valor if programa.minimizar else valor), region
+
+def limites_grafico(restricciones, region):
+    """(x_min, x_max, y_min, y_max) del gráfico: los vértices con un margen del
+    10% (y el origen). Si la región no es acotada se agrega un tramo de cada lado
+    infinito (o de cada rayo, si no hay vértices) tan largo como la parte
+    acotada, para que se vea hacia dónde sigue. Sin región factible se usan los
+    cortes de las restricciones con los ejes."""
+    if region is not None:
+        puntos = list(region.vertices) or [region.punto]
+        largo = max(float(np.ptp(np.array(puntos), axis=0).max()), 1.0)
+        if len(region.vertices):
+            puntos += [origen + largo * direccion for origen, direccion in region.bordes]
+        else:
+            puntos += [region.punto + largo * rayo for rayo in region.rayos]
+        x_coords = [p[0] for p in puntos]
+        y_coords = [p[1] for p in puntos]
+    else:
+        x_coords = [b / a1 for a1, a2, b, op in restricciones if a1 != 0] or [10.0]
+        y_coords = [b / a2 for a1, a2, b, op in restricciones if a2 != 0] or [10.0]
+
+    margin = 0.1
+    x_min, x_max = min(x_coords), max(x_coords)
+    y_min, y_max = min(y_coords), max(y_coords)
+
+    x_range = x_max - x_min
+    y_range = y_max - y_min
+
+    x_min -= margin * x_range if x_range > 0 else 1
+    x_max += margin * x_range if x_range > 0 else 1
+    y_min -= margin * y_range if y_range > 0 else 1
+    y_max += margin * y_range if y_range > 0 else 1
+
+    # Asegurar que incluya el origen si es factible
+    if x_min > 0: x_min = 0
+    if y_min > 0: y_min = 0
+    return x_min, x_max, y_min, y_max
+
+def dibujar_region(ax, restricciones, region, optimo=None, z_optimo=None, leyenda="best", rayo=None):
+    """Dibuja en los ejes `ax` las rectas de las restricciones, los vértices, la
+    región factible (region de geometria.region_factible, o None si es vacía) y,
+    si se da, el punto óptimo (x1, x2) con su valor Z o, si el problema no es
+    acotado, el rayo en el que Z mejora. Cada recta se recorta de forma exacta
+    a la ventana del gráfico y la región se rellena con su intersección con
+    ella; los lados infinitos se marcan con flechas. No crea figuras ni las
+    muestra: sirve tanto para la ventana del menú como para los archivos de
+    Methods/render.py. leyenda es la ubicación de la leyenda ('best' la busca en
+    cada dibujo, lo que cuesta tanto como el resto del gráfico)."""
+    ventana = limites_grafico(restricciones, region)
+    x_min, x_max, y_min, y_max = ventana
+
+    # Establecer límites
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+
+    # Graficar líneas de restricción (solo el tramo dentro de la ventana)
+    colores = ['b', 'g', 'r', 'c', 'm', 'y', 'k']
+    for i, (a1, a2, b, op) in enumerate(restricciones):
+        tramo = recortar_recta(a1, a2, b, ventana)
+        if tramo is None:
+            continue
+        (x0, y0), (x1, y1) = tramo
+        ax.plot([x0, x1], [y0, y1], '-', linewidth=2, color=colores[i % len(colores)], label=f"R{i+1}")
+
+    largo = 0.15 * max(x_max - x_min, y_max - y_min)
+    if region is not None:
+        # Rellenar la región factible: su intersección exacta con la ventana
+        caja = [(1.0, 0.0, x_min, '>='), (1.0, 0.0, x_max, '<='),
+                (0.0, 1.0, y_min, '>='), (0.0, 1.0, y_max, '<=')]
+        visible = region_factible(list(restricciones) + caja)
+        if visible is not None and len(visible.vertices) >= 3:
+            ax.fill(visible.vertices[:, 0], visible.vertices[:, 1], color='lightblue', alpha=0.5,
+                    label='Región Factible')
+        elif visible is not None and len(visible.vertices) == 2:
+            ax.plot(visible.vertices[:, 0], visible.vertices[:, 1], '-', color='lightblue',
+                    linewidth=6, label='Región Factible')
+
+        # Borde entre vértices (cerrado si la región es acotada) y vértices
+        if len(region.vertices):
+            borde = region.vertices
+            if region.acotada and len(borde) >= 3:
+                borde = np.vstack((borde, borde[:1]))
+            ax.plot(borde[:, 0], borde[:, 1], 'b-', linewidth=2, alpha=0.8)
+            ax.plot(region.vertices[:, 0], region.vertices[:, 1], 'o', color='red', markersize=8)
+
+        # Lados infinitos: flechas en la dirección en que la región sigue
+        for origen, direccion in region.bordes:
+            ax.annotate('', xy=origen + largo * direccion, xytext=origen,
+                        arrowprops=dict(arrowstyle="->", color='blue', linewidth=2))
+
+    # Anotar la solución óptima
+    if optimo is not None:
+        x_optimo, y_optimo = optimo
+        ax.annotate(f'Óptimo ({x_optimo:.2f}, {y_optimo:.2f})\nZ={z_optimo:.2f}',
+                    xy=(x_optimo, y_optimo), xytext=(10, 10),
+                    textcoords='offset points', fontsize=10,
+                    bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7),
+                    arrowprops=dict(arrowstyle="->", color='black'))
+    elif rayo is not None and region is not None:
+        ax.annotate('Z mejora sin límite', xy=region.punto + 2 * largo * np.asarray(rayo),
+                    xytext=region.punto, fontsize=10, color='red',
+                    bbox=dict(boxstyle="round,pad=0.3", facecolor="mistyrose", alpha=0.7),
+                    arrowprops=dict(arrowstyle="-|>", color='red', linewidth=2))
+
+    ax.set_xlabel('X1')
+    ax.set_ylabel('X2')
+    ax.set_title('Método Gráfico - Región Factible y Solución Óptima')
+    ax.legend(loc=leyenda)
+    ax.grid(True, linestyle='--', alpha=0.7)
+
 def metodo_grafico():
+    # matplotlib y questionary solo se cargan al usar el método
+    import matplotlib.pyplot as plt
+    import questionary
+    from rich.table import Table
+
     console.clear()
     console.print("\n[bold blue]📊 MÉTODO GRÁFICO PARA PROGRAMACIÓN LINEAL[/bold blue]")
     console.print("Resuelve problemas de PL con 2 variables de decisión.\n")
 
+    resultado = None
     try:
         # 1. Solicitar tipo de optimización
         tipo_optimizacion = questionary.select(
@@ -34,11 +176,12 @@ def metodo_grafico():
 
         # 2. Solicitar coeficientes de la función objetivo Z = c1*x1 + c2*x2
         console.print(f"\n[bold yellow]🎯 FUNCIÓN OBJETIVO ({tipo_optimizacion.upper()})[/bold yellow]")
-        c1 = float(questionary.text(
+        c = np.empty(2)
+        c[0] = c1 = float(questionary.text(
             "Coeficiente de X1 (puede ser negativo, ej: -2.50):",
             validate=validar_numero
         ).ask())
-        c2 = float(questionary.text(
+        c[1] = c2 = float(questionary.text(
             "Coeficiente de X2 (puede ser negativo, ej: -2.50):",
             validate=validar_numero
         ).ask())
@@ -53,7 +196,9 @@ def metodo_grafico():
 
         # 4. Solicitar restricciones: a1*X1 + a2*X2 <= b
         console.print(f"\n[bold yellow]📏 RESTRICCIONES[/bold yellow]")
-        restricciones = []  # Lista para almacenar [a1, a2, b, 'operador']
+        A = np.empty((num_restricciones, 2))
+        b_vec = np.empty(num_restricciones)
+        ops = np.empty(num_restricciones, dtype="<U2")
 
         for i in range(num_restricciones):
             console.print(f"\n[bold]Restricción {i+1}:[/bold]")
@@ -74,7 +219,9 @@ def metodo_grafico():
                 validate=validar_numero
             ).ask())
 
-            restricciones.append([a1, a2, b, op])
+            A[i] = a1, a2
+            b_vec[i] = b
+            ops[i] = op
             console.print(f"Restricción {i+1}: {a1}X1 + {a2}X2 {op} {b}")
 
 
@@ -83,14 +230,20 @@ def metodo_grafico():
         agregar_x1_no_neg = questionary.confirm("¿Deseas agregar la restricción X1 >= 0 (No negatividad)?").ask()
         agregar_x2_no_neg = questionary.confirm("¿Deseas agregar la restricción X2 >= 0 (No negatividad)?").ask()
 
+        # Con ambas se usa la no negatividad del programa; con una sola se agrega como fila
+        no_negatividad = agregar_x1_no_neg and agregar_x2_no_neg
+        if agregar_x1_no_neg != agregar_x2_no_neg:
+            A = np.vstack((A, [1.0, 0.0] if agregar_x1_no_neg else [0.0, 1.0]))
+            b_vec = np.append(b_vec, 0.0)
+            ops = np.append(ops, '>=')
         if agregar_x1_no_neg:
-            restricciones.append([1, 0, 0, '>='])
             console.print("✅ Se agregó: X1 >= 0")
-
         if agregar_x2_no_neg:
-            restricciones.append([0, 1, 0, '>='])
             console.print("✅ Se agregó: X2 >= 0")
 
+        programa = ProgramaLineal(c, A, b_vec, ops, tipo_optimizacion, no_negatividad)
+        restricciones = restricciones_de(programa)
+
         console.print(f"\n[bold green]🚀 RESOLVIENDO PROBLEMA...[/bold green]")
         console.input("Presiona Enter para comenzar...")
 
@@ -119,129 +272,16 @@ def metodo_grafico():
         console.print(tabla_intersecciones)
         console.input("Presiona Enter para continuar...")
 
-        # 6. Preparar las líneas para graficar
-        rango_temp = 10000
-        x_min_temp, x_max_temp = -rango_temp/10, rango_temp  # Permitir un poco de negativo si se permite
-        y_min_temp, y_max_temp = -rango_temp/10, rango_temp
+        # 6-7. Región factible: vértices y direcciones en las que no es acotada
+        resultado, region = resolver_grafico(programa)
 
-        lineas = []
-        etiquetas = []
-
-        for i, (a1, a2, b, op) in enumerate(restricciones):
-            if a1 == 0 and a2 == 0:
-                continue
-
-            if a1 == 0:
-                x_vals_line = np.linspace(x_min_temp, x_max_temp, 100)
-                y_vals_line = np.full_like(x_vals_line, b / a2)
-            elif a2 == 0:
-                x_vals_line = np.full(100, b / a1)
-                y_vals_line = np.linspace(y_min_temp, y_max_temp, 100)
-            else:
-                x_vals_line = np.linspace(x_min_temp, x_max_temp, 100)
-                y_vals_line = (b - a1 * x_vals_line) / a2
-
-            # Filtrar valores extremadamente fuera de rango (opcional)
-            mask = np.isfinite(x_vals_line) & np.isfinite(y_vals_line)
-            x_vals_line = x_vals_line[mask]
-            y_vals_line = y_vals_line[mask]
-
-            if len(x_vals_line) > 0:
-                linea = LineString(np.column_stack((x_vals_line, y_vals_line)))
-                lineas.append(linea)
-                etiquetas.append(f"R{i+1}")
-
-        # 7. Encontrar todos los vértices (intersecciones entre líneas)
-        vertices = []
-        for i in range(len(lineas)):
-            for j in range(i + 1, len(lineas)):
-                interseccion = lineas[i].intersection(lineas[j])
-                if isinstance(interseccion, Point):
-                    x, y = interseccion.x, interseccion.y
-                    # Verificar que el punto cumple todas las restricciones
-                    factible = True
-                    for a1, a2, b, op in restricciones:
-                        valor = a1 * x + a2 * y
-                        if op == '<=' and valor > b + 1e-5:
-                            factible = False
-                            break
-                        elif op == '>=' and valor < b - 1e-5:
-                            factible = False
-                            break
-                        elif op == '=' and not abs(valor - b) <= 1e-5:
-                            factible = False
-                            break
-                    if factible:
-                        restricciones_activas = 0
-                        for a1, a2, b, op in restricciones:
-                            valor = a1 * x + a2 * y
-                            if op == '<=' and abs(valor - b) < 1e-5:
-                                restricciones_activas += 1
-                            elif op == '>=' and abs(valor - b) < 1e-5:
-                                restricciones_activas += 1
-                            elif op == '=':
-                                restricciones_activas += 1
-
-                        if restricciones_activas >= 2:
-                            punto = (round(x, 6), round(y, 6))
-                            if punto not in vertices:  # Evitar duplicados
-                                vertices.append(punto)
-
-        # Eliminar duplicados (por si acaso)
-        vertices = list(set(vertices))
-
-        if not vertices:
+        if region is None:
             console.print("\n[bold red]❌ No se encontró una región factible.[/bold red]")
             console.input("\n[bold cyan]Presiona Enter para volver...[/bold cyan]")
-            return
-
-        # 8. Calcular límites del gráfico basados en los vértices
-        x_coords = [v[0] for v in vertices]
-        y_coords = [v[1] for v in vertices]
-
-        margin = 0.1
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
-
-        x_range = x_max - x_min
-        y_range = y_max - y_min
-
-        x_min -= margin * x_range if x_range > 0 else 1
-        x_max += margin * x_range if x_range > 0 else 1
-        y_min -= margin * y_range if y_range > 0 else 1
-        y_max += margin * y_range if y_range > 0 else 1
-
-        # Asegurar que incluya el origen si es factible
-        if x_min > 0: x_min = 0
-        if y_min > 0: y_min = 0
-
-        # Recrear las líneas usando el rango ajustado
-        lineas = []
-        etiquetas = []
-
-        for i, (a1, a2, b, op) in enumerate(restricciones):
-            if a1 == 0 and a2 == 0:
-                continue
-
-            if a1 == 0:
-                x_vals_line = np.linspace(x_min, x_max, 100)
-                y_vals_line = np.full_like(x_vals_line, b / a2)
-            elif a2 == 0:
-                x_vals_line = np.full(100, b / a1)
-                y_vals_line = np.linspace(y_min, y_max, 100)
-            else:
-                x_vals_line = np.linspace(x_min, x_max, 100)
-                y_vals_line = (b - a1 * x_vals_line) / a2
-
-            # Filtrar puntos fuera de rango
-            mask = np.isfinite(x_vals_line) & np.isfinite(y_vals_line)
-            x_vals_line = x_vals_line[mask]
-            y_vals_line = y_vals_line[mask]
-
-            if len(x_vals_line) > 0:
-                linea = LineString(np.column_stack((x_vals_line, y_vals_line)))
-                lineas.append(linea)
-                etiquetas.append(f"R{i+1}")
+            return resultado
+        vertices = [tuple(v) for v in region.vertices.tolist()]
+        if not region.acotada:
+            console.print("\n[bold yellow]↗️  La región factible no es acotada.[/bold yellow]")
 
         # 9. Evaluar la función objetivo en cada vértice
         console.print(f"\n[bold green]🧮 EVALUACIÓN DE LA FUNCIÓN OBJETIVO EN VÉRTICES[/bold green]")
@@ -251,10 +291,8 @@ def metodo_grafico():
         tabla_vertices.add_column("X2", justify="right")
         tabla_vertices.add_column("Z = c1*X1 + c2*X2", justify="right")
 
-        valores_z = []
         for i, (x, y) in enumerate(vertices):
             z = c1 * x + c2 * y
-            valores_z.append(z)
             tabla_vertices.add_row(
                 f"V{i+1}",
                 f"{x:.4f}",
@@ -265,71 +303,25 @@ def metodo_grafico():
         console.print(tabla_vertices)
         console.input("Presiona Enter para continuar...")
 
-        # 10. Determinar la solución óptima
-        if tipo_optimizacion == "Maximizar":
-            idx_optimo = np.argmax(valores_z)
-            z_optimo = np.max(valores_z)
-        else:  # Minimizar
-            idx_optimo = np.argmin(valores_z)
-            z_optimo = np.min(valores_z)
-
-        x_optimo, y_optimo = vertices[idx_optimo]
-
-        console.print(f"\n[bold green]✅ SOLUCIÓN ÓPTIMA[/bold green]")
-        console.print(f"[bold yellow]Tipo: {tipo_optimizacion}[/bold yellow]")
-        console.print(f"[bold yellow]X1* = {x_optimo:.4f}[/bold yellow]")
-        console.print(f"[bold yellow]X2* = {y_optimo:.4f}[/bold yellow]")
-        console.print(f"[bold yellow]Z* = {z_optimo:.4f}[/bold yellow]")
+        # 10. Determinar la solución óptima (los rayos de la región deciden si existe)
+        if resultado.estado == "no_acotado":
+            dx, dy = resultado.informe["rayo"]
+            console.print(f"\n[bold red]❌ PROBLEMA NO ACOTADO[/bold red]")
+            console.print(f"[bold yellow]Z mejora sin límite en la dirección ({dx:.4f}, {dy:.4f}).[/bold yellow]")
+            optimo = z_optimo = None
+        else:
+            optimo = x_optimo, y_optimo = resultado.x
+            z_optimo = resultado.objetivo
+
+            console.print(f"\n[bold green]✅ SOLUCIÓN ÓPTIMA[/bold green]")
+            console.print(f"[bold yellow]Tipo: {tipo_optimizacion}[/bold yellow]")
+            console.print(f"[bold yellow]X1* = {x_optimo:.4f}[/bold yellow]")
+            console.print(f"[bold yellow]X2* = {y_optimo:.4f}[/bold yellow]")
+            console.print(f"[bold yellow]Z* = {z_optimo:.4f}[/bold yellow]")
 
         # 11. Graficar
         fig, ax = plt.subplots(figsize=(12, 9))
-
-        # Establecer límites
-        ax.set_xlim(x_min, x_max)
-        ax.set_ylim(y_min, y_max)
-
-        # Graficar líneas de restricción
-        colores = ['b', 'g', 'r', 'c', 'm', 'y', 'k']
-        for i, (linea, etiqueta) in enumerate(zip(lineas, etiquetas)):
-            x_line, y_line = linea.xy
-            x_line = np.array(x_line)
-            y_line = np.array(y_line)
-            ax.plot(x_line, y_line, '-', linewidth=2, color=colores[i % len(colores)], label=etiqueta)
-
-        # Graficar vértices
-        for x, y in vertices:
-            ax.plot(x, y, 'o', color='red', markersize=8)
-
-        # Rellenar la región factible
-        if len(vertices) >= 3:
-            vertices_array = np.array(vertices)
-            centro = np.mean(vertices_array, axis=0)
-
-            angles = np.arctan2(vertices_array[:, 1] - centro[1],
-                               vertices_array[:, 0] - centro[0])
-
-            sorted_indices = np.argsort(angles)
-            vertices_ordenados = vertices_array[sorted_indices]
-
-            poly_x = vertices_ordenados[:, 0]
-            poly_y = vertices_ordenados[:, 1]
-
-            ax.fill(poly_x, poly_y, color='lightblue', alpha=0.5, edgecolor='blue', linewidth=2, label='Región Factible')
-            ax.plot(np.append(poly_x, poly_x[0]), np.append(poly_y, poly_y[0]),
-                   'b-', linewidth=2, alpha=0.8)
-
-        # Anotar la solución óptima
-        ax.annotate(f'Óptimo ({x_optimo:.2f}, {y_optimo:.2f})\nZ={z_optimo:.2f}',
-                    xy=(x_optimo, y_optimo), xytext=(10, 10),
-                    textcoords='offset points', fontsize=10,
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7),
-                    arrowprops=dict(arrowstyle="->", color='black'))
-
-        ax.set_xlabel('X1')
-        ax.set_ylabel('X2')
-        ax.set_title('Método Gráfico - Región Factible y Solución Óptima')
-        ax.legend()
-        ax.grid(True, linestyle='--', alpha=0.7)
+        dibujar_region(ax, restricciones, region, optimo, z_optimo, rayo=resultado.informe.get("rayo"))
         plt.tight_layout()
         plt.show()
 
@@ -337,4 +329,5 @@ def metodo_grafico():
         console.print(f"\n[bold red]❌ Error: {str(e)}[/bold red]")
         console.print("Verifica que todos los datos ingresados sean correctos.")
 
-    console.input("\n[bold cyan]Presiona Enter para volver...[/bold cyan]")
\ No newline at end of file
+    console.input("\n[bold cyan]Presiona Enter para volver...[/bold cyan]")
+    return resultado
@@ -0,0 +1,293 @@
+# Revised.py
+"""
+Motor del método Simplex revisado.
+En lugar de actualizar la tabla completa en cada iteración, mantiene la inversa
+de la base en forma producto (archivo de etas), la refactoriza periódicamente y
+solo calcula el vector dual y la columna entrante.
+
+El orden de pivoteo (columna más negativa, razón mínima con empate en la
+primera fila) es el mismo que el del motor de tabla, de modo que ambos motores
+recorren las mismas bases.
+"""
+
+import numpy as np
+from .sparse import es_dispersa, como_dispersa
+from .errors import ProblemaNoAcotado
+
+TOL_PIVOTE = 1e-9
+REFACTORIZAR_CADA = 50
+
+
+class FactorizacionPFI:
+    """Inversa de la base en forma producto: B^-1 = E_k ... E_1.
+
+    Cada eta E_i es la identidad con la columna `fila` reemplazada por el
+    vector eta, que se guarda de forma dispersa (solo sus entradas no nulas).
+    """
+
+    def __init__(self, m):
+        self.m = m
+        self.etas = []  # (fila, eta_fila, indices, valores)
+
+    def __len__(self):
+        return len(self.etas)
+
+    def agregar_eta(self, fila, alpha):
+        """Agrega la eta que pivotea la columna `alpha` (ya transformada) en `fila`."""
+        piv = alpha[fila]
+        indices = np.flatnonzero(alpha)
+        indices = indices[indices != fila]
+        self.etas.append((fila, 1.0 / piv, indices, -alpha[indices] / piv))
+
+    def ftran(self, a):
+        """Resuelve B x = a aplicando las etas en orden."""
+        x = np.array(a, dtype=float)
+        for fila, eta_fila, indices, valores in self.etas:
+            xr = x[fila]
+            if xr != 0.0:
+                x[indices] += valores * xr
+                x[fila] = eta_fila * xr
+        return x
+
+    def btran(self, cb):
+        """Resuelve y^T B = cb^T aplicando las etas en orden inverso."""
+        y = np.array(cb, dtype=float)
+        for fila, eta_fila, indices, valores in reversed(self.etas):
+            y[fila] = eta_fila * y[fila] + y[indices] @ valores
+        return y
+
+
+class ProblemaRevisado:
+    """Datos del problema en forma estándar max c^T x, A x = b, x >= 0.
+
+    Las columnas son las de `A` seguidas de columnas unitarias implícitas
+    (holguras, excesos, artificiales) descritas por su fila y su signo, de modo
+    que nunca se forma la matriz completa [A | I]. `A` puede ser densa o
+    dispersa (ver Methods/sparse.py); en ese caso se mantiene dispersa.
+    """
+
+    def __init__(self, A, b, costo, filas_extra=(), signos_extra=()):
+        self.dispersa = es_dispersa(A)
+        self.A = como_dispersa(A) if self.dispersa else np.asarray(A, dtype=float)
+        self.b = np.asarray(b, dtype=float)
+        self.costo = np.asarray(costo, dtype=float)
+        self.filas_extra = np.asarray(filas_extra, dtype=int)
+        self.signos_extra = np.asarray(signos_extra, dtype=float)
+        self.m, self.n = self.A.shape
+
+    def columna(self, j):
+        """Devuelve la columna j como vector denso."""
+        if j < self.n:
+            return self.A.columna(j) if self.dispersa else self.A[:, j].copy()
+        col = np.zeros(self.m)
+        col[self.filas_extra[j - self.n]] = self.signos_extra[j - self.n]
+        return col
+
+    def costos_reducidos(self, y):
+        """Fila Z de la tabla equivalente: d_j = y^T a_j - c_j."""
+        d = np.empty(len(self.costo))
+        d[:self.n] = self.A.producto_transpuesto(y) if self.dispersa else self.A.T @ y
+        d[self.n:] = self.signos_extra * y[self.filas_extra]
+        d -= self.costo
+        return d
+
+
+def refactorizar(problema, base, fila_inicial):
+    """Reconstruye el archivo de etas para la base actual.
+
+    Parte de la base inicial (identidad) y pivotea cada columna básica que no
+    pertenece a ella en la fila libre con el mayor valor absoluto.
+    fila_inicial[j] es la fila de la columna j en la base inicial (-1 si no es inicial).
+    Devuelve (factorizacion, fila_fact) donde fila_fact[pos] es la fila de la
+    factorización que corresponde a la fila `pos` de la tabla.
+    """
+    m = problema.m
+    fact = FactorizacionPFI(m)
+    fila_fact = fila_inicial[base]
+    libres = np.ones(m, dtype=bool)
+    libres[fila_fact[fila_fact >= 0]] = False
+    for pos in np.flatnonzero(fila_fact < 0):
+        alpha = fact.ftran(problema.columna(base[pos]))
+        magnitudes = np.where(libres, np.abs(alpha), -1.0)
+        q = int(np.argmax(magnitudes))
+        if magnitudes[q] <= TOL_PIVOTE:
+            raise Exception("La base es singular; no se puede refactorizar.")
+        fact.agregar_eta(q, alpha)
+        fila_fact[pos] = q
+        libres[q] = False
+    return fact, fila_fact
+
+
+def iterar_revisado(problema, base_inicial, refactorizar_cada=REFACTORIZAR_CADA, base=None,
+                    bloqueadas=None):
+    """Itera el simplex revisado desde una base inicial identidad.
+
+    base_inicial[i] es la columna unitaria básica en la fila i.
+    base: base factible desde la que continuar (por ejemplo, la de la fase I de
+    Dos Fases); se factoriza a partir de base_inicial. bloqueadas: máscara de
+    columnas que no pueden entrar a la base.
+    Devuelve (pivotes, base, xB) con pivotes como lista de
+    (columna entrante, fila saliente, valor pivote) y xB en el orden de `base`.
+    """
+    m = problema.m
+    fila_inicial = np.full(len(problema.costo), -1)
+    fila_inicial[base_inicial] = np.arange(m)
+    if base is None:
+        base = np.array(base_inicial, dtype=int)
+        fact = FactorizacionPFI(m)
+        fila_fact = np.arange(m)
+        xB = problema.b.copy()  # en el orden de la factorización
+    else:
+        base = np.array(base, dtype=int)
+        fact, fila_fact = refactorizar(problema, base, fila_inicial)
+        xB = fact.ftran(problema.b)
+    etas_refactorizadas = len(fact)
+    pivotes = []
+
+    while True:
+        cb = np.empty(m)
+        cb[fila_fact] = problema.costo[base]
+        y = fact.btran(cb)
+        d = problema.costos_reducidos(y)
+        d[base] = 0.0
+        if bloqueadas is not None:
+            d[bloqueadas] = 0.0
+
+        candidatas = np.flatnonzero(d < -TOL_PIVOTE)
+        if len(candidatas) == 0:
+            break  # Solución óptima encontrada
+        candidatas = candidatas[np.argsort(d[candidatas], kind="stable")]
+
+        pivoteado = False
+        for col_pivote in candidatas:
+            alpha = fact.ftran(problema.columna(col_pivote))
+            columna = alpha[fila_fact]
+            positivos = columna > TOL_PIVOTE
+            if not positivos.any():
+                continue
+            razones = np.full(m, np.inf)
+            razones[positivos] = xB[fila_fact][positivos] / columna[positivos]
+            pos = int(np.argmin(razones))
+            q = fila_fact[pos]
+
+            theta = xB[q] / alpha[q]
+            xB -= theta * alpha
+            xB[q] = theta
+            fact.agregar_eta(q, alpha)
+            pivotes.append((int(col_pivote), pos, float(alpha[q])))
+            base[pos] = col_pivote
+            pivoteado = True
+            break
+        if not pivoteado:
+            raise ProblemaNoAcotado()
+
+        # Refactorizar cuando las etas nuevas igualan a las de la última
+        # refactorización: el costo de reconstruir queda amortizado.
+        if len(fact) - etas_refactorizadas >= max(refactorizar_cada, etas_refactorizadas):
+            fact, fila_fact = refactorizar(problema, base, fila_inicial)
+            etas_refactorizadas = len(fact)
+            xB = fact.ftran(problema.b)
+
+    return pivotes, base, xB[fila_fact]
+
+
+def _solucion(base, xB, num_vars):
+    solucion = np.zeros(num_vars)
+    es_original = base < num_vars
+    solucion[base[es_original]] = xB[es_original]
+    return solucion
+
+
+def resolver_simplex_revisado(c, A, b, refactorizar_cada=REFACTORIZAR_CADA):
+    """Simplex revisado para max c^T x, A x <= b, x >= 0 (holguras implícitas).
+    A puede ser densa o dispersa.
+    Devuelve (pivotes, solucion, valor_optimo); el número de iteraciones es len(pivotes)."""
+    if not es_dispersa(A):
+        A = np.asarray(A, dtype=float)
+    m, n = A.shape
+    costo = np.concatenate([np.asarray(c, dtype=float), np.zeros(m)])
+    problema = ProblemaRevisado(A, b, costo, np.arange(m), np.ones(m))
+    pivotes, base, xB = iterar_revisado(problema, np.arange(n, n + m), refactorizar_cada)
+    valor_optimo = float(costo[base] @ xB)
+    return pivotes, _solucion(base, xB, len(c)), valor_optimo
+
+
+def construir_problema_big_m(c, A, b, ops, M=1e6):
+    """Equivalente de construir_tabla_big_m para el motor revisado.
+    Mismo orden de columnas (x, holguras, excesos, artificiales) pero sin formar
+    la tabla: A se mantiene (dispersa si así se recibe) y las columnas agregadas
+    son unitarias implícitas. Las artificiales cuestan -M.
+    Devuelve (problema, base_inicial, nombres_columnas)."""
+    A = como_dispersa(A) if es_dispersa(A) else np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = A.shape
+
+    # Normalizar filas con b<0 invirtiendo y volteando operador
+    signo = np.where(b < 0, -1.0, 1.0)
+    A = A.escalar_filas(signo) if es_dispersa(A) else A * signo[:, None]
+    b = b * signo
+    volteo = {'<=': '>=', '>=': '<=', '=': '='}
+    ops_norm = [volteo[op] if s < 0 else op for op, s in zip(ops, signo)]
+
+    holguras = [i for i, op in enumerate(ops_norm) if op == '<=']
+    excesos = [i for i, op in enumerate(ops_norm) if op == '>=']
+    artificiales = [i for i, op in enumerate(ops_norm) if op in ('>=', '=')]
+    filas_extra = holguras + excesos + artificiales
+    signos_extra = [1.0] * len(holguras) + [-1.0] * len(excesos) + [1.0] * len(artificiales)
+
+    costo = np.zeros(n + len(filas_extra))
+    costo[:n] = c
+    costo[n + len(holguras) + len(excesos):] = -M
+    problema = ProblemaRevisado(A, b, costo, filas_extra, signos_extra)
+
+    # Base inicial: holgura o artificial de cada fila
+    base_inicial = np.empty(m, dtype=int)
+    base_inicial[holguras] = n + np.arange(len(holguras))
+    base_inicial[artificiales] = n + len(holguras) + len(excesos) + np.arange(len(artificiales))
+
+    col_names = ([f"x{i+1}" for i in range(n)]
+                 + [f"h{k+1}" for k in range(len(holguras))]
+                 + [f"e{k+1}" for k in range(len(excesos))]
+                 + [f"a{k+1}" for k in range(len(artificiales))] + ["LD"])
+    return problema, base_inicial, col_names
+
+
+def resolver_big_m_revisado(c, A, b, ops, M=1e6, refactorizar_cada=REFACTORIZAR_CADA):
+    """Big M con el motor revisado; A puede ser densa o dispersa.
+    Devuelve (pivotes, solucion, valor_optimo, factible, base) donde factible es
+    False si alguna artificial queda básica con valor positivo y base es la
+    columna básica final de cada fila."""
+    problema, base_inicial, col_names = construir_problema_big_m(c, A, b, ops, M)
+    pivotes, base, xB = iterar_revisado(problema, base_inicial, refactorizar_cada)
+    valor_optimo = float(problema.costo[base] @ xB)
+    es_artificial = np.array([nombre.startswith('a') for nombre in col_names[:-1]], dtype=bool)
+    factible = not np.any(es_artificial[base] & (xB > 1e-8))
+    return pivotes, _solucion(base, xB, problema.n), valor_optimo, factible, base
+
+
+def base_identidad(tabla):
+    """Base de una tabla canónica: para cada fila, la primera columna identidad
+    con costo reducido nulo que tiene su 1 en esa fila."""
+    tabla = np.asarray(tabla, dtype=float)
+    A = tabla[:-1, :-1]
+    unitarias = ((A == 1).sum(axis=0) == 1) & ((A != 0).sum(axis=0) == 1) & (tabla[-1, :-1] == 0)
+    base = np.full(A.shape[0], -1)
+    for j in np.flatnonzero(unitarias)[::-1]:
+        base[np.argmax(A[:, j])] = j
+    if (base < 0).any():
+        raise Exception("La tabla inicial no contiene una base identidad.")
+    return base
+
+
+def resolver_simplex_revisado_desde_tabla(tabla_inicial, num_vars_originales,
+                                          refactorizar_cada=REFACTORIZAR_CADA):
+    """Simplex revisado partiendo de una tabla inicial canónica (por ejemplo, de Big M).
+    Solo usa la tabla para leer A, b, la fila Z y la base identidad inicial.
+    Devuelve (pivotes, solucion_x, valor_optimo)."""
+    tabla = np.asarray(tabla_inicial, dtype=float)
+    A = tabla[:-1, :-1]
+    base_inicial = base_identidad(tabla)
+    problema = ProblemaRevisado(A, tabla[:-1, -1], -tabla[-1, :-1])
+    pivotes, base, xB = iterar_revisado(problema, base_inicial, refactorizar_cada)
+    valor_optimo = float(tabla[-1, -1] + problema.costo[base] @ xB)
+    return pivotes, _solucion(base, xB, num_vars_originales), valor_optimo
@@ -1,8 +1,6 @@
 # metodo_simplex.py
+import time
 import numpy as np
-from rich.console import Console
-from pyfiglet import Figlet
-import questionary
 from .table_display import (
     formatear_expresion, 
     fmt_num, 
@@ -10,8 +8,17 @@ from .table_display import (
     preparar_tabla_para_mostrar, 
     ajustar_visual_minimizacion
 )
-
-console = Console()
+from .Revised import TOL_PIVOTE, base_identidad, resolver_simplex_revisado, resolver_simplex_revisado_desde_tabla
+from .sparse import es_dispersa, como_dispersa
+from .pivot_log import HistorialPivotes
+from .pricing import Bland, crear_regla
+from .errors import LimiteAlcanzado, ProblemaInfactible, ProblemaNoAcotado
+from .modelo import ProgramaLineal, Resultado, calcular_duales
+from .consola import banner, console
+
+TOL_FACTIBLE = 1e-9
+# Pivoteos degenerados seguidos antes de pasar a Bland + razón lexicográfica
+DEGENERADOS_MAX = 50
 
 def validar_numero(x):
     """Valida que el input sea un número válido (entero o decimal, positivo o negativo)"""
@@ -32,21 +39,13 @@ def crear_tabla(c, A, b):
     A: coeficientes de las restricciones (matriz)
     b: términos independientes de las restricciones (lista)
     """
-    filas = len(A)
-    columnas = len(A[0]) + filas + 1  # variables + holgura + Z
-
-    # Inicializar tabla con ceros
-    tabla = np.zeros((filas + 1, columnas))
-
-    # Llenar restricciones
-    for i in range(filas):
-        tabla[i, :len(A[0])] = A[i]
-        tabla[i, len(A[0]) + i] = 1  # variable de holgura
-        tabla[i, -1] = b[i]
-
-    # Llenar función objetivo
-    tabla[-1, :len(c)] = -np.array(c)
-
+    m, n = len(b), len(c)
+    A = como_dispersa(A).toarray() if es_dispersa(A) else np.asarray(A, dtype=float).reshape(m, n)
+    tabla = np.zeros((m + 1, n + m + 1))
+    tabla[:m, :n] = A
+    tabla[np.arange(m), n + np.arange(m)] = 1.0  # variables de holgura
+    tabla[:m, -1] = b
+    tabla[-1, :n] = -np.asarray(c, dtype=float)
     return tabla
 
 def construir_tabla_big_m(c, A, b, ops, M=1e6):
@@ -58,297 +57,648 @@ def construir_tabla_big_m(c, A, b, ops, M=1e6):
     - M: penalización grande positiva
     Devuelve: (tabla numpy, nombres_columnas)
     """
-    A = [list(row) for row in A]
-    b = list(b)
-    m = len(A)
-    n = len(A[0]) if m>0 else 0
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = len(b), len(c)
+    A = como_dispersa(A).toarray() if es_dispersa(A) else np.asarray(A, dtype=float).reshape(m, n)
+    ops = np.asarray(ops, dtype=str)
 
     # Normalizar filas con b<0 invirtiendo y volteando operador
-    ops_norm = []
-    for i in range(m):
-        if b[i] < 0:
-            A[i] = [-val for val in A[i]]
-            b[i] = -b[i]
-            if ops[i] == '<=':
-                ops_norm.append('>=')
-            elif ops[i] == '>=':
-                ops_norm.append('<=')
-            else:
-                ops_norm.append('=')
-        else:
-            ops_norm.append(ops[i])
-
-    # Contar variables adicionales
-    slack_idx = []  # posiciones por restricción
-    surplus_idx = []
-    artificial_idx = []
-    slack_count = sum(1 for op in ops_norm if op == '<=')
-    surplus_count = sum(1 for op in ops_norm if op == '>=')
-    artificial_count = sum(1 for op in ops_norm if op in ('>=', '='))
-
-    total_cols = n + slack_count + surplus_count + artificial_count + 1
-    tabla = np.zeros((m+1, total_cols), dtype=float)
-
-    # Construir nombres de columnas
-    col_names = [f"x{i+1}" for i in range(n)]
-    slack_names = []
-    surplus_names = []
-    artificial_names = []
-
-    s_ptr = 0
-    e_ptr = 0
-    a_ptr = 0
-    # Mapas a índice absoluto dentro de la tabla
-    def idx_slack(k):
-        return n + k
-    def idx_surplus(k):
-        return n + slack_count + k
-    def idx_artificial(k):
-        return n + slack_count + surplus_count + k
-
-    # Llenar restricciones
-    for i in range(m):
-        # coef vars originales
-        tabla[i, :n] = A[i]
-        if ops_norm[i] == '<=':
-            # + slack
-            tabla[i, idx_slack(s_ptr)] = 1.0
-            slack_names.append(f"h{s_ptr+1}")
-            slack_idx.append(idx_slack(s_ptr))
-            s_ptr += 1
-        elif ops_norm[i] == '>=':
-            # - surplus + artificial
-            tabla[i, idx_surplus(e_ptr)] = -1.0
-            surplus_names.append(f"e{e_ptr+1}")
-            surplus_idx.append(idx_surplus(e_ptr))
-            e_ptr += 1
-            tabla[i, idx_artificial(a_ptr)] = 1.0
-            artificial_names.append(f"a{a_ptr+1}")
-            artificial_idx.append(idx_artificial(a_ptr))
-            a_ptr += 1
-        else:  # '='
-            # + artificial
-            tabla[i, idx_artificial(a_ptr)] = 1.0
-            artificial_names.append(f"a{a_ptr+1}")
-            artificial_idx.append(idx_artificial(a_ptr))
-            a_ptr += 1
-        tabla[i, -1] = b[i]
+    signo = np.where(b < 0, -1.0, 1.0)
+    es_menor = np.where(signo < 0, ops == '>=', ops == '<=')
+    es_mayor = np.where(signo < 0, ops == '<=', ops == '>=')
+    holguras = np.flatnonzero(es_menor)
+    excesos = np.flatnonzero(es_mayor)
+    artificiales = np.flatnonzero(~es_menor)  # filas '>=' e '='
+    inicio_excesos = n + len(holguras)
+    inicio_artificiales = inicio_excesos + len(excesos)
+
+    tabla = np.zeros((m + 1, inicio_artificiales + len(artificiales) + 1))
+    tabla[:m, :n] = A * signo[:, None]
+    tabla[holguras, n + np.arange(len(holguras))] = 1.0
+    tabla[excesos, inicio_excesos + np.arange(len(excesos))] = -1.0
+    tabla[artificiales, inicio_artificiales + np.arange(len(artificiales))] = 1.0
+    tabla[:m, -1] = b * signo
 
     # Función objetivo (Z row)
     # Z row almacena -c en columnas de x. Para Big M (max), artificiales deben tener +M.
-    tabla[-1, :n] = -np.array(c, dtype=float)
-    # Artificial penalizadas con +M
-    for a_i in range(artificial_count):
-        tabla[-1, idx_artificial(a_i)] = M
-
-    # Ajuste canónico: si artificial está en la base inicialmente (lo está),
-    # restamos M * fila_restricción correspondiente para anular el coef en Z
-    # Identificamos por columna identidad en fila i
-    a_track = 0
-    for i in range(m):
-        # ¿esta restricción tiene una artificial marcada con 1?
-        has_artificial = False
-        a_col = -1
-        for a_i in range(artificial_count):
-            col = idx_artificial(a_i)
-            if abs(tabla[i, col] - 1.0) < 1e-9:
-                has_artificial = True
-                a_col = col
-                break
-        if has_artificial:
-            tabla[-1, :] -= M * tabla[i, :]
-
-    col_names = col_names + slack_names + surplus_names + artificial_names + ["LD"]
+    tabla[-1, :n] = -c
+    tabla[-1, inicio_artificiales:-1] = M
+    # Ajuste canónico: las artificiales empiezan en la base, así que se resta
+    # M * su fila para anular su coeficiente en Z
+    for fila in artificiales:
+        tabla[-1, :] -= M * tabla[fila, :]
+
+    col_names = ([f"x{i+1}" for i in range(n)]
+                 + [f"h{k+1}" for k in range(len(holguras))]
+                 + [f"e{k+1}" for k in range(len(excesos))]
+                 + [f"a{k+1}" for k in range(len(artificiales))] + ["LD"])
     return tabla, col_names
 
 def encontrar_columna_pivote(tabla):
     """
-    Encuentra la columna pivote (columna con valor más negativo en la última fila).
+    Encuentra las columnas candidatas (coeficiente negativo en la última fila),
+    ordenadas de la más negativa a la menos negativa.
     """
     ultima_fila = tabla[-1, :-1]
-    # Candidatas: índices con coeficiente negativo
-    candidatas = [i for i, v in enumerate(ultima_fila) if v < 0]
-    if not candidatas:
+    # Candidatas: índices con coeficiente negativo (se ignora el ruido de redondeo)
+    candidatas = np.flatnonzero(ultima_fila < -TOL_PIVOTE)
+    if not len(candidatas):
         return None
-    # Ordenar por valor más negativo primero
-    candidatas.sort(key=lambda i: ultima_fila[i])
-    return candidatas
+    # Ordenar por valor más negativo primero (estable: empate en el menor índice)
+    return candidatas[np.argsort(ultima_fila[candidatas], kind="stable")].tolist()
 
 def encontrar_fila_pivote(tabla, col_pivote):
     """
-    Encuentra la fila pivote usando la razón mínima.
+    Encuentra la fila pivote usando la razón mínima (en empate, la primera fila).
     """
     rhs = tabla[:-1, -1]
     columna = tabla[:-1, col_pivote]
-    razones = []
+    # Un pivote del orden del redondeo haría crecer la tabla sin control
+    razones = np.divide(rhs, columna, out=np.full(len(rhs), np.inf), where=columna > TOL_PIVOTE)
+    if not len(razones):
+        return None  # Sin restricciones (por ejemplo, todas redundantes tras la fase I)
+    fila = int(np.argmin(razones))
+    if razones[fila] == np.inf:
+        return None  # Solución no acotada
+    return fila
 
-    for i in range(len(rhs)):
-        if columna[i] > 0:
-            razones.append(rhs[i] / columna[i])
+def encontrar_fila_pivote_lexicografica(tabla, col_pivote, columnas_lex):
+    """
+    Prueba de razón mínima con desempate lexicográfico: entre las filas empatadas
+    compara fila[k] / columna para cada k de columnas_lex (las columnas básicas
+    cuando se activó la regla, que forman una identidad). Así la fila elegida es
+    única y el método no puede ciclar.
+    """
+    rhs = tabla[:-1, -1]
+    columna = tabla[:-1, col_pivote]
+    filas = np.flatnonzero(columna > TOL_PIVOTE)
+    if not len(filas):
+        return None
+    razones = rhs[filas] / columna[filas]
+    filas = filas[razones <= razones.min() + TOL_PIVOTE]
+    for k in columnas_lex:
+        if len(filas) == 1:
+            break
+        razones = tabla[filas, k] / columna[filas]
+        filas = filas[razones <= razones.min() + TOL_PIVOTE]
+    return int(filas[0])
+
+def pivotear(tabla, fila_pivote, col_pivote, trabajo=None):
+    """
+    Realiza la operación de pivoteo en el lugar.
+    Normaliza la fila pivote y elimina la columna pivote del resto de filas con
+    una única actualización de rango 1 (producto exterior), sin ciclo por fila.
+    trabajo: búfer opcional con la forma de la tabla; si se reutiliza entre
+    pivoteos, la actualización no reserva memoria nueva.
+    """
+    fila = tabla[fila_pivote]
+    fila /= fila[col_pivote]
+
+    factores = tabla[:, col_pivote].copy()
+    factores[fila_pivote] = 0.0
+    if trabajo is None:
+        trabajo = np.empty_like(tabla)
+    np.multiply(factores[:, None], fila, out=trabajo)
+    tabla -= trabajo
+
+def _registrador(tabla, con_tabla, base):
+    """Función que arma los registros por iteración de iterar_simplex e iterar_simplex_dual."""
+    vista = tabla.view()
+    vista.flags.writeable = False
+    vista_base = base.view()
+    vista_base.flags.writeable = False
+
+    def registro(iteracion, col_pivote=None, fila_pivote=None, valor_pivote=None, tiempos=None,
+                 degenerado=False):
+        return {
+            "iteracion": iteracion,
+            "col_pivote": col_pivote,
+            "fila_pivote": fila_pivote,
+            "valor_pivote": valor_pivote,
+            "objetivo": float(tabla[-1, -1]),
+            "tabla": vista if con_tabla else None,
+            "base": vista_base,
+            "tiempos": tiempos,
+            "degenerado": degenerado,
+        }
+    return registro
+
+def iterar_simplex(tabla, con_tabla=False, pricing=None, max_iteraciones=None, tiempo_limite=None,
+                   degenerados_max=DEGENERADOS_MAX, base=None):
+    """
+    Versión por pasos (generador) del método simplex.
+    Pivotea `tabla` en el lugar y produce un registro por iteración, empezando por
+    la tabla inicial (iteración 0), con las claves:
+    iteracion, col_pivote, fila_pivote, valor_pivote (None en la iteración 0),
+    objetivo (LD de la fila Z), tabla (vista de solo lectura de la tabla actual
+    si con_tabla=True, válida hasta pedir el siguiente registro; si no, None),
+    base (vista de solo lectura de la columna básica de cada fila, que se
+    actualiza en cada pivoteo; copiarla si se quiere conservar), tiempos
+    (segundos de cada fase del pivoteo: 'pricing', 'razon' y 'pivoteo'; None en la
+    iteración 0) y degenerado (True si el pivoteo no cambió el objetivo).
+    base: columnas básicas de la tabla inicial; si no se da, se detectan una sola
+    vez en la tabla inicial (ver Revised.base_identidad).
+    El consumidor puede detenerse en cualquier momento; al terminar el generador,
+    `tabla` contiene la tabla óptima.
+    pricing: regla de elección de la columna entrante, por nombre ("dantzig",
+    "parcial", "devex", "steepest", "bland") o como instancia (ver Methods/pricing.py).
+    Anticiclado: tras degenerados_max pivoteos seguidos sin mejorar el objetivo se
+    usa la regla de Bland con razón mínima lexicográfica hasta el siguiente pivoteo
+    que mejore el objetivo.
+    max_iteraciones / tiempo_limite (segundos): si se alcanzan antes del óptimo se
+    lanza LimiteAlcanzado; `tabla` queda en la última solución básica factible.
+    """
+    base = np.array(base_identidad(tabla) if base is None else base, dtype=int)
+    regla = crear_regla(pricing)
+    regla.iniciar(tabla, base)
+    bland = Bland()
+    columnas_lex = None  # no None mientras el anticiclado está activo
+    degenerados = 0
+    inicio = time.perf_counter()
+    trabajo = np.empty_like(tabla)
+    registro = _registrador(tabla, con_tabla, base)
+    yield registro(0)
+    iteracion = 0
+    while True:
+        t_inicio = time.perf_counter()
+        col_pivote = (bland if columnas_lex is not None else regla).elegir(tabla)
+        t_pricing = time.perf_counter()
+        if col_pivote is None:
+            return  # Solución óptima encontrada
+        if max_iteraciones is not None and iteracion >= max_iteraciones:
+            raise LimiteAlcanzado("limite_iteraciones")
+        if tiempo_limite is not None and time.perf_counter() - inicio > tiempo_limite:
+            raise LimiteAlcanzado("limite_tiempo")
+        if columnas_lex is not None:
+            fila_pivote = encontrar_fila_pivote_lexicografica(tabla, col_pivote, columnas_lex)
+        else:
+            fila_pivote = encontrar_fila_pivote(tabla, col_pivote)
+        if fila_pivote is None:
+            # La columna elegida no tiene razón finita: se prueban las demás
+            # candidatas en orden de Dantzig antes de declarar no acotado
+            for col_pivote in encontrar_columna_pivote(tabla):
+                fila_pivote = encontrar_fila_pivote(tabla, col_pivote)
+                if fila_pivote is not None:
+                    break
+            else:
+                raise ProblemaNoAcotado()
+        t_razon = time.perf_counter()
+        regla.actualizar(tabla, fila_pivote, col_pivote)
+        t_actualizar = time.perf_counter()
+        valor_pivote = float(tabla[fila_pivote, col_pivote])
+        objetivo_anterior = tabla[-1, -1]
+        pivotear(tabla, fila_pivote, col_pivote, trabajo)
+        base[fila_pivote] = col_pivote
+        tiempos = {
+            "pricing": (t_pricing - t_inicio) + (t_actualizar - t_razon),
+            "razon": t_razon - t_pricing,
+            "pivoteo": time.perf_counter() - t_actualizar,
+        }
+
+        degenerado = abs(tabla[-1, -1] - objetivo_anterior) <= TOL_FACTIBLE * (1.0 + abs(objetivo_anterior))
+        if degenerado:
+            degenerados += 1
+            if columnas_lex is None and degenerados_max is not None and degenerados >= degenerados_max:
+                columnas_lex = base.copy()
         else:
-            razones.append(np.inf)
+            degenerados = 0
+            columnas_lex = None
+        iteracion += 1
+        yield registro(iteracion, int(col_pivote), int(fila_pivote), valor_pivote, tiempos, degenerado)
 
-    fila = np.argmin(razones)
-    if razones[fila] == np.inf:
-        return None  # Solución no acotada
+def encontrar_fila_pivote_dual(tabla):
+    """
+    Fila saliente del simplex dual: la de LD más negativo, o None si la tabla ya
+    es primal factible.
+    """
+    rhs = tabla[:-1, -1]
+    fila = int(np.argmin(rhs))
+    if rhs[fila] >= -TOL_FACTIBLE:
+        return None
     return fila
 
-def pivotear(tabla, fila_pivote, col_pivote):
+def encontrar_columna_pivote_dual(tabla, fila_pivote):
     """
-    Realiza la operación de pivoteo.
+    Columna entrante del simplex dual: entre las columnas con coeficiente negativo
+    en la fila pivote, la de menor razón costo reducido / |coeficiente|.
+    Devuelve None si no hay ninguna (el problema es infactible).
     """
-    # Normalizar fila pivote
-    tabla[fila_pivote] = tabla[fila_pivote] / tabla[fila_pivote, col_pivote]
+    fila = tabla[fila_pivote, :-1]
+    negativas = fila < -TOL_FACTIBLE
+    if not negativas.any():
+        return None
+    costos = np.maximum(tabla[-1, :-1], 0.0)
+    razones = np.full(len(fila), np.inf)
+    razones[negativas] = costos[negativas] / -fila[negativas]
+    return int(np.argmin(razones))
 
-    # Hacer ceros en la columna pivote
-    for i in range(len(tabla)):
-        if i != fila_pivote:
-            factor = tabla[i, col_pivote]
-            tabla[i] -= factor * tabla[fila_pivote]
+def iterar_simplex_dual(tabla, con_tabla=False, base=None, max_iteraciones=None, tiempo_limite=None):
+    """
+    Simplex dual por pasos sobre el mismo formato de tabla: parte de una tabla
+    dual factible (fila Z sin negativos) y pivotea hasta que el LD no tenga
+    negativos. Produce los mismos registros que iterar_simplex (en tiempos,
+    'pricing' es la elección de la fila saliente y 'razon' la de la columna
+    entrante) y lanza ProblemaInfactible si una fila con LD negativo no tiene
+    coeficientes negativos.
+    max_iteraciones / tiempo_limite (segundos): si se alcanzan antes del óptimo se
+    lanza LimiteAlcanzado; `tabla` queda dual factible pero todavía no primal
+    factible.
+    """
+    base = np.array(base_identidad(tabla) if base is None else base, dtype=int)
+    inicio = time.perf_counter()
+    trabajo = np.empty_like(tabla)
+    registro = _registrador(tabla, con_tabla, base)
+    yield registro(0)
+    iteracion = 0
+    while True:
+        t_inicio = time.perf_counter()
+        fila_pivote = encontrar_fila_pivote_dual(tabla)
+        t_pricing = time.perf_counter()
+        if fila_pivote is None:
+            return  # Primal factible: solución óptima
+        if max_iteraciones is not None and iteracion >= max_iteraciones:
+            raise LimiteAlcanzado("limite_iteraciones")
+        if tiempo_limite is not None and time.perf_counter() - inicio > tiempo_limite:
+            raise LimiteAlcanzado("limite_tiempo")
+        col_pivote = encontrar_columna_pivote_dual(tabla, fila_pivote)
+        if col_pivote is None:
+            raise ProblemaInfactible()
+        t_razon = time.perf_counter()
+        valor_pivote = float(tabla[fila_pivote, col_pivote])
+        objetivo_anterior = tabla[-1, -1]
+        pivotear(tabla, fila_pivote, col_pivote, trabajo)
+        base[fila_pivote] = col_pivote
+        tiempos = {"pricing": t_pricing - t_inicio, "razon": t_razon - t_pricing,
+                   "pivoteo": time.perf_counter() - t_razon}
+        iteracion += 1
+        yield registro(iteracion, col_pivote, fila_pivote, valor_pivote, tiempos,
+                       abs(tabla[-1, -1] - objetivo_anterior) <= TOL_FACTIBLE * (1.0 + abs(objetivo_anterior)))
+
+def simplex_por_pasos(c, A, b, con_tabla=False):
+    """Genera las iteraciones del simplex para max c^T x, A x <= b, x >= 0
+    a medida que se resuelve (ver iterar_simplex)."""
+    yield from iterar_simplex(crear_tabla(c, A, b), con_tabla)
+
+def extraer_solucion(tabla, num_vars, base):
+    """Valores de las primeras num_vars variables, leídos del LD de las filas
+    cuya columna básica (`base`, por ejemplo iteraciones.base()) es una de ellas."""
+    solucion = np.zeros(num_vars)
+    base = np.asarray(base, dtype=int)
+    filas = np.flatnonzero(base < num_vars)
+    solucion[base[filas]] = tabla[filas, -1]
+    return solucion
+
+def es_infactible_big_m(tabla, col_names, base):
+    """True si alguna variable artificial (columnas 'a*') queda básica con RHS > 0;
+    `base` es la columna básica de cada fila."""
+    return any(col_names[col].startswith('a') and tabla[fila, -1] > 1e-8
+               for fila, col in enumerate(base))
+
+def _registrar_iteraciones(tabla, punto_control_cada, iterar=iterar_simplex, base_inicial=None,
+                           al_iterar=None, **opciones):
+    """Resuelve `tabla` en el lugar guardando las iteraciones en un HistorialPivotes.
+    opciones (pricing, max_iteraciones, tiempo_limite) se pasan a iterar_simplex;
+    si se alcanza un límite, el historial queda con ese estado.
+    al_iterar(registro) se llama tras cada pivoteo con el registro de iterar_simplex;
+    sus tiempos incluyen además 'registro' (guardar el pivote en el historial)."""
+    iteraciones = HistorialPivotes(tabla.copy(), punto_control_cada=punto_control_cada,
+                                   base_inicial=base_inicial)
+    opciones = {clave: valor for clave, valor in opciones.items() if valor is not None}
+    try:
+        for paso in iterar(tabla, base=base_inicial, **opciones):
+            if paso["col_pivote"] is None:
+                iteraciones.base_inicial = paso["base"].copy()
+            elif al_iterar is None:
+                iteraciones.registrar(paso["col_pivote"], paso["fila_pivote"], paso["valor_pivote"], tabla)
+            else:
+                inicio = time.perf_counter()
+                iteraciones.registrar(paso["col_pivote"], paso["fila_pivote"], paso["valor_pivote"], tabla)
+                paso["tiempos"]["registro"] = time.perf_counter() - inicio
+                al_iterar(paso)
+    except LimiteAlcanzado as e:
+        iteraciones.estado = e.estado
+    iteraciones.final = tabla
+    return iteraciones
+
+def tabla_en_base(tabla_inicial, base):
+    """
+    Reescribe la tabla inicial en la base dada (una columna básica por fila):
+    B^-1 [A | b] y la fila Z con los costos reducidos de esa base.
+    Lanza numpy.linalg.LinAlgError si la base es singular.
+    """
+    tabla_inicial = np.asarray(tabla_inicial, dtype=float)
+    base = np.asarray(base, dtype=int)
+    cuerpo = np.linalg.solve(tabla_inicial[:-1, base], tabla_inicial[:-1])
+    fila_z = tabla_inicial[-1] - tabla_inicial[-1, base] @ cuerpo
+    tabla = np.vstack((cuerpo, fila_z))
+    # Limpiar el ruido de la solución para que las columnas básicas sean identidad exacta
+    tabla[np.abs(tabla) < TOL_FACTIBLE] = 0.0
+    tabla[:-1, base] = np.eye(len(base))
+    tabla[-1, base] = 0.0
+    return tabla
 
-def resolver_simplex(c, A, b):
+def _reoptimizar(tabla_inicial, base, punto_control_cada, **opciones):
+    """
+    Arranque en caliente desde `base`: si la tabla en esa base es primal factible
+    continúa con el simplex primal; si es dual factible, con el simplex dual.
+    Devuelve (iteraciones, tabla final) o None si la base es singular o no es
+    factible de ninguna de las dos formas (hay que empezar desde cero).
+    El simplex dual respeta max_iteraciones, tiempo_limite y al_iterar; como
+    elige la fila saliente con su propia regla, una regla de pricing distinta de
+    Dantzig lanza ValueError.
+    """
+    try:
+        tabla = tabla_en_base(tabla_inicial, base)
+    except np.linalg.LinAlgError:
+        return None
+    base = np.array(base, dtype=int)
+    if (tabla[:-1, -1] >= -TOL_FACTIBLE).all():
+        iteraciones = _registrar_iteraciones(tabla, punto_control_cada, iterar_simplex, base, **opciones)
+    elif (tabla[-1, :-1] >= -TOL_FACTIBLE).all():
+        if opciones.get("pricing") not in (None, "dantzig"):
+            raise ValueError("El arranque en caliente con simplex dual solo admite la regla de Dantzig.")
+        opciones = {clave: valor for clave, valor in opciones.items() if clave != "pricing"}
+        iteraciones = _registrar_iteraciones(tabla, punto_control_cada, iterar_simplex_dual, base,
+                                             **opciones)
+    else:
+        return None
+    return iteraciones, tabla
+
+def _solo_dantzig(pricing, max_iteraciones=None, tiempo_limite=None, al_iterar=None):
+    if pricing not in (None, "dantzig"):
+        raise ValueError("El motor revisado solo admite la regla de Dantzig.")
+    if max_iteraciones is not None or tiempo_limite is not None:
+        raise ValueError("Los límites de iteraciones y de tiempo solo aplican al motor de tabla.")
+    if al_iterar is not None:
+        raise ValueError("al_iterar solo aplica al motor de tabla.")
+
+def resolver_simplex(c, A, b, motor="tabla", punto_control_cada=0, base=None, pricing=None,
+                     max_iteraciones=None, tiempo_limite=None, exacto=False, al_iterar=None):
     """
     Implementación del método simplex que retorna todas las iteraciones.
+    Las iteraciones se devuelven como un HistorialPivotes (Methods/pivot_log.py):
+    la tabla inicial más el registro de pivotes; cada tabla se reconstruye bajo demanda.
+    motor: "tabla" actualiza la tabla completa en cada pivoteo; "revisado" usa el
+    simplex revisado (Methods/Revised.py) y no forma la tabla salvo que se consulte.
+    Si A es dispersa (Methods/sparse.py o SciPy) siempre se usa el motor revisado,
+    para no formar la tabla densa.
+    punto_control_cada: si es > 0, guarda una copia de la tabla cada k pivotes para
+    acelerar el acceso aleatorio al historial.
+    base: columnas básicas de una solución anterior (iteraciones.base()). Si se da,
+    la tabla se reconstruye en esa base y se reoptimiza con el simplex primal o
+    dual según siga siendo primal o dual factible; la primera iteración del
+    historial es la tabla en esa base. Si no sirve, se resuelve desde cero.
+    pricing: regla de columna entrante del motor de tabla (ver iterar_simplex);
+    el motor revisado solo usa Dantzig.
+    max_iteraciones / tiempo_limite: límites del motor de tabla. Si se alcanzan,
+    se devuelve la última solución básica factible e iteraciones.estado indica
+    'limite_iteraciones' o 'limite_tiempo' (si no, 'optimo').
+    exacto: resuelve con aritmética racional exacta (ver Methods/Exact.py); la
+    solución y el valor son Fraction y las tablas del historial, TablaExacta.
+    Admite punto_control_cada y max_iteraciones.
+    al_iterar: función que recibe el registro de cada pivoteo del motor de tabla
+    (ver iterar_simplex), con los tiempos de cada fase; por ejemplo, un
+    profiling.Perfilador.
+    Para consumir las iteraciones mientras se resuelve, ver simplex_por_pasos.
     """
+    if exacto:
+        from .Exact import resolver_simplex_exacto
+        if (base is not None or pricing not in (None, "dantzig") or tiempo_limite is not None
+                or al_iterar is not None):
+            raise ValueError("El modo exacto no admite base, pricing, tiempo_limite ni al_iterar.")
+        return resolver_simplex_exacto(c, A, b, punto_control_cada, max_iteraciones)
+    opciones = dict(pricing=pricing, max_iteraciones=max_iteraciones, tiempo_limite=tiempo_limite,
+                    al_iterar=al_iterar)
+    if base is not None:
+        reoptimizado = _reoptimizar(crear_tabla(c, A, b), base, punto_control_cada, **opciones)
+        if reoptimizado is not None:
+            iteraciones, tabla = reoptimizado
+            return iteraciones, extraer_solucion(tabla, len(c), iteraciones.base()), tabla[-1, -1]
+    if motor == "revisado" or es_dispersa(A):
+        _solo_dantzig(**opciones)
+        m, n = A.shape if es_dispersa(A) else np.shape(A)
+        pivotes, solucion, valor_optimo = resolver_simplex_revisado(c, A, b)
+        iteraciones = HistorialPivotes(lambda: crear_tabla(c, A, b), pivotes,
+                                       base_inicial=np.arange(n, n + m))
+        return iteraciones, solucion, valor_optimo
     tabla = crear_tabla(c, A, b)
-    iteraciones = [tabla.copy()]
-    
-    while True:
-        candidatas = encontrar_columna_pivote(tabla)
-        if candidatas is None:
-            break  # Solución óptima encontrada
-        pivoteado = False
-        for col_pivote in candidatas:
-            fila_pivote = encontrar_fila_pivote(tabla, col_pivote)
-            if fila_pivote is not None:
-                pivotear(tabla, fila_pivote, col_pivote)
-                iteraciones.append(tabla.copy())
-                pivoteado = True
-                break
-        if not pivoteado:
-            raise Exception("La solución es no acotada.")
-
-    # Extraer solución
-    solucion = np.zeros(len(c))
-    filas, columnas = tabla.shape
-    for i in range(len(c)):
-        columna = tabla[:, i]
-        if list(columna[:-1]).count(1) == 1 and list(columna[:-1]).count(0) == len(columna[:-1]) - 1:
-            fila = np.where(columna == 1)[0][0]
-            solucion[i] = tabla[fila, -1]
-
-    valor_optimo = tabla[-1, -1]
-    return iteraciones, solucion, valor_optimo
-
-def resolver_simplex_desde_tabla(tabla_inicial, num_vars_originales):
+    iteraciones = _registrar_iteraciones(tabla, punto_control_cada, **opciones)
+    return iteraciones, extraer_solucion(tabla, len(c), iteraciones.base()), tabla[-1, -1]
+
+def resolver_simplex_desde_tabla(tabla_inicial, num_vars_originales, motor="tabla",
+                                 punto_control_cada=0, base=None, pricing=None,
+                                 max_iteraciones=None, tiempo_limite=None, al_iterar=None):
     """Itera el simplex partiendo de una tabla inicial (por ejemplo, de Big M).
-    Devuelve (iteraciones, solucion_x, valor_optimo)."""
+    Devuelve (iteraciones, solucion_x, valor_optimo), con las iteraciones como
+    HistorialPivotes igual que resolver_simplex. `base`, pricing, los límites y
+    al_iterar funcionan igual que en resolver_simplex."""
+    opciones = dict(pricing=pricing, max_iteraciones=max_iteraciones, tiempo_limite=tiempo_limite,
+                    al_iterar=al_iterar)
+    if base is not None:
+        reoptimizado = _reoptimizar(tabla_inicial, base, punto_control_cada, **opciones)
+        if reoptimizado is not None:
+            iteraciones, tabla = reoptimizado
+            return iteraciones, extraer_solucion(tabla, num_vars_originales, iteraciones.base()), tabla[-1, -1]
+    if motor == "revisado":
+        _solo_dantzig(**opciones)
+        pivotes, solucion, valor_optimo = resolver_simplex_revisado_desde_tabla(
+            tabla_inicial, num_vars_originales)
+        return HistorialPivotes(np.array(tabla_inicial, dtype=float), pivotes), solucion, valor_optimo
     tabla = np.array(tabla_inicial, dtype=float)
-    iteraciones = [tabla.copy()]
-
-    while True:
-        candidatas = encontrar_columna_pivote(tabla)
-        if candidatas is None:
-            break
-        pivoteado = False
-        for col_pivote in candidatas:
-            fila_pivote = encontrar_fila_pivote(tabla, col_pivote)
-            if fila_pivote is not None:
-                pivotear(tabla, fila_pivote, col_pivote)
-                iteraciones.append(tabla.copy())
-                pivoteado = True
-                break
-        if not pivoteado:
-            raise Exception("La solución es no acotada.")
-
+    iteraciones = _registrar_iteraciones(tabla, punto_control_cada, **opciones)
     # Extraer solución solo para variables originales x1..xn (primeras columnas)
-    solucion = np.zeros(num_vars_originales)
-    for i in range(num_vars_originales):
-        columna = tabla[:, i]
-        if list(columna[:-1]).count(1) == 1 and list(columna[:-1]).count(0) == len(columna[:-1]) - 1:
-            fila = np.where(columna == 1)[0][0]
-            solucion[i] = tabla[fila, -1]
-    valor_optimo = tabla[-1, -1]
-    return iteraciones, solucion, valor_optimo
-
-def simplex():
-    console.clear()
-    f = Figlet(font='big')
-    console.print(f.renderText('Metodo Simplex'), style="bold blue")
-    console.print("Resuelve problemas de programación lineal con cualquier número de variables.", style="italic")
+    return iteraciones, extraer_solucion(tabla, num_vars_originales, iteraciones.base()), tabla[-1, -1]
 
-    try:
-        # 1. Solicitar tipo de optimización
-        console.print("\n[bold cyan]📋 CONFIGURACIÓN DEL PROBLEMA[/bold cyan]")
-        tipo_optimizacion = questionary.select(
-            "¿Qué tipo de optimización deseas realizar?",
-            choices=["Maximizar", "Minimizar"]
-        ).ask()
+def _resolver_dual(tabla, num_vars, punto_control_cada, base_inicial=None, **limites):
+    if (tabla[-1, :-1] < -TOL_FACTIBLE).any():
+        raise ValueError("La tabla no es dual factible: la fila Z tiene coeficientes negativos.")
+    iteraciones = _registrar_iteraciones(tabla, punto_control_cada, iterar_simplex_dual, base_inicial,
+                                         **limites)
+    return iteraciones, extraer_solucion(tabla, num_vars, iteraciones.base()), tabla[-1, -1]
 
-        # 2. Solicitar número de variables
-        num_variables = questionary.text(
-            "¿Cuántas variables tiene tu función objetivo? (ej: 2)",
-            validate=lambda x: x.isdigit() and int(x) > 0
-        ).ask()
-        num_variables = int(num_variables)
+def resolver_simplex_dual(c, A, b, punto_control_cada=0, max_iteraciones=None, tiempo_limite=None):
+    """
+    Simplex dual para max c^T x, A x <= b, x >= 0 con b de cualquier signo.
+    Necesita c <= 0 (fila Z sin negativos), como al minimizar costos positivos
+    con restricciones '>=' escritas como -a x <= -b. Devuelve
+    (iteraciones, solucion_x, valor_optimo) igual que resolver_simplex y lanza
+    ProblemaInfactible si el problema no tiene solución factible. Si se alcanza
+    max_iteraciones o tiempo_limite, iteraciones.estado lo indica y la solución
+    todavía no es factible.
+    """
+    tabla = crear_tabla(c, A, b)
+    m, n = tabla.shape[0] - 1, len(c)
+    return _resolver_dual(tabla, n, punto_control_cada, np.arange(n, n + m),
+                          max_iteraciones=max_iteraciones, tiempo_limite=tiempo_limite)
+
+def resolver_simplex_dual_desde_tabla(tabla_inicial, num_vars_originales, punto_control_cada=0,
+                                      base=None, max_iteraciones=None, tiempo_limite=None):
+    """Itera el simplex dual desde una tabla dual factible (por ejemplo, una tabla
+    óptima a la que se le cambió el LD o se le agregó una restricción con
+    agregar_restriccion). `base` son sus columnas básicas, si se conocen; los
+    límites funcionan igual que en resolver_simplex_dual."""
+    tabla = np.array(tabla_inicial, dtype=float)
+    return _resolver_dual(tabla, num_vars_originales, punto_control_cada, base,
+                          max_iteraciones=max_iteraciones, tiempo_limite=tiempo_limite)
 
-        # 3. Solicitar coeficientes de la función objetivo
-        console.print(f"\n[bold yellow]🎯 FUNCIÓN OBJETIVO ({tipo_optimizacion.upper()})[/bold yellow]")
-        c = []
-        for i in range(num_variables):
+def agregar_restriccion(tabla, base, coeficientes, rhs, op="<="):
+    """
+    Agrega la restricción coeficientes . x (op) rhs a una tabla expresada en la
+    base `base` (por ejemplo, la tabla óptima y iteraciones.base()).
+    coeficientes se refiere a las primeras columnas de la tabla (las variables
+    originales); op es '<=' o '>='. La nueva fila lleva su propia holgura, que
+    entra a la base, y se escribe en términos de la base actual, de modo que si
+    el óptimo anterior la viola basta con seguir con el simplex dual.
+    Devuelve (nueva_tabla, nueva_base).
+    """
+    if op not in ("<=", ">="):
+        raise ValueError("Solo se pueden agregar restricciones '<=' o '>='.")
+    signo = 1.0 if op == "<=" else -1.0
+    m, columnas = tabla.shape[0] - 1, tabla.shape[1]
+    fila = np.zeros(columnas + 1)
+    fila[:len(coeficientes)] = signo * np.asarray(coeficientes, dtype=float)
+    fila[-1] = signo * rhs
+    fila[-2] = 1.0  # holgura de la nueva restricción
+    # Anular los coeficientes de las columnas básicas restando sus filas
+    base = np.asarray(base, dtype=int)
+    cuerpo = np.insert(tabla[:-1], columnas - 1, 0.0, axis=1)
+    fila -= fila[base] @ cuerpo
+
+    nueva = np.zeros((m + 2, columnas + 1))
+    nueva[:m] = cuerpo
+    nueva[m] = fila
+    nueva[-1] = np.insert(tabla[-1], columnas - 1, 0.0)
+    return nueva, np.append(base, columnas - 1)
+
+def solicitar_problema():
+    """Pregunta el tipo de optimización, la función objetivo y las restricciones.
+    Devuelve un ProgramaLineal con c tal como se ingresó."""
+    import questionary
+
+    # 1. Solicitar tipo de optimización
+    console.print("\n[bold cyan]📋 CONFIGURACIÓN DEL PROBLEMA[/bold cyan]")
+    tipo_optimizacion = questionary.select(
+        "¿Qué tipo de optimización deseas realizar?",
+        choices=["Maximizar", "Minimizar"]
+    ).ask()
+
+    # 2. Solicitar número de variables
+    num_variables = questionary.text(
+        "¿Cuántas variables tiene tu función objetivo? (ej: 2)",
+        validate=lambda x: x.isdigit() and int(x) > 0
+    ).ask()
+    num_variables = int(num_variables)
+
+    # 3. Solicitar coeficientes de la función objetivo
+    console.print(f"\n[bold yellow]🎯 FUNCIÓN OBJETIVO ({tipo_optimizacion.upper()})[/bold yellow]")
+    c = np.empty(num_variables)
+    for i in range(num_variables):
+        coef = questionary.text(
+            f"Coeficiente de x{i+1} (puede ser negativo, ej -2.5):",
+            validate=validar_numero
+        ).ask()
+        c[i] = float(coef)
+
+    # Mostrar función objetivo
+    objetivo_str = formatear_expresion(c)
+    console.print(f"Función objetivo: {tipo_optimizacion} Z = {objetivo_str}")
+
+    # 4. Solicitar número de restricciones
+    num_restricciones = questionary.text(
+        "\n¿Cuántas restricciones tiene el problema? (ej: 3)",
+        validate=lambda x: x.isdigit() and int(x) > 0
+    ).ask()
+    num_restricciones = int(num_restricciones)
+
+    # 5. Solicitar restricciones
+    console.print(f"\n[bold yellow]📏 RESTRICCIONES[/bold yellow]")
+    A = np.empty((num_restricciones, num_variables))
+    b = np.empty(num_restricciones)
+    ops = np.empty(num_restricciones, dtype="<U2")
+    
+    for i in range(num_restricciones):
+        console.print(f"\n[bold]Restricción {i+1}:[/bold]")
+        fila = A[i]
+        for j in range(num_variables):
             coef = questionary.text(
-                f"Coeficiente de x{i+1} (puede ser negativo, ej -2.5):",
+                f"Coeficiente de x{j+1} (puede ser negativo, ej -1):",
                 validate=validar_numero
             ).ask()
-            c.append(float(coef))
+            fila[j] = float(coef)
+        # Tipo de restricción
+        op = questionary.select(
+            "Tipo de restricción:",
+            choices=["<=", ">=", "="]
+        ).ask()
+        lado_derecho = questionary.text(
+            "Lado derecho de la restricción (RHS):",
+            validate=validar_numero
+        ).ask()
+        
+        b[i] = float(lado_derecho)
+        ops[i] = op
+        
+        # Mostrar restricción
+        restriccion_str = formatear_expresion(fila)
+        console.print(f"Restricción {i+1}: {restriccion_str} {op} {lado_derecho}")
+
+    return ProgramaLineal(c, A, b, ops, tipo_optimizacion)
+
+def mostrar_iteraciones(tabla, variables_basicas, es_minimizacion=False, iterar=None, base=None,
+                        al_iterar=None):
+    """Muestra las iteraciones a medida que se calculan, pivoteando `tabla` en el
+    lugar. Se adelanta un paso para conocer el pivote que se aplica sobre la tabla
+    mostrada. `base` es la base de la tabla inicial, si se conoce.
+    al_iterar(registro) se llama por cada pivoteo una vez mostrada la tabla en la
+    que se aplica; sus tiempos incluyen 'dibujo' (sin contar la espera de Enter).
+    Devuelve (número de pivotes realizados, base final)."""
+    pasos = (iterar or iterar_simplex)(tabla, con_tabla=True, base=base)
+    paso = next(pasos)
+    i = 0
+    while paso is not None:
+        base = np.array(paso["base"])  # copia: el generador la actualiza al avanzar
+        inicio = time.perf_counter()
+        tabla_mostrar = preparar_tabla_para_mostrar(paso["tabla"])
+        tabla_mostrar = ajustar_visual_minimizacion(tabla_mostrar, es_minimizacion=es_minimizacion)
+        dibujo = time.perf_counter() - inicio
+        siguiente = next(pasos, None)
+        pivote = None
+        if siguiente is not None:
+            pivote = (siguiente["col_pivote"], siguiente["fila_pivote"], siguiente["valor_pivote"])
+        inicio = time.perf_counter()
+        show_simplex_table(tabla_mostrar, iteracion=i+1 if siguiente is not None else "FINAL",
+                           variables_basicas=variables_basicas, pivote=pivote, base=base)
+        if al_iterar is not None and siguiente is not None:
+            siguiente["tiempos"]["dibujo"] = dibujo + time.perf_counter() - inicio
+            al_iterar(siguiente)
+        if siguiente is not None:
+            console.input(f"\n[bold cyan]➡️  Presiona Enter para ver la iteración {i+2}...[/bold cyan]")
+        paso = siguiente
+        i += 1
+    return i - 1, base
+
+def simplex(al_iterar=None):
+    import questionary
 
-        # Mostrar función objetivo
-        objetivo_str = formatear_expresion(c)
-        console.print(f"Función objetivo: {tipo_optimizacion} Z = {objetivo_str}")
+    console.clear()
+    console.print(banner('Metodo Simplex'), style="bold blue")
+    console.print("Resuelve problemas de programación lineal con cualquier número de variables.", style="italic")
 
-        # 4. Solicitar número de restricciones
-        num_restricciones = questionary.text(
-            "\n¿Cuántas restricciones tiene el problema? (ej: 3)",
-            validate=lambda x: x.isdigit() and int(x) > 0
-        ).ask()
-        num_restricciones = int(num_restricciones)
+    resultado = None
+    try:
+        # 1-5. Solicitar el problema
+        programa = solicitar_problema()
+        A, b, ops = programa.A, programa.b, programa.ops
+        num_variables, num_restricciones = programa.n, programa.m
 
-        # 5. Solicitar restricciones
-        console.print(f"\n[bold yellow]📏 RESTRICCIONES[/bold yellow]")
-        A = []
-        b = []
-        ops = []
-        
-        for i in range(num_restricciones):
-            console.print(f"\n[bold]Restricción {i+1}:[/bold]")
-            fila = []
-            for j in range(num_variables):
-                coef = questionary.text(
-                    f"Coeficiente de x{j+1} (puede ser negativo, ej -1):",
-                    validate=validar_numero
-                ).ask()
-                fila.append(float(coef))
-            # Tipo de restricción
-            op = questionary.select(
-                "Tipo de restricción:",
-                choices=["<=", ">=", "="]
-            ).ask()
-            lado_derecho = questionary.text(
-                "Lado derecho de la restricción (RHS):",
-                validate=validar_numero
-            ).ask()
-            
-            A.append(fila)
-            b.append(float(lado_derecho))
-            ops.append(op)
-            
-            # Mostrar restricción
-            restriccion_str = formatear_expresion(fila)
-            console.print(f"Restricción {i+1}: {restriccion_str} {op} {lado_derecho}")
-
-        # 6. Convertir a minimización si es necesario
-        if tipo_optimizacion == "Minimizar":
-            c = [-coef for coef in c]
+        # 6. Convertir a maximización si es necesario
+        c = programa.costos_max()
+
+        exacto = questionary.confirm("¿Usar aritmética exacta (fracciones)?", default=False).ask()
+        if exacto:
+            from .Exact import (TablaExacta, construir_tabla_big_m_exacta, crear_tabla_exacta,
+                                extraer_solucion_exacta, iterar_simplex_exacto)
 
         # 7. Resolver el problema
         console.print(f"\n[bold green]🚀 RESOLVIENDO PROBLEMA...[/bold green]")
@@ -357,61 +707,45 @@ def simplex():
         # ¿Se requiere Big M?
         requiere_big_m = any(op in (">=", "=") for op in ops)
         if requiere_big_m:
-            tabla0, col_names = construir_tabla_big_m(c, A, b, ops)
-            iteraciones, solucion, valor_optimo = resolver_simplex_desde_tabla(tabla0, num_variables)
+            tabla, col_names = (construir_tabla_big_m_exacta if exacto else construir_tabla_big_m)(c, A, b, ops)
             variables_basicas = ["VB"] + col_names
         else:
-            iteraciones, solucion, valor_optimo = resolver_simplex(c, A, b)
+            tabla = (crear_tabla_exacta if exacto else crear_tabla)(c, A, b)
             # Encabezados estándar: x + holguras h + LD
             variables_basicas = ["VB"] + [f"x{i+1}" for i in range(num_variables)] + [f"h{i+1}" for i in range(num_restricciones)] + ["LD"]
+        if exacto:
+            tabla = TablaExacta(tabla)
 
-        # 8. Mostrar todas las iteraciones
-        for i, tabla in enumerate(iteraciones):
-            tabla_mostrar = preparar_tabla_para_mostrar(tabla)
-            tabla_mostrar = ajustar_visual_minimizacion(tabla_mostrar, es_minimizacion=(tipo_optimizacion == "Minimizar"))
-            show_simplex_table(tabla_mostrar, iteracion=i+1 if i < len(iteraciones)-1 else "FINAL",
-                               variables_basicas=variables_basicas)
-            if i < len(iteraciones) - 1:
-                console.input(f"\n[bold cyan]➡️  Presiona Enter para ver la iteración {i+2}...[/bold cyan]")
+        # 8. Mostrar las iteraciones a medida que se calculan
+        pivotes, base = mostrar_iteraciones(tabla, variables_basicas, es_minimizacion=programa.minimizar,
+                                            iterar=iterar_simplex_exacto if exacto else None,
+                                            al_iterar=al_iterar)
 
         # 8.1 Verificación de factibilidad cuando se usa Big M
-        if requiere_big_m:
-            final_tabla = iteraciones[-1]
-            # columnas artificiales empiezan con 'a'
-            artificial_cols = []
-            for idx, name in enumerate(variables_basicas[1:-1], start=0):
-                # variables_basicas = ["VB"] + col_names
-                # col_names incluye LD al final, ya ajustado en variables_basicas
-                if isinstance(name, str) and name.startswith('a'):
-                    artificial_cols.append(idx)
-            # Revisar si alguna artificial es básica con RHS > 0
-            infeasible = False
-            for a_idx in artificial_cols:
-                col_vec = final_tabla[:, a_idx]
-                if list(col_vec[:-1]).count(1) == 1 and list(col_vec[:-1]).count(0) == len(col_vec[:-1]) - 1:
-                    row = np.where(col_vec == 1)[0][0]
-                    rhs_val = final_tabla[row, -1]
-                    if rhs_val > 1e-8:
-                        infeasible = True
-                        break
-            if infeasible:
-                console.print("\n[bold red]❌ El problema es INFACTIBLE (variables artificiales permanecen básicas con RHS > 0).[/bold red]\nPor favor verifica que el conjunto de restricciones sea consistente.")
-                console.input("\n[bold cyan]Presiona Enter para volver al menú...[/bold cyan]")
-                return
-
-        # 9. Mostrar solución final
-        console.print("\n[bold green]✅ SOLUCIÓN ÓPTIMA ENCONTRADA[/bold green]")
-        
-        # Ajustar valor óptimo si era minimización
-        if tipo_optimizacion == "Minimizar":
-            valor_optimo = -valor_optimo
+        if requiere_big_m and es_infactible_big_m(tabla, col_names, base):
+            console.print("\n[bold red]❌ El problema es INFACTIBLE (variables artificiales permanecen básicas con RHS > 0).[/bold red]\nPor favor verifica que el conjunto de restricciones sea consistente.")
+            console.input("\n[bold cyan]Presiona Enter para volver al menú...[/bold cyan]")
+            return Resultado("infactible", base=base, iteraciones=pivotes)
+
+        # 9. Armar el resultado (valor y duales del problema original)
+        solucion = (extraer_solucion_exacta if exacto else extraer_solucion)(tabla, num_variables, base)
+        valor_optimo = tabla[-1, -1]
+        duales = calcular_duales(c, A, b, ops, base)
+        if programa.minimizar:
+            valor_optimo, duales = -valor_optimo, -duales
+        resultado = Resultado("optimo", solucion, valor_optimo, base, duales, pivotes)
 
-        solucion_str = ", ".join([f"x{i+1} = {fmt_num(solucion[i])}" for i in range(num_variables)])
+        console.print("\n[bold green]✅ SOLUCIÓN ÓPTIMA ENCONTRADA[/bold green]")
+        solucion_str = ", ".join([f"x{i+1} = {fmt_num(v)}" for i, v in enumerate(resultado.x)])
         console.print(f"[bold yellow]{solucion_str}[/bold yellow]")
-        console.print(f"[bold yellow]Valor óptimo Z* = {fmt_num(valor_optimo)}[/bold yellow]")
+        console.print(f"[bold yellow]Valor óptimo Z* = {fmt_num(resultado.objetivo)}[/bold yellow]")
 
+    except ProblemaNoAcotado as e:
+        console.print(f"\n[bold red]❌ {e}[/bold red]")
+        resultado = Resultado("no_acotado")
     except Exception as e:
         console.print(f"\n[bold red]❌ Error: {str(e)}[/bold red]")
         console.print("Verifica que todos los datos ingresados sean correctos.")
 
-    console.input("\n[bold cyan]Presiona Enter para volver al menú...[/bold cyan]")
\ No newline at end of file
+    console.input("\n[bold cyan]Presiona Enter para volver al menú...[/bold cyan]")
+    return resultado
@@ -0,0 +1,242 @@
+# TwoPhase.py
+"""
+Método de las Dos Fases.
+Fase I: maximiza -(suma de artificiales) sobre la tabla de construir_tabla_big_m
+con c = 0 y M = 1, de modo que no interviene ninguna penalización numérica.
+Si el óptimo de la fase I es negativo el problema es infactible. Las
+artificiales que quedan básicas en cero se sacan de la base con un pivoteo
+degenerado (o se elimina su fila si es redundante), se quitan sus columnas y la
+fase II continúa con el simplex sobre la tabla reducida y la función objetivo
+original.
+Con A dispersa, resolver_dos_fases_revisado hace las dos fases con el motor
+revisado (Methods/Revised.py), sin formar la tabla.
+"""
+
+import numpy as np
+
+from .Simplex import (
+    TOL_FACTIBLE,
+    _registrar_iteraciones,
+    construir_tabla_big_m,
+    extraer_solucion,
+    mostrar_iteraciones,
+    pivotear,
+    solicitar_problema,
+)
+from .Revised import TOL_PIVOTE, REFACTORIZAR_CADA, construir_problema_big_m, iterar_revisado, refactorizar
+from .modelo import Resultado, calcular_duales
+from .table_display import fmt_num
+from .errors import LimiteAlcanzado, ProblemaInfactible, ProblemaNoAcotado
+from .consola import banner, console
+
+
+def construir_tabla_fase_uno(A, b, ops):
+    """Tabla de la fase I (max -suma de artificiales) y nombres de columnas."""
+    n = len(A[0]) if len(A) else 0
+    return construir_tabla_big_m(np.zeros(n), A, b, ops, M=1.0)
+
+
+def es_infactible_fase_uno(tabla, b):
+    """True si la fase I terminó con artificiales positivas (óptimo < 0)."""
+    return tabla[-1, -1] < -TOL_FACTIBLE * max(1.0, float(np.abs(b).sum()))
+
+
+def construir_tabla_fase_dos(tabla, base, col_names, c):
+    """
+    Prepara la fase II a partir de la tabla óptima de la fase I.
+    Pivotea en el lugar sobre `tabla` para sacar de la base las artificiales que
+    quedaron en cero; si en su fila no hay otra columna con coeficiente no nulo la
+    restricción es redundante y la fila se descarta. Después quita las columnas
+    artificiales y arma la fila Z con la función objetivo original.
+    Devuelve (tabla_fase_dos, base, nombres_columnas, pivotes_extra).
+    """
+    base = np.array(base, dtype=int)
+    es_artificial = np.array([nombre.startswith("a") for nombre in col_names[:-1]])
+    pivotes_extra = []
+    filas = []
+    for fila in range(len(base)):
+        if es_artificial[base[fila]]:
+            candidatas = np.flatnonzero(~es_artificial & (np.abs(tabla[fila, :-1]) > TOL_FACTIBLE))
+            if not len(candidatas):
+                continue  # restricción redundante
+            col = int(candidatas[0])
+            pivotes_extra.append((col, fila, float(tabla[fila, col])))
+            pivotear(tabla, fila, col)
+            base[fila] = col
+        filas.append(fila)
+
+    columnas = np.append(np.flatnonzero(~es_artificial), len(col_names) - 1)
+    nueva_columna = np.full(len(col_names), -1)
+    nueva_columna[columnas] = np.arange(len(columnas))
+
+    tabla_dos = np.zeros((len(filas) + 1, len(columnas)))
+    tabla_dos[:-1] = tabla[np.ix_(filas, columnas)]
+    base_dos = nueva_columna[base[filas]]
+    tabla_dos[-1, :len(c)] = -np.asarray(c, dtype=float)
+    # Forma canónica: costos reducidos nulos en las columnas básicas
+    tabla_dos[-1] -= tabla_dos[-1, base_dos] @ tabla_dos[:-1]
+    tabla_dos[-1, base_dos] = 0.0
+    return tabla_dos, base_dos, [col_names[j] for j in columnas], pivotes_extra
+
+
+def base_en_fase_uno(base_uno, base_dos, col_names):
+    """
+    Expresa la base final de la fase II en las filas y columnas de la tabla de la
+    fase I (las de construir_tabla_big_m). base_uno es la base de la fase I tras
+    sacar las artificiales; las filas redundantes conservan su artificial.
+    """
+    es_artificial = np.array([nombre.startswith("a") for nombre in col_names[:-1]])
+    base = np.array(base_uno, dtype=int)
+    filas = np.flatnonzero(~es_artificial[base])
+    base[filas] = np.flatnonzero(~es_artificial)[base_dos]
+    return base
+
+
+def resolver_dos_fases(c, A, b, ops, punto_control_cada=0, pricing=None, max_iteraciones=None,
+                       tiempo_limite=None):
+    """
+    Resuelve max c^T x sujeto a A x (ops) b, x >= 0 con el método de las Dos Fases.
+    Devuelve (iteraciones_fase_uno, iteraciones_fase_dos, solucion_x, valor_optimo, base),
+    con las iteraciones de cada fase como HistorialPivotes (el número de pivotes
+    de cada fase es len(iteraciones) - 1) y la base final en las columnas de
+    construir_tabla_big_m (ver base_en_fase_uno). Los pivoteos que sacan artificiales
+    degeneradas de la base cuentan en la fase I. pricing y los límites se aplican
+    a cada fase (ver Simplex.resolver_simplex); si la fase II se detiene por un
+    límite, iteraciones_fase_dos.estado lo indica y la solución es parcial.
+    Lanza ProblemaInfactible, ProblemaNoAcotado o LimiteAlcanzado (si el límite
+    se alcanza en la fase I, cuando aún no hay una solución factible).
+    """
+    opciones = dict(pricing=pricing, max_iteraciones=max_iteraciones, tiempo_limite=tiempo_limite)
+    tabla, col_names = construir_tabla_fase_uno(A, b, ops)
+    fase_uno = _registrar_iteraciones(tabla, punto_control_cada, **opciones)
+    if fase_uno.estado != "optimo":
+        raise LimiteAlcanzado(fase_uno.estado)
+    if es_infactible_fase_uno(tabla, b):
+        raise ProblemaInfactible()
+    tabla_dos, base_dos, _, pivotes_extra = construir_tabla_fase_dos(
+        tabla, fase_uno.base(), col_names, c)
+    for pivote in pivotes_extra:
+        fase_uno.registrar(*pivote)
+
+    fase_dos = _registrar_iteraciones(tabla_dos, punto_control_cada, base_inicial=base_dos, **opciones)
+    base = fase_dos.base()
+    return (fase_uno, fase_dos, extraer_solucion(tabla_dos, len(c), base), tabla_dos[-1, -1],
+            base_en_fase_uno(fase_uno.base(), base, col_names))
+
+
+def _sacar_artificiales_revisado(problema, base, fila_inicial, es_artificial):
+    """
+    Versión revisada de construir_tabla_fase_dos: pivotea en el lugar sobre `base`
+    para sacar las artificiales que quedaron básicas en cero. La fila de B^-1 A de
+    cada una se obtiene con un btran; entra la columna no artificial de mayor
+    coeficiente. Si no hay ninguna, la restricción es redundante y la artificial
+    queda básica (en cero). Devuelve los pivotes realizados.
+    """
+    fact, fila_fact = refactorizar(problema, base, fila_inicial)
+    pivotes = []
+    for pos in np.flatnonzero(es_artificial[base]):
+        q = fila_fact[pos]
+        unitario = np.zeros(problema.m)
+        unitario[q] = 1.0
+        fila = problema.costos_reducidos(fact.btran(unitario)) + problema.costo
+        fila[es_artificial] = 0.0
+        fila[base] = 0.0
+        col = int(np.argmax(np.abs(fila)))
+        if abs(fila[col]) <= TOL_PIVOTE:
+            continue  # restricción redundante
+        alpha = fact.ftran(problema.columna(col))
+        fact.agregar_eta(q, alpha)
+        pivotes.append((col, int(pos), float(alpha[q])))
+        base[pos] = col
+    return pivotes
+
+
+def resolver_dos_fases_revisado(c, A, b, ops, refactorizar_cada=REFACTORIZAR_CADA):
+    """
+    Dos Fases con el motor revisado; A puede ser densa o dispersa y se mantiene
+    así. La fase I maximiza -(suma de artificiales) sobre construir_problema_big_m
+    con c = 0 y M = 1; la fase II cambia los costos por c, continúa desde la base
+    de la fase I y no deja entrar a las artificiales.
+    Devuelve (pivotes_fase_uno, pivotes_fase_dos, solucion_x, valor_optimo, base)
+    como resolver_dos_fases, con los pivotes como listas (ver
+    Revised.iterar_revisado). Lanza ProblemaInfactible o ProblemaNoAcotado.
+    """
+    c = np.asarray(c, dtype=float)
+    n = len(c)
+    problema, base_inicial, col_names = construir_problema_big_m(np.zeros(n), A, b, ops, M=1.0)
+    pivotes_uno, base, xB = iterar_revisado(problema, base_inicial, refactorizar_cada)
+    if problema.costo[base] @ xB < -TOL_FACTIBLE * max(1.0, float(np.abs(b).sum())):
+        raise ProblemaInfactible()
+
+    es_artificial = np.array([nombre.startswith("a") for nombre in col_names[:-1]])
+    fila_inicial = np.full(len(problema.costo), -1)
+    fila_inicial[base_inicial] = np.arange(problema.m)
+    pivotes_uno += _sacar_artificiales_revisado(problema, base, fila_inicial, es_artificial)
+
+    problema.costo = np.zeros(len(problema.costo))
+    problema.costo[:n] = c
+    pivotes_dos, base, xB = iterar_revisado(problema, base_inicial, refactorizar_cada, base=base,
+                                            bloqueadas=es_artificial)
+    solucion = np.zeros(n)
+    originales = base < n
+    solucion[base[originales]] = xB[originales]
+    return pivotes_uno, pivotes_dos, solucion, float(c[base[originales]] @ xB[originales]), base
+
+
+def dos_fases(al_iterar=None):
+    console.clear()
+    console.print(banner('Dos Fases'), style="bold blue")
+    console.print("Resuelve problemas con restricciones '<=', '>=' y '=' sin penalización Big M.", style="italic")
+
+    resultado = None
+    try:
+        programa = solicitar_problema()
+        c, A, b, ops = programa.costos_max(), programa.A, programa.b, programa.ops
+        num_variables = programa.n
+        es_minimizacion = programa.minimizar
+
+        # Fase I
+        console.print("\n[bold green]🚀 FASE I: minimizar la suma de variables artificiales[/bold green]")
+        console.input("Presiona Enter para comenzar...")
+        tabla, col_names = construir_tabla_fase_uno(A, b, ops)
+        pivotes_uno, base_uno = mostrar_iteraciones(tabla, ["VB"] + col_names, al_iterar=al_iterar)
+
+        if es_infactible_fase_uno(tabla, b):
+            console.print(f"\n[bold red]❌ El problema es INFACTIBLE (la fase I terminó con W = {fmt_num(-tabla[-1, -1])} > 0).[/bold red]\nPor favor verifica que el conjunto de restricciones sea consistente.")
+            console.input("\n[bold cyan]Presiona Enter para volver al menú...[/bold cyan]")
+            return Resultado("infactible", iteraciones=pivotes_uno)
+
+        tabla_dos, base_dos, col_names_dos, pivotes_extra = construir_tabla_fase_dos(
+            tabla, base_uno, col_names, c)
+        pivotes_uno += len(pivotes_extra)
+        for col, fila, _ in pivotes_extra:
+            base_uno[fila] = col
+
+        # Fase II
+        console.print(f"\n[bold green]🚀 FASE II: función objetivo original[/bold green] (fase I: {pivotes_uno} iteraciones)")
+        console.input("Presiona Enter para continuar...")
+        pivotes_dos, base_dos = mostrar_iteraciones(tabla_dos, ["VB"] + col_names_dos, es_minimizacion,
+                                                    base=base_dos, al_iterar=al_iterar)
+
+        base = base_en_fase_uno(base_uno, base_dos, col_names)
+        duales = calcular_duales(c, A, b, ops, base)
+        valor_optimo = tabla_dos[-1, -1]
+        resultado = Resultado("optimo", extraer_solucion(tabla_dos, num_variables, base_dos),
+                              -valor_optimo if es_minimizacion else valor_optimo, base,
+                              -duales if es_minimizacion else duales, pivotes_uno + pivotes_dos)
+
+        console.print("\n[bold green]✅ SOLUCIÓN ÓPTIMA ENCONTRADA[/bold green]")
+        solucion_str = ", ".join([f"x{i+1} = {fmt_num(v)}" for i, v in enumerate(resultado.x)])
+        console.print(f"[bold yellow]{solucion_str}[/bold yellow]")
+        console.print(f"[bold yellow]Valor óptimo Z* = {fmt_num(resultado.objetivo)}[/bold yellow]")
+        console.print(f"Iteraciones: fase I = {pivotes_uno}, fase II = {pivotes_dos}")
+
+    except ProblemaNoAcotado as e:
+        console.print(f"\n[bold red]❌ {e}[/bold red]")
+        resultado = Resultado("no_acotado")
+    except Exception as e:
+        console.print(f"\n[bold red]❌ Error: {str(e)}[/bold red]")
+        console.print("Verifica que todos los datos ingresados sean correctos.")
+
+    console.input("\n[bold cyan]Presiona Enter para volver al menú...[/bold cyan]")
+    return resultado
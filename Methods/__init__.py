@@ -1,2 +1,4 @@
 # Paquete Methods
 # Contiene implementaciones de Simplex, Big M, y Dos Fases, además de utilidades de visualización.
+# Importar cualquiera de sus módulos no crea la consola ni carga rich, pyfiglet,
+# questionary ni matplotlib: eso ocurre al usar los menús (ver consola.py).
@@ -0,0 +1,423 @@
+# batch.py
+"""
+Resolución por lotes, sin menús ni preguntas interactivas.
+Lee problemas desde archivos JSON, CSV o NPZ, los resuelve con el método
+indicado y escribe una línea JSON por problema (formato legible por máquina).
+
+Formatos de entrada (max/min c^T x sujeto a A x (ops) b, x >= 0):
+- JSON: {"sentido": "max"|"min", "c": [...], "A": [[...], ...], "b": [...],
+         "ops": ["<=", ">=", "=", ...]}. "ops" es opcional (todas '<=');
+         "no_negatividad": false deja las variables libres.
+- CSV:  primera fila "max,c1,c2,..." (o "min"); cada fila siguiente
+        "a1,a2,...,op,b".
+- NPZ:  arreglos c, A, b y opcionalmente ops y sentido.
+- MPS libre y CPLEX LP (ver model_reader.py); A se mantiene dispersa y se
+  resuelve con el motor revisado (también Dos Fases).
+
+Para lotes grandes, resolver_lote reparte los problemas en un pool de procesos.
+Con el método gráfico, graficos=<directorio> guarda además la región factible
+de cada problema como imagen (ver render.py); cada proceso reutiliza su figura.
+"""
+
+import csv
+import glob
+import json
+import math
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+import numpy as np
+
+from .Simplex import (
+    construir_tabla_big_m,
+    es_infactible_big_m,
+    resolver_simplex,
+    resolver_simplex_desde_tabla,
+)
+from .Revised import resolver_big_m_revisado
+from .errors import LimiteAlcanzado, ProblemaInfactible, ProblemaNoAcotado
+from .model_reader import leer_modelo
+from .modelo import ProgramaLineal, Resultado, calcular_duales
+from .presolve import presolve as aplicar_presolve
+from .scaling import escalar
+from .sparse import es_dispersa
+
+EXTENSIONES = (".json", ".csv", ".npz", ".mps", ".lp")
+
+
+def normalizar_problema(datos):
+    """Convierte un diccionario con c, A, b, ops y sentido en un ProgramaLineal
+    validado (ver Methods/modelo.py); un ProgramaLineal se devuelve tal cual."""
+    if isinstance(datos, ProgramaLineal):
+        return datos
+    return ProgramaLineal.desde_diccionario(datos)
+
+
+def _leer_csv(ruta):
+    with open(ruta, newline="", encoding="utf-8") as f:
+        filas = [fila for fila in csv.reader(f) if fila and any(celda.strip() for celda in fila)]
+    sentido, *c = filas[0]
+    A = [[float(v) for v in fila[:-2]] for fila in filas[1:]]
+    ops = [fila[-2] for fila in filas[1:]]
+    b = [float(fila[-1]) for fila in filas[1:]]
+    return {"sentido": sentido, "c": [float(v) for v in c], "A": A, "b": b, "ops": ops}
+
+
+def _leer_npz(ruta):
+    with np.load(ruta, allow_pickle=False) as datos:
+        problema = {clave: datos[clave] for clave in ("c", "A", "b")}
+        if "ops" in datos:
+            problema["ops"] = [str(op) for op in datos["ops"]]
+        if "sentido" in datos:
+            problema["sentido"] = str(datos["sentido"])
+    return problema
+
+
+def cargar_problema(ruta):
+    """Lee un problema desde un archivo .json, .csv, .npz, .mps o .lp."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".json":
+        with open(ruta, encoding="utf-8") as f:
+            datos = json.load(f)
+    elif extension == ".csv":
+        datos = _leer_csv(ruta)
+    elif extension == ".npz":
+        datos = _leer_npz(ruta)
+    elif extension in (".mps", ".lp"):
+        datos = leer_modelo(ruta)
+    else:
+        raise ValueError(f"Formato no soportado: {extension}")
+    return normalizar_problema(datos)
+
+
+def _resolver_big_m(c, A, b, ops, pricing=None, max_iteraciones=None):
+    if es_dispersa(A):
+        if pricing not in (None, "dantzig"):
+            raise ValueError("El motor revisado solo admite la regla de Dantzig.")
+        if max_iteraciones is not None:
+            raise ValueError("El límite de iteraciones solo aplica al motor de tabla.")
+        pivotes, solucion, valor, factible, base = resolver_big_m_revisado(c, A, b, ops)
+        if not factible:
+            return "infactible", None, None, len(pivotes), None
+        return "optimo", solucion, valor, len(pivotes), base
+    tabla0, col_names = construir_tabla_big_m(c, A, b, ops)
+    iteraciones, solucion, valor = resolver_simplex_desde_tabla(
+        tabla0, len(c), pricing=pricing, max_iteraciones=max_iteraciones)
+    base = iteraciones.base()
+    if iteraciones.estado != "optimo":
+        return iteraciones.estado, solucion, valor, len(iteraciones) - 1, base
+    if es_infactible_big_m(iteraciones.final, col_names, base):
+        return "infactible", None, None, len(iteraciones) - 1, None
+    return "optimo", solucion, valor, len(iteraciones) - 1, base
+
+
+def _resolver_dos_fases(c, A, b, ops, pricing=None, max_iteraciones=None):
+    from .TwoPhase import resolver_dos_fases, resolver_dos_fases_revisado
+
+    if es_dispersa(A):
+        if pricing not in (None, "dantzig"):
+            raise ValueError("El motor revisado solo admite la regla de Dantzig.")
+        if max_iteraciones is not None:
+            raise ValueError("El límite de iteraciones solo aplica al motor de tabla.")
+        try:
+            pivotes_uno, pivotes_dos, solucion, valor, base = resolver_dos_fases_revisado(c, A, b, ops)
+        except ProblemaInfactible:
+            return "infactible", None, None, None, None
+        return "optimo", solucion, valor, len(pivotes_uno) + len(pivotes_dos), base
+    try:
+        fase_uno, fase_dos, solucion, valor, base = resolver_dos_fases(
+            c, A, b, ops, pricing=pricing, max_iteraciones=max_iteraciones)
+    except ProblemaInfactible:
+        return "infactible", None, None, None, None
+    except LimiteAlcanzado as e:
+        return e.estado, None, None, None, None
+    return fase_dos.estado, solucion, valor, (len(fase_uno) - 1) + (len(fase_dos) - 1), base
+
+
+def _resolver_grafico(problema):
+    from .Graphic import resolver_grafico
+
+    if problema.n != 2:
+        raise ValueError("El método gráfico solo admite 2 variables.")
+    if es_dispersa(problema.A):
+        problema = problema.con_datos(problema.c, problema.A.toarray(), problema.b, problema.ops)
+    return resolver_grafico(problema)[0]
+
+
+def resolver_problema(problema, metodo="simplex", pricing=None, max_iteraciones=None):
+    """Resuelve un ProgramaLineal (o un diccionario, ver normalizar_problema) con
+    'simplex', 'twophase', 'bigm' o 'graphic'.
+    Con 'simplex', las restricciones '>=' o '=' se resuelven con Dos Fases (con el
+    motor revisado si A es dispersa). pricing es la regla de columna entrante
+    (ver Methods/pricing.py). Devuelve un Resultado con estado 'optimo',
+    'infactible' o 'no_acotado'; si se alcanza max_iteraciones (por fase),
+    'limite_iteraciones' con la última solución factible conocida. Si el óptimo
+    se alcanza con un método de tabla, el resultado trae la base y los duales.
+    El objetivo incluye la constante del problema. Sin no_negatividad, los
+    métodos de tabla resuelven el problema con las variables divididas (ver
+    ProgramaLineal.con_variables_divididas) y la base no se informa."""
+    inicio = time.perf_counter()
+    problema = normalizar_problema(problema)
+    if metodo == "graphic":
+        resultado = _resolver_grafico(problema)
+        if resultado.objetivo is not None:
+            resultado.objetivo += problema.constante
+        resultado.tiempos["resolver"] = time.perf_counter() - inicio
+        return resultado
+
+    num_vars = None if problema.no_negatividad else problema.n
+    problema = problema.con_variables_divididas()
+    c = problema.costos_max()
+    A, b, ops = problema.A, problema.b, problema.ops
+    try:
+        if metodo == "simplex" and (ops == "<=").all() and (b >= 0).all():
+            iteraciones, solucion, valor = resolver_simplex(c, A, b, pricing=pricing,
+                                                            max_iteraciones=max_iteraciones)
+            estado, num_iteraciones, base = iteraciones.estado, len(iteraciones) - 1, iteraciones.base()
+        elif metodo in ("simplex", "twophase"):
+            estado, solucion, valor, num_iteraciones, base = _resolver_dos_fases(
+                c, A, b, ops, pricing, max_iteraciones)
+        elif metodo == "bigm":
+            estado, solucion, valor, num_iteraciones, base = _resolver_big_m(
+                c, A, b, ops, pricing, max_iteraciones)
+        else:
+            raise ValueError(f"Método desconocido: {metodo}")
+    except ProblemaNoAcotado:
+        estado, solucion, valor, num_iteraciones, base = "no_acotado", None, None, None, None
+    duales = None
+    if estado == "optimo" and base is not None:
+        duales = calcular_duales(c, A, b, ops, base)
+    if problema.minimizar:
+        valor = None if valor is None else -valor
+        duales = None if duales is None else -duales
+    if valor is not None:
+        valor += problema.constante
+    if num_vars is not None:
+        solucion = None if solucion is None else solucion[:num_vars] - solucion[num_vars:]
+        base = None
+    return Resultado(estado, solucion, valor, base, duales, num_iteraciones,
+                     {"resolver": time.perf_counter() - inicio})
+
+
+def resolver_problema_preprocesado(problema, metodo="simplex", pricing=None, max_iteraciones=None,
+                                   presolve=False, escalado=None):
+    """Como resolver_problema, pero antes reduce el problema con presolve (ver
+    Methods/presolve.py) y/o lo escala (escalado: 'geometrica' o 'equilibrio', ver
+    Methods/scaling.py); la solución y los duales se llevan de vuelta al problema
+    original. resultado.informe tiene las claves 'presolve' y 'escalado' con el
+    resumen de cada etapa aplicada (None si el propio presolve decidió que el
+    problema es infactible o no acotado). Con presolve, la base y los duales son
+    los del problema reducido y no se informan. Presolve supone x >= 0."""
+    if metodo == "graphic":
+        raise ValueError("El método gráfico no admite presolve ni escalado.")
+    problema = normalizar_problema(problema)
+    if presolve and not problema.no_negatividad:
+        raise ValueError("Presolve solo admite problemas con no negatividad.")
+    informe, tiempos = {}, {}
+    c, A, b, ops = problema.c, problema.A, problema.b, problema.ops
+    registro = escala = None
+    if presolve:
+        try:
+            c, A, b, ops, registro = aplicar_presolve(c, A, b, ops, problema.minimizar)
+        except ProblemaInfactible:
+            return Resultado("infactible", informe={"presolve": None})
+        except ProblemaNoAcotado:
+            return Resultado("no_acotado", informe={"presolve": None})
+        informe["presolve"] = registro.resumen()
+        tiempos["presolve"] = registro.tiempo
+    if len(c) == 0:
+        resultado = Resultado("optimo", np.zeros(0), problema.constante, iteraciones=0)
+    else:
+        if escalado:
+            c, A, b, escala = escalar(c, A, b, escalado)
+            informe["escalado"] = escala.resumen()
+            tiempos["escalado"] = escala.tiempo
+        resultado = resolver_problema(problema.con_datos(c, A, b, ops), metodo, pricing, max_iteraciones)
+    if resultado.x is not None:
+        if escala is not None:
+            resultado.x, resultado.objetivo = escala.desescalar(resultado.x, resultado.objetivo)
+            if resultado.duales is not None:
+                resultado.duales = escala.desescalar_duales(resultado.duales)
+        if registro is not None:
+            resultado.x, resultado.objetivo = registro.postsolve(resultado.x, resultado.objetivo)
+    if registro is not None:
+        resultado.base = resultado.duales = None
+    resultado.informe = informe
+    resultado.tiempos.update(tiempos)
+    return resultado
+
+
+def expandir_rutas(entradas):
+    """Expande archivos, directorios y patrones glob a una lista ordenada de archivos."""
+    rutas = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            rutas += sorted(os.path.join(entrada, nombre) for nombre in os.listdir(entrada)
+                            if nombre.lower().endswith(EXTENSIONES))
+        elif glob.has_magic(entrada):
+            rutas += sorted(glob.glob(entrada, recursive=True))
+        else:
+            rutas.append(entrada)
+    return rutas
+
+
+@contextmanager
+def _limite_tiempo(segundos):
+    """Interrumpe el bloque con TimeoutError si tarda más de `segundos`.
+    Usa SIGALRM, por lo que solo actúa en el hilo principal de sistemas POSIX."""
+    if (not segundos or not hasattr(signal, "SIGALRM")
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+
+    def _alarma(signum, frame):
+        raise TimeoutError(f"Se superó el tiempo límite de {segundos} s.")
+
+    anterior = signal.signal(signal.SIGALRM, _alarma)
+    signal.setitimer(signal.ITIMER_REAL, segundos)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, anterior)
+
+
+def ruta_grafico(directorio, indice, entrada, formato="png"):
+    """Archivo del gráfico de una entrada: el nombre del archivo de entrada con la
+    extensión del formato agregada (modelo.json -> modelo.json.png), o
+    problema_<indice> si la entrada es un diccionario."""
+    if isinstance(entrada, (str, os.PathLike)):
+        nombre = os.path.basename(os.fspath(entrada))
+    else:
+        nombre = f"problema_{indice}"
+    return os.path.join(directorio, f"{nombre}.{formato}")
+
+
+def resolver_entrada(entrada, metodo="simplex", tiempo_limite=None, pricing=None,
+                     max_iteraciones=None, presolve=False, escalado=None, grafico=None):
+    """Carga (si es una ruta) o normaliza (si es un diccionario) un problema y lo
+    resuelve. Nunca lanza excepciones: los errores y el tiempo agotado se
+    informan en el resultado con estado 'error' o 'tiempo_agotado'. Con presolve o
+    escalado el resultado incluye las claves 'presolve' y/o 'escalado' (ver
+    resolver_problema_preprocesado). grafico es la ruta del archivo en el que se
+    guarda la región factible (solo método gráfico); el resultado la informa en
+    la clave 'grafico'."""
+    inicio = time.perf_counter()
+    resultado = {"metodo": metodo}
+    if pricing is not None:
+        resultado["pricing"] = pricing
+    try:
+        with _limite_tiempo(tiempo_limite):
+            if isinstance(entrada, (str, os.PathLike)):
+                problema = cargar_problema(os.fspath(entrada))
+            else:
+                problema = normalizar_problema(entrada)
+            if presolve or escalado:
+                resuelto = resolver_problema_preprocesado(problema, metodo, pricing, max_iteraciones,
+                                                          presolve, escalado)
+            else:
+                resuelto = resolver_problema(problema, metodo, pricing, max_iteraciones)
+            if grafico is not None:
+                from .render import guardar_grafico
+                guardar_grafico(grafico, problema, resuelto)
+        resultado.update(resuelto.a_diccionario())
+        if grafico is not None:
+            resultado["grafico"] = grafico
+    except TimeoutError as e:
+        resultado.update({"estado": "tiempo_agotado", "mensaje": str(e)})
+    except Exception as e:
+        resultado.update({"estado": "error", "mensaje": str(e)})
+    resultado["tiempo"] = time.perf_counter() - inicio
+    return resultado
+
+
+def _resolver_bloque(bloque, metodo, tiempo_limite, pricing=None, max_iteraciones=None,
+                     presolve=False, escalado=None, graficos=None, formato_grafico="png"):
+    """Tarea de un proceso del pool: resuelve un bloque de (indice, entrada)."""
+    return [dict(resolver_entrada(entrada, metodo, tiempo_limite, pricing, max_iteraciones,
+                                  presolve, escalado,
+                                  graficos and ruta_grafico(graficos, indice, entrada, formato_grafico)),
+                 indice=indice)
+            for indice, entrada in bloque]
+
+
+def resolver_lote(entradas, metodo="simplex", procesos=None, tamano_bloque=None,
+                  tiempo_limite=None, en_orden=True, pricing=None, max_iteraciones=None,
+                  presolve=False, escalado=None, graficos=None, formato_grafico="png"):
+    """Resuelve muchos problemas independientes repartidos en un pool de procesos.
+
+    entradas: rutas de archivo o diccionarios de problema (c, A, b, ops, sentido).
+    procesos: número de procesos (por defecto, uno por CPU); con 1 se resuelve en
+    el proceso actual.
+    tamano_bloque: problemas por tarea enviada al pool; agrupar amortiza el costo
+    de serializar. Por defecto se reparten unos 4 bloques por proceso.
+    tiempo_limite: segundos por problema; si se superan el resultado queda con
+    estado 'tiempo_agotado' y se sigue con el siguiente.
+    en_orden: si es True los resultados salen en el orden de entrada; si no, a
+    medida que terminan los bloques.
+    pricing: regla de columna entrante (nombre de Methods/pricing.py).
+    max_iteraciones: pivoteos máximos por problema (por fase en Dos Fases).
+    presolve: reducir cada problema antes de resolverlo (ver Methods/presolve.py).
+    escalado: 'geometrica' o 'equilibrio' para escalar cada problema (ver Methods/scaling.py).
+    graficos: directorio donde guardar el gráfico de cada problema (solo método
+    gráfico), en formato_grafico ('png', 'svg' o 'pdf'; ver ruta_grafico).
+    Genera diccionarios de resultado con la clave 'indice' (posición en entradas).
+    """
+    tareas = list(enumerate(entradas))
+    procesos = procesos or os.cpu_count() or 1
+    if graficos is not None:
+        if metodo != "graphic":
+            raise ValueError("Solo el método gráfico guarda gráficos.")
+        os.makedirs(graficos, exist_ok=True)
+    if procesos == 1 or len(tareas) <= 1:
+        yield from _resolver_bloque(tareas, metodo, tiempo_limite, pricing, max_iteraciones,
+                                    presolve, escalado, graficos, formato_grafico)
+        return
+
+    if tamano_bloque is None:
+        tamano_bloque = max(1, math.ceil(len(tareas) / (procesos * 4)))
+    bloques = [tareas[k:k + tamano_bloque] for k in range(0, len(tareas), tamano_bloque)]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [pool.submit(_resolver_bloque, bloque, metodo, tiempo_limite, pricing,
+                               max_iteraciones, presolve, escalado, graficos, formato_grafico)
+                   for bloque in bloques]
+        for futuro in (futuros if en_orden else as_completed(futuros)):
+            yield from futuro.result()
+
+
+def resolver_archivos(entradas, metodo="simplex", salida=None, procesos=1, tiempo_limite=None,
+                      pricing=None, max_iteraciones=None, presolve=False, escalado=None,
+                      graficos=None, formato_grafico="png"):
+    """Resuelve todos los problemas indicados y escribe una línea JSON por problema
+    en `salida` (un archivo abierto; por defecto la salida estándar), en el orden
+    de los archivos. Con procesos != 1 los reparte en un pool de procesos (ver
+    resolver_lote). pricing puede ser una regla o una lista de reglas; con una
+    lista cada archivo se resuelve una vez por regla (para comparar iteraciones y
+    tiempo). escalado también puede ser una lista (None = sin escalar) para comparar
+    las iteraciones con y sin escalado; cada línea indica entonces 'escalado'.
+    graficos y formato_grafico: ver resolver_lote.
+    Devuelve el número de problemas que no se pudieron resolver."""
+    salida = salida or sys.stdout
+    rutas = expandir_rutas(entradas)
+    reglas = pricing if isinstance(pricing, (list, tuple)) else [pricing]
+    comparar_escalado = isinstance(escalado, (list, tuple))
+    escalados = escalado if comparar_escalado else [escalado]
+    errores = 0
+    for regla in reglas:
+        for metodo_escalado in escalados:
+            for resultado in resolver_lote(rutas, metodo, procesos, tiempo_limite=tiempo_limite,
+                                           pricing=regla, max_iteraciones=max_iteraciones,
+                                           presolve=presolve, escalado=metodo_escalado,
+                                           graficos=graficos, formato_grafico=formato_grafico):
+                resultado = {"archivo": rutas[resultado.pop("indice")], **resultado}
+                if comparar_escalado:
+                    resultado.setdefault("escalado", None)
+                if resultado["estado"] in ("error", "tiempo_agotado"):
+                    errores += 1
+                salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+    return errores
@@ -0,0 +1,406 @@
+# benchmark.py
+"""
+Banco de pruebas de rendimiento con familias de problemas generados.
+
+Generadores (ver FAMILIAS), todos deterministas a partir de una semilla y con
+óptimo finito:
+- "denso": A densa positiva, restricciones '<=' con b > 0.
+- "disperso": como el denso pero con A dispersa (Methods/sparse.py), ~5% de no nulos.
+- "klee_minty": el cubo de Klee-Minty de dimensión n, en el que la regla de
+  Dantzig recorre los 2^n vértices.
+- "degenerado": mitad de las filas con b = 0 y coeficientes de ambos signos, de
+  modo que el origen es un vértice muy degenerado y hay empates en la razón.
+- "transporte": k orígenes y k destinos (min costo, oferta '<=', demanda '>=').
+- "big_m_mixto": mezcla de '<=', '>=' y '=' construida alrededor de un punto factible.
+
+Casos medidos (ver CASOS): resolver_simplex y resolver_simplex_desde_tabla (tabla
+de construir_tabla_big_m), ambos con el motor de tabla NumPy; el ciclo de pivoteo
+del menú Big M (BigM.iterar_big_m sobre la tabla NumPy de preparar_big_m, con la
+fila Z primero); la región factible y el óptimo del método gráfico
+(geometria.region_factible y optimizar) y el gráfico guardado en PNG
+(render.Lienzo, sobre la misma figura en cada repetición).
+Solo se mide la resolución; la construcción del problema y de la tabla queda
+fuera del tiempo. El caso "arranque" mide aparte el tiempo de importar cada
+módulo de ARRANQUE en un intérprete nuevo (medir_arranque).
+
+Los resultados se guardan en JSON (ejecutar_suite / guardar) para comparar dos
+commits con comparar(), que marca como regresión todo caso cuya mediana crezca
+más que el umbral.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from .modelo import ProgramaLineal
+from .sparse import MatrizDispersa
+
+VERSION = 1
+
+
+def generar_denso(m, n=None, semilla=0):
+    """m restricciones '<=' densas sobre n variables (n = m si no se da)."""
+    rng = np.random.default_rng(semilla)
+    n = m if n is None else n
+    A = rng.uniform(1.0, 10.0, (m, n))
+    b = rng.uniform(10.0, 100.0, m) * n
+    c = rng.uniform(1.0, 10.0, n)
+    return ProgramaLineal(c, A, b)
+
+
+def generar_disperso(m, n=None, semilla=0, densidad=0.05):
+    """m restricciones '<=' sobre n = 2m variables con A dispersa; cada columna
+    tiene al menos un no nulo para que el problema sea acotado."""
+    rng = np.random.default_rng(semilla)
+    n = 2 * m if n is None else n
+    nnz = max(int(densidad * m * n), n)
+    filas = np.concatenate((rng.integers(0, m, n), rng.integers(0, m, nnz - n)))
+    columnas = np.concatenate((np.arange(n), rng.integers(0, n, nnz - n)))
+    valores = rng.uniform(1.0, 10.0, nnz)
+    A = MatrizDispersa.desde_coo(filas, columnas, valores, (m, n))
+    b = rng.uniform(10.0, 100.0, m)
+    c = rng.uniform(1.0, 10.0, n)
+    return ProgramaLineal(c, A, b)
+
+
+def generar_klee_minty(n, semilla=0):
+    """max sum 2^(n-j) x_j con sum_{j<i} 2^(i-j+1) x_j + x_i <= 5^i (i, j desde 1)."""
+    i, j = np.indices((n, n))
+    A = np.where(j < i, 2.0 ** (i - j + 1), 0.0) + np.eye(n)
+    b = 5.0 ** np.arange(1, n + 1)
+    c = 2.0 ** np.arange(n - 1, -1, -1)
+    return ProgramaLineal(c, A, b)
+
+
+def generar_degenerado(m, n=None, semilla=0):
+    """La mitad de las filas pasa por el origen (b = 0, coeficientes de ambos
+    signos); el resto acota la región con coeficientes positivos."""
+    rng = np.random.default_rng(semilla)
+    n = m if n is None else n
+    m_cero = m // 2
+    A = np.vstack((rng.integers(-3, 4, (m_cero, n)).astype(float),
+                   rng.uniform(1.0, 10.0, (m - m_cero, n))))
+    b = np.concatenate((np.zeros(m_cero), rng.uniform(10.0, 100.0, m - m_cero) * n))
+    c = rng.uniform(1.0, 10.0, n)
+    return ProgramaLineal(c, A, b)
+
+
+def generar_transporte(k, semilla=0):
+    """Transporte de k orígenes a k destinos: min sum c_ij x_ij con oferta
+    sum_j x_ij <= s_i y demanda sum_i x_ij >= d_j (la oferta total alcanza)."""
+    rng = np.random.default_rng(semilla)
+    demanda = rng.integers(10, 50, k).astype(float)
+    oferta = demanda.sum() / k * rng.uniform(1.1, 1.5, k)
+    identidad = np.eye(k)
+    A = np.vstack((np.kron(identidad, np.ones(k)), np.kron(np.ones(k), identidad)))
+    b = np.concatenate((oferta, demanda))
+    ops = ["<="] * k + [">="] * k
+    c = rng.integers(1, 20, k * k).astype(float)
+    return ProgramaLineal(c, A, b, ops, "min")
+
+
+def generar_big_m_mixto(m, n=None, semilla=0):
+    """m restricciones '<=', '>=' y '=' que cumple un punto x0 >= 0, más una fila
+    sum x <= U que acota la región."""
+    rng = np.random.default_rng(semilla)
+    n = m if n is None else n
+    x0 = rng.uniform(0.0, 5.0, n)
+    A = rng.uniform(-2.0, 8.0, (m, n))
+    ops = rng.choice(["<=", ">=", "="], m, p=[0.5, 0.35, 0.15])
+    holgura = rng.uniform(1.0, 10.0, m)
+    b = A @ x0 + np.select([ops == "<=", ops == ">="], [holgura, -holgura], 0.0)
+    A = np.vstack((A, np.ones(n)))
+    b = np.append(b, 10.0 * x0.sum() + 10.0)
+    ops = np.append(ops, "<=")
+    c = rng.uniform(-2.0, 10.0, n)
+    return ProgramaLineal(c, A, b, ops)
+
+
+FAMILIAS = {
+    "denso": generar_denso,
+    "disperso": generar_disperso,
+    "klee_minty": generar_klee_minty,
+    "degenerado": generar_degenerado,
+    "transporte": generar_transporte,
+    "big_m_mixto": generar_big_m_mixto,
+}
+
+
+def _densa(A):
+    return A.toarray() if hasattr(A, "toarray") else A
+
+
+def _caso_resolver_simplex(programa):
+    from .Simplex import resolver_simplex
+
+    if (programa.ops != "<=").any() or (programa.b < 0).any():
+        raise ValueError("resolver_simplex solo admite restricciones '<=' con b >= 0.")
+    c = programa.costos_max()
+
+    def ejecutar(_):
+        iteraciones, _, valor = resolver_simplex(c, programa.A, programa.b)
+        return len(iteraciones) - 1, valor
+    return lambda: None, ejecutar
+
+
+def _caso_resolver_simplex_desde_tabla(programa):
+    from .Simplex import construir_tabla_big_m, resolver_simplex_desde_tabla
+
+    tabla, _ = construir_tabla_big_m(programa.costos_max(), _densa(programa.A), programa.b, programa.ops)
+
+    def ejecutar(_):
+        iteraciones, _, valor = resolver_simplex_desde_tabla(tabla, programa.n)
+        return len(iteraciones) - 1, valor
+    return lambda: None, ejecutar
+
+
+def _caso_big_m(programa):
+    from .BigM import iterar_big_m, preparar_big_m
+
+    programa = programa.con_datos(programa.c, _densa(programa.A), programa.b, programa.ops)
+    tableau, var_names, base, _ = preparar_big_m(programa)
+
+    def preparar():
+        return tableau.copy(), base.copy()
+
+    def ejecutar(datos):
+        tabla, base_actual = datos
+        pivoteos = 0
+        for pivoteos, _, _ in iterar_big_m(tabla, var_names, base_actual):
+            pass
+        return pivoteos, tabla[0][-1]
+    return preparar, ejecutar
+
+
+def _caso_grafico(programa):
+    from .Graphic import restricciones_de
+    from .geometria import optimizar, region_factible
+
+    restricciones = restricciones_de(programa)
+
+    def ejecutar(_):
+        region = region_factible(restricciones)
+        return len(region.vertices), optimizar(region, programa.costos_max())[2]
+    return lambda: None, ejecutar
+
+
+def _caso_grafico_png(programa):
+    import io
+
+    from .Graphic import calcular_vertices, restricciones_de
+    from .batch import resolver_problema
+    from .render import Lienzo
+
+    lienzo = Lienzo()
+    resultado = resolver_problema(programa, "graphic")
+    vertices = len(calcular_vertices(restricciones_de(programa)))
+
+    def ejecutar(archivo):
+        lienzo.guardar(archivo, programa, resultado, formato="png")
+        return vertices, float(np.max(programa.costos_max() @ resultado.x))
+    return io.BytesIO, ejecutar
+
+
+# caso -> función que, dado un ProgramaLineal, devuelve (preparar, ejecutar):
+# preparar() arma los datos de cada repetición fuera del tiempo medido y
+# ejecutar(datos) resuelve y devuelve (iteraciones, objetivo en forma de máximo);
+# en el caso gráfico las iteraciones son el número de vértices
+CASOS = {
+    "resolver_simplex": _caso_resolver_simplex,
+    "resolver_simplex_desde_tabla": _caso_resolver_simplex_desde_tabla,
+    "big_m": _caso_big_m,
+    "grafico": _caso_grafico,
+    "grafico_png": _caso_grafico_png,
+}
+
+# (caso, familia, tamaños); el tamaño es m salvo en klee_minty (n) y transporte (k)
+SUITE = (
+    ("resolver_simplex", "denso", (10, 50, 150)),
+    ("resolver_simplex", "disperso", (50, 200)),
+    ("resolver_simplex", "klee_minty", (6, 8, 10)),
+    ("resolver_simplex", "degenerado", (20, 80)),
+    ("resolver_simplex_desde_tabla", "big_m_mixto", (10, 50, 150)),
+    ("resolver_simplex_desde_tabla", "transporte", (5, 10)),
+    ("resolver_simplex_desde_tabla", "degenerado", (20, 80)),
+    ("big_m", "big_m_mixto", (5, 15, 30)),
+    ("big_m", "transporte", (3, 5)),
+    ("big_m", "klee_minty", (6, 8)),
+    ("grafico", "denso", (10, 50, 200, 1000)),
+    ("grafico_png", "denso", (3, 20)),
+)
+
+
+def generar(familia, tamaño, caso=None, semilla=0):
+    """Problema de la familia con el tamaño dado; los casos del método gráfico usan 2 variables."""
+    if caso in ("grafico", "grafico_png"):
+        return FAMILIAS[familia](tamaño, 2, semilla=semilla)
+    return FAMILIAS[familia](tamaño, semilla=semilla)
+
+
+def medir(caso, programa, repeticiones=5):
+    """Tiempos de `repeticiones` ejecuciones del caso (tras una de calentamiento).
+    Devuelve un diccionario con min, mediana y media en segundos, iteraciones y objetivo."""
+    preparar, ejecutar = CASOS[caso](programa)
+    iteraciones, objetivo = ejecutar(preparar())
+    tiempos = []
+    for _ in range(repeticiones):
+        datos = preparar()
+        inicio = time.perf_counter()
+        ejecutar(datos)
+        tiempos.append(time.perf_counter() - inicio)
+    return {
+        "min": min(tiempos),
+        "mediana": statistics.median(tiempos),
+        "media": statistics.fmean(tiempos),
+        "iteraciones": int(iteraciones),
+        "objetivo": float(objetivo),
+    }
+
+
+# Módulos cuyo tiempo de importación mide el caso "arranque"
+ARRANQUE = ("main", "Methods.Simplex", "Methods.Graphic", "Methods.batch")
+
+_PROGRAMA_ARRANQUE = (
+    "import sys, time\n"
+    "previos = len(sys.modules)\n"
+    "inicio = time.perf_counter()\n"
+    "import {modulo}\n"
+    "print(time.perf_counter() - inicio, len(sys.modules) - previos)\n"
+)
+
+
+def medir_arranque(modulo, repeticiones=5):
+    """Segundos que tarda `import modulo` en un intérprete nuevo (lanzado desde la
+    raíz del proyecto), sin contar el arranque del propio Python. Tras una
+    ejecución de calentamiento (que deja compilados los .pyc) devuelve lo mismo
+    que medir(); las iteraciones son los módulos que cargó la importación."""
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    comando = [sys.executable, "-c", _PROGRAMA_ARRANQUE.format(modulo=modulo)]
+    tiempos = []
+    for i in range(repeticiones + 1):
+        salida = subprocess.run(comando, capture_output=True, text=True, cwd=raiz, check=True)
+        segundos, cargados = salida.stdout.split()
+        if i > 0:
+            tiempos.append(float(segundos))
+    return {
+        "min": min(tiempos),
+        "mediana": statistics.median(tiempos),
+        "media": statistics.fmean(tiempos),
+        "iteraciones": int(cargados),
+        "objetivo": 0.0,
+    }
+
+
+def _commit():
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                timeout=5, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return salida.stdout.strip() or None
+
+
+def ejecutar_suite(suite=SUITE, repeticiones=5, rapido=False, casos=None, progreso=None):
+    """
+    Mide cada (caso, familia, tamaño) de la suite. rapido usa solo el tamaño
+    menor de cada familia; casos limita los casos medidos ("arranque" incluido:
+    se mide con cada módulo de ARRANQUE como familia). progreso(resultado) se
+    llama tras cada medición. Devuelve el diccionario que se guarda en JSON, con
+    el entorno (commit, Python, NumPy) y la lista de resultados.
+    """
+    resultados = []
+    for caso, familia, tamaños in suite:
+        if casos and caso not in casos:
+            continue
+        for tamaño in tamaños[:1] if rapido else tamaños:
+            programa = generar(familia, tamaño, caso)
+            resultado = {"caso": caso, "familia": familia, "tamaño": tamaño,
+                         "m": programa.m, "n": programa.n, "repeticiones": repeticiones}
+            try:
+                resultado.update(medir(caso, programa, repeticiones))
+            except Exception as e:
+                resultado["error"] = str(e)
+            resultados.append(resultado)
+            if progreso is not None:
+                progreso(resultado)
+    if not casos or "arranque" in casos:
+        for modulo in ARRANQUE:
+            resultado = {"caso": "arranque", "familia": modulo, "tamaño": 0,
+                         "m": 0, "n": 0, "repeticiones": repeticiones}
+            try:
+                resultado.update(medir_arranque(modulo, repeticiones))
+            except (OSError, ValueError, subprocess.SubprocessError) as e:
+                resultado["error"] = str(e)
+            resultados.append(resultado)
+            if progreso is not None:
+                progreso(resultado)
+    return {
+        "version": VERSION,
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+
+
+def guardar(datos, ruta):
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(datos, f, ensure_ascii=False, indent=2)
+
+
+def cargar(ruta):
+    with open(ruta, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def comparar(anterior, actual, umbral=0.10, diferencia_minima=1e-4):
+    """
+    Compara dos resultados de ejecutar_suite caso por caso (por caso, familia y
+    tamaño), con la razón de medianas actual / anterior. El estado es
+    'regresion' si la razón supera 1 + umbral y la mediana creció al menos
+    diferencia_minima segundos (para no marcar ruido en casos de microsegundos),
+    'mejora' si baja de 1 / (1 + umbral), 'objetivo_distinto' si el óptimo
+    cambió (una regresión de exactitud), 'error' si falló en alguna de las dos
+    ejecuciones y 'igual' en otro caso. Los casos que solo están en una de las
+    dos no se comparan.
+    """
+    def clave(resultado):
+        return resultado["caso"], resultado["familia"], resultado["tamaño"]
+
+    previos = {clave(r): r for r in anterior["resultados"]}
+    filas = []
+    for nuevo in actual["resultados"]:
+        previo = previos.get(clave(nuevo))
+        if previo is None:
+            continue
+        fila = dict(zip(("caso", "familia", "tamaño"), clave(nuevo)))
+        if "error" in previo or "error" in nuevo:
+            fila.update(estado="error", anterior=None, actual=None, razon=None)
+            filas.append(fila)
+            continue
+        razon = nuevo["mediana"] / previo["mediana"] if previo["mediana"] > 0 else float("inf")
+        if abs(nuevo["objetivo"] - previo["objetivo"]) > 1e-6 * (1.0 + abs(previo["objetivo"])):
+            estado = "objetivo_distinto"
+        elif razon > 1.0 + umbral and nuevo["mediana"] - previo["mediana"] >= diferencia_minima:
+            estado = "regresion"
+        elif razon < 1.0 / (1.0 + umbral):
+            estado = "mejora"
+        else:
+            estado = "igual"
+        fila.update(estado=estado, anterior=previo["mediana"], actual=nuevo["mediana"], razon=razon,
+                    iteraciones=[previo["iteraciones"], nuevo["iteraciones"]])
+        filas.append(fila)
+    return filas
+
+
+def hay_regresiones(filas):
+    return any(fila["estado"] in ("regresion", "objetivo_distinto", "error") for fila in filas)
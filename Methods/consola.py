@@ -0,0 +1,35 @@
+# consola.py
+"""
+Salida de terminal compartida por los menús, sin efectos al importar: la consola
+de rich se crea (y rich se importa) la primera vez que se usa, y cada título de
+Figlet se dibuja una sola vez. Así `import Methods.Simplex` o los procesos del
+modo por lotes no cargan rich, pyfiglet ni questionary si no muestran nada.
+"""
+
+from functools import lru_cache
+
+
+class ConsolaPerezosa:
+    """Se usa como una rich.console.Console; la crea con las opciones dadas al
+    pedir el primer atributo."""
+
+    def __init__(self, **opciones):
+        self._opciones = opciones
+        self._consola = None
+
+    def __getattr__(self, nombre):
+        # Solo se llama para atributos que no son del propio objeto
+        if self._consola is None:
+            from rich.console import Console
+            self._consola = Console(**self._opciones)
+        return getattr(self._consola, nombre)
+
+
+console = ConsolaPerezosa()
+
+
+@lru_cache(maxsize=None)
+def banner(texto, fuente="big"):
+    """Texto en letras ASCII de Figlet; se calcula una vez por (texto, fuente)."""
+    from pyfiglet import Figlet
+    return Figlet(font=fuente).renderText(texto)
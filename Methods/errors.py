@@ -0,0 +1,25 @@
+# errors.py
+"""Excepciones compartidas por los motores del método Simplex."""
+
+
+class ProblemaNoAcotado(Exception):
+    """La función objetivo puede crecer sin límite en la región factible."""
+
+    def __init__(self, mensaje="La solución es no acotada."):
+        super().__init__(mensaje)
+
+
+class LimiteAlcanzado(Exception):
+    """Se alcanzó el límite de iteraciones o de tiempo antes del óptimo.
+    estado es 'limite_iteraciones' o 'limite_tiempo'."""
+
+    def __init__(self, estado, mensaje=None):
+        self.estado = estado
+        super().__init__(mensaje or f"Se detuvo el simplex: {estado}.")
+
+
+class ProblemaInfactible(Exception):
+    """Ningún punto satisface todas las restricciones."""
+
+    def __init__(self, mensaje="El problema es infactible."):
+        super().__init__(mensaje)
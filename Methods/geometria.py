@@ -0,0 +1,338 @@
+# geometria.py
+"""
+Intersección de semiplanos para el método gráfico (2 variables).
+
+Cada restricción a1 x1 + a2 x2 (<=, >=, =) b se pasa a semiplanos n·x <= d con
+|n| = 1 (un '>=' se invierte y un '=' da dos semiplanos opuestos), de modo que
+n·x - d es la distancia con signo a la recta y las tolerancias no dependen de
+la escala de los coeficientes.
+
+region_factible arma el polígono factible en O(k log k): ordena los semiplanos
+por ángulo, se queda con el más ajustado de cada dirección y recorre la lista
+con una cola doble que descarta los que dejan de aportar un lado (el algoritmo
+clásico de intersección de semiplanos). Para que la región sea acotada se
+agrega una caja que contiene todos los vértices posibles; los vértices que usan
+un lado de la caja no son de la región y se descartan. Cada vértice se obtiene
+con un sistema 2x2 exacto de sus dos rectas, sin muestrear puntos.
+
+Si hay igualdades (o dos semiplanos opuestos sin ancho, como x1 <= 3 y x1 >= 3)
+la región está sobre una recta y se resuelve como un intervalo sobre ella.
+
+Las regiones no acotadas se describen sin cotas arbitrarias: Region.rayos genera
+el cono de recesión {r : N r <= 0} (las direcciones en las que se puede avanzar
+sin salir de la región), calculado con el mayor hueco entre los ángulos de las
+normales, y Region.bordes da cada lado infinito como (vértice, dirección).
+optimizar decide con esos rayos si c·x crece sin límite; recortar_recta recorta
+una recta contra la ventana del gráfico de forma exacta.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+
+# Distancia (relativa a la escala de los lados derechos) por debajo de la cual
+# un punto se considera sobre una recta y dos vértices se consideran el mismo
+TOLERANCIA = 1e-7
+# |sen| del ángulo entre dos rectas por debajo del cual se toman como paralelas
+PARALELAS = 1e-12
+
+
+def semiplanos(restricciones):
+    """(N, d, iguales): filas de N x <= d con |N_i| = 1 a partir de restricciones
+    (a1, a2, b, op). Cada '=' aporta dos filas marcadas en iguales. Las
+    restricciones sin coeficientes quedan como fila N_i = 0."""
+    filas, lados, iguales = [], [], []
+    for a1, a2, b, op in restricciones:
+        a = np.array([a1, a2], dtype=float)
+        norma = math.hypot(a[0], a[1])
+        if norma > 0:
+            a, b = a / norma, b / norma
+        if op in ('<=', '='):
+            filas.append(a)
+            lados.append(b)
+            iguales.append(op == '=')
+        if op in ('>=', '='):
+            filas.append(-a)
+            lados.append(-b)
+            iguales.append(op == '=')
+    return (np.array(filas, dtype=float).reshape(-1, 2), np.array(lados, dtype=float),
+            np.array(iguales, dtype=bool))
+
+
+def fusionar_vertices(puntos, tolerancia):
+    """Quita los puntos a menos de `tolerancia` de uno anterior, conservando el
+    orden. Usa una grilla de celdas de lado `tolerancia` (un hash espacial):
+    cada punto solo se compara con los de su celda y las 8 vecinas, así que el
+    costo es lineal en vez de cuadrático."""
+    celdas = {}
+    unicos = []
+    for x, y in puntos:
+        i, j = math.floor(x / tolerancia), math.floor(y / tolerancia)
+        repetido = any(
+            math.hypot(x - px, y - py) <= tolerancia
+            for di in (-1, 0, 1) for dj in (-1, 0, 1)
+            for px, py in celdas.get((i + di, j + dj), ())
+        )
+        if not repetido:
+            celdas.setdefault((i, j), []).append((x, y))
+            unicos.append((x, y))
+    return np.array(unicos, dtype=float).reshape(-1, 2)
+
+
+class Region:
+    """Región factible de un problema de 2 variables (ver region_factible).
+
+    vertices: arreglo (p, 2) en orden antihorario a lo largo del borde.
+    rayos: generadores del cono de recesión, direcciones unitarias r tales que
+    x + t r sigue siendo factible para todo t >= 0; vacío si la región es acotada.
+    bordes: lista de (vértice, dirección) con cada lado infinito del borde que
+    sale de un vértice (vacía si es acotada o no tiene vértices).
+    punto: un punto factible. semiplanos: (N, d) con las filas N x <= d usadas.
+    """
+
+    __slots__ = ("vertices", "rayos", "bordes", "punto", "semiplanos")
+
+    def __init__(self, vertices, rayos, bordes=(), punto=None, semiplanos=None):
+        self.vertices = vertices
+        self.rayos = rayos
+        self.bordes = list(bordes)
+        self.punto = vertices[0] if punto is None else np.asarray(punto, dtype=float)
+        self.semiplanos = semiplanos
+
+    @property
+    def acotada(self):
+        return len(self.rayos) == 0
+
+    def __repr__(self):
+        return f"Region(vertices={len(self.vertices)}, rayos={len(self.rayos)})"
+
+
+def _direccion(angulo):
+    return np.array([math.cos(angulo), math.sin(angulo)])
+
+
+def _recesion(angulos):
+    """Generadores del cono {r : N r <= 0} a partir de los ángulos (ordenados y
+    sin repetir) de las normales de N. r sirve si forma al menos 90° con todas
+    las normales, es decir, si cae en un hueco de π o más entre normales
+    consecutivas: del hueco [a, a + h] sirven los ángulos [a + π/2, a + h - π/2].
+    Si las normales no dejan un hueco así, el cono es {0} y no hay generadores."""
+    if len(angulos) == 0:
+        return np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+    huecos = np.diff(np.append(angulos, angulos[0] + 2 * np.pi))
+    generadores = []
+    for k in np.flatnonzero(huecos >= np.pi - PARALELAS):
+        desde = angulos[k] + np.pi / 2
+        hasta = angulos[k] + huecos[k] - np.pi / 2
+        generadores.append(_direccion(desde))
+        if hasta - desde > PARALELAS:
+            if hasta - desde > np.pi - PARALELAS:
+                # Un semiplano de direcciones no es la suma de sus dos bordes opuestos
+                generadores.append(_direccion((desde + hasta) / 2))
+            generadores.append(_direccion(hasta))
+    return np.array(generadores, dtype=float).reshape(-1, 2)
+
+
+def _interseccion(n1, d1, n2, d2):
+    """Punto de corte de las rectas n1·x = d1 y n2·x = d2 (regla de Cramer)."""
+    det = n1[0] * n2[1] - n1[1] * n2[0]
+    return ((d1 * n2[1] - n1[1] * d2) / det, (n1[0] * d2 - d1 * n2[0]) / det)
+
+
+def _sobre_recta(N, d, n, c, tolerancia):
+    """Región {N x <= d} restringida a la recta n·x = c: el intervalo de
+    parámetros t de p0 + t u que cumple todas las filas. None si es vacío."""
+    p0 = n * c
+    u = np.array([-n[1], n[0]])
+    pendiente = N @ u
+    holgura = d - N @ p0
+    paralela = np.abs(pendiente) <= PARALELAS
+    if np.any(holgura[paralela] < -tolerancia):
+        return None
+    limites = holgura[~paralela] / pendiente[~paralela]
+    positiva = pendiente[~paralela] > 0
+    hasta = limites[positiva].min(initial=np.inf)
+    desde = limites[~positiva].max(initial=-np.inf)
+    if desde > hasta + tolerancia:
+        return None
+    extremos = [t for t in (desde, hasta) if np.isfinite(t)]
+    vertices = fusionar_vertices([p0 + t * u for t in extremos], tolerancia)
+    rayos = [r for r, t in ((-u, desde), (u, hasta)) if not np.isfinite(t)]
+    bordes = [(vertices[0], rayos[0])] if len(vertices) == 1 and len(rayos) == 1 else []
+    punto = p0 + min(max(0.0, desde), hasta) * u
+    return Region(vertices, np.array(rayos, dtype=float).reshape(-1, 2), bordes, punto, (N, d))
+
+
+def region_factible(restricciones, tolerancia=TOLERANCIA):
+    """
+    Region factible de restricciones (a1, a2, b, op), o None si es vacía. Sus
+    vértices van en orden a lo largo del borde (antihorario) y sin repetidos; si
+    la región no es acotada son los del borde entre los dos lados infinitos, y
+    puede no tener ninguno (un semiplano, una franja, una recta o todo el plano).
+    """
+    N, d, iguales = semiplanos(restricciones)
+    escala = max(1.0, np.abs(d).max(initial=0.0))
+    tolerancia = tolerancia * escala
+
+    nulas = ~np.any(N, axis=1)
+    if np.any(d[nulas] < -tolerancia):
+        return None
+    N, d, iguales = N[~nulas], d[~nulas], iguales[~nulas]
+    if np.any(iguales):
+        i = np.flatnonzero(iguales)[0]
+        return _sobre_recta(N, d, N[i], d[i], tolerancia)
+    if len(d) == 0:
+        return Region(np.empty((0, 2)), _recesion(d), punto=np.zeros(2), semiplanos=(N, d))
+
+    # Ordenar por ángulo de la normal y quedarse con el semiplano más ajustado de
+    # cada dirección (los paralelos del mismo lado son redundantes salvo ese)
+    angulos = np.arctan2(N[:, 1], N[:, 0])
+    orden = np.lexsort((d, angulos))
+    angulos, N, d = angulos[orden], N[orden], d[orden]
+    nueva = np.empty(len(d), dtype=bool)
+    nueva[0] = True
+    nueva[1:] = np.diff(angulos) > PARALELAS
+    if len(d) > 1 and angulos[-1] - angulos[0] > 2 * np.pi - PARALELAS:
+        # La última clase y la primera son la misma dirección (ángulos ±π)
+        ultima = np.flatnonzero(nueva)[-1]
+        if d[ultima] < d[0]:
+            N[0], d[0] = N[ultima], d[ultima]
+        nueva[ultima:] = False
+    angulos, N, d = angulos[nueva], N[nueva], d[nueva]
+
+    # Dos semiplanos opuestos: si se cruzan no hay región; si no dejan ancho, la
+    # región está sobre esa recta
+    if len(d) > 1:
+        opuestos = np.where(angulos > 0, angulos - np.pi, angulos + np.pi)
+        pos = np.searchsorted(angulos, opuestos)
+        for candidato in (pos % len(d), (pos - 1) % len(d)):
+            cerca = np.abs(np.sin(angulos[candidato] - opuestos)) <= PARALELAS
+            cerca &= np.einsum('ij,ij->i', N, N[candidato]) < 0
+            ancho = d + d[candidato]
+            if np.any(cerca & (ancho < -tolerancia)):
+                return None
+            delgada = np.flatnonzero(cerca & (ancho <= tolerancia))
+            if len(delgada):
+                i = delgada[0]
+                return _sobre_recta(N, d, N[i], d[i], tolerancia)
+
+    filas = (N, d)
+    rayos = _recesion(angulos)
+
+    # Caja que contiene todos los vértices: dos rectas n_i·x = d_i, n_j·x = d_j
+    # se cortan a distancia <= (|d_i| + |d_j|) / |sen(ángulo entre ellas)| del
+    # origen, y el menor seno entre rectas no paralelas es el de dos ángulos
+    # consecutivos módulo π
+    rectas = np.sort(np.mod(angulos, np.pi))
+    senos = np.abs(np.sin(np.diff(np.append(rectas, rectas[0] + np.pi))))
+    senos = senos[senos > PARALELAS]
+    radio = 2.0 * escala / senos.min() if len(senos) else escala
+    caja = 2.0 * radio + 1.0
+    lados_caja = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0], [0.0, -1.0]])
+    N = np.vstack((N, lados_caja))
+    d = np.append(d, np.full(4, caja))
+    de_caja = np.arange(len(d)) >= len(angulos)
+    angulos = np.append(angulos, np.arctan2(lados_caja[:, 1], lados_caja[:, 0]))
+    orden = np.lexsort((d, angulos))
+    # Con la misma dirección que un lado de la caja gana la restricción (d menor)
+    orden = orden[np.append(True, np.diff(angulos[orden]) > PARALELAS)]
+    N, d, de_caja = N[orden].tolist(), d[orden].tolist(), de_caja[orden]
+
+    def fuera(k, punto):
+        return N[k][0] * punto[0] + N[k][1] * punto[1] > d[k] + tolerancia
+
+    def corte(i, j):
+        return _interseccion(N[i], d[i], N[j], d[j])
+
+    cola = deque()
+    for k in range(len(d)):
+        while len(cola) > 1 and fuera(k, corte(cola[-1], cola[-2])):
+            cola.pop()
+        while len(cola) > 1 and fuera(k, corte(cola[0], cola[1])):
+            cola.popleft()
+        if cola and N[cola[-1]][0] * N[k][1] - N[cola[-1]][1] * N[k][0] <= PARALELAS:
+            # La dirección anterior quedó a 180° o más: la región es vacía
+            return None
+        cola.append(k)
+    while len(cola) > 2 and fuera(cola[0], corte(cola[-1], cola[-2])):
+        cola.pop()
+    while len(cola) > 2 and fuera(cola[-1], corte(cola[0], cola[1])):
+        cola.popleft()
+    if len(cola) < 3:
+        return None
+
+    # Vértice entre cada par de lados consecutivos; se empieza después de un
+    # vértice de la caja para que los de una región no acotada queden en orden
+    lados = list(cola)
+    pares = list(zip(lados, lados[1:] + lados[:1]))
+    inicio = next((p + 1 for p, (i, j) in enumerate(pares) if de_caja[i] or de_caja[j]), 0)
+    pares = pares[inicio:] + pares[:inicio]
+    reales = [p for p, (i, j) in enumerate(pares) if not (de_caja[i] or de_caja[j])]
+    vertices = fusionar_vertices([corte(*pares[p]) for p in reales], tolerancia)
+
+    # Lados infinitos: la recta del primer vértice sigue hacia el vértice de la
+    # caja anterior y la del último hacia el siguiente
+    bordes = []
+    if reales and len(reales) < len(pares):
+        for p, recta, hacia in ((reales[0], pares[reales[0]][0], pares[reales[0] - 1]),
+                                (reales[-1], pares[reales[-1]][1], pares[(reales[-1] + 1) % len(pares)])):
+            origen = np.array(corte(*pares[p]))
+            direccion = np.array([-N[recta][1], N[recta][0]])
+            if direccion @ (np.array(corte(*hacia)) - origen) < 0:
+                direccion = -direccion
+            bordes.append((origen, direccion))
+    return Region(vertices, rayos, bordes, None if len(vertices) else corte(*pares[0]), filas)
+
+
+def optimizar(region, c, tolerancia=TOLERANCIA):
+    """
+    Máximo de c·x sobre la región (para minimizar, pasar -c). Devuelve
+    (estado, x, valor, rayo): ('no_acotado', None, None, r) con r un rayo de
+    recesión en el que c·x crece, u ('optimo', x, c·x, None). El cono de
+    recesión decide si hay óptimo; si lo hay está en un vértice o, si la región
+    no tiene vértices (contiene una recta perpendicular a c), sobre el borde más
+    avanzado en la dirección de c.
+    """
+    c = np.asarray(c, dtype=float)
+    norma = math.hypot(c[0], c[1])
+    if len(region.rayos):
+        pendientes = region.rayos @ c
+        k = int(np.argmax(pendientes))
+        if pendientes[k] > tolerancia * norma:
+            return "no_acotado", None, None, region.rayos[k]
+    if len(region.vertices):
+        valores = region.vertices @ c
+        k = int(np.argmax(valores))
+        return "optimo", region.vertices[k], float(valores[k]), None
+    if norma == 0:
+        return "optimo", region.punto, 0.0, None
+    # Todas las normales son paralelas a c; el borde de normal c más ajustado manda
+    N, d = region.semiplanos
+    unitario = c / norma
+    mismas = N @ unitario > 1.0 - tolerancia
+    x = region.punto + (d[mismas].min() - unitario @ region.punto) * unitario
+    return "optimo", x, float(c @ x), None
+
+
+def recortar_recta(a1, a2, b, ventana):
+    """Tramo de la recta a1 x1 + a2 x2 = b dentro del rectángulo
+    ventana = (x_min, x_max, y_min, y_max), recortado de forma exacta
+    (Liang-Barsky). Devuelve los dos extremos ((x, y), (x, y)) o None si la
+    recta no pasa por la ventana."""
+    norma2 = a1 * a1 + a2 * a2
+    if norma2 == 0:
+        return None
+    p0 = np.array([a1, a2]) * (b / norma2)
+    u = np.array([-a2, a1])
+    desde, hasta = -np.inf, np.inf
+    for eje, (minimo, maximo) in enumerate((ventana[:2], ventana[2:])):
+        if u[eje] == 0:
+            if not minimo <= p0[eje] <= maximo:
+                return None
+            continue
+        t1, t2 = sorted(((minimo - p0[eje]) / u[eje], (maximo - p0[eje]) / u[eje]))
+        desde, hasta = max(desde, t1), min(hasta, t2)
+    if desde > hasta:
+        return None
+    return tuple(p0 + desde * u), tuple(p0 + hasta * u)
@@ -0,0 +1,343 @@
+# model_reader.py
+"""
+Lectura de modelos en formato MPS libre y CPLEX LP.
+Los archivos se procesan línea por línea: los coeficientes se acumulan como
+tripletes en arreglos compactos (módulo array) y al final se construye una
+MatrizDispersa, de modo que la memoria es proporcional a los no nulos.
+
+Ambos lectores devuelven un diccionario compatible con batch.normalizar_problema:
+{"sentido": "max"|"min", "c": ndarray, "A": MatrizDispersa, "b": ndarray,
+ "ops": ['<=', '>=', '=' ...], "constante": float, "nombres_columnas": [...],
+ "nombres_filas": [...]}
+constante es el término independiente del objetivo ("obj: 3 x + 5" en LP; en MPS,
+el opuesto del RHS de la fila objetivo); se suma al valor óptimo.
+
+Como el Simplex supone x >= 0, las cotas superiores y las inferiores positivas se
+agregan como restricciones; las variables libres o con cota inferior negativa no
+están soportadas. La integralidad se ignora (se resuelve la relajación lineal).
+"""
+
+import re
+from array import array
+
+import numpy as np
+
+from .sparse import MatrizDispersa
+
+OPS_MPS = {"L": "<=", "G": ">=", "E": "="}
+
+
+class _Modelo:
+    """Acumula filas, columnas y coeficientes mientras se lee el archivo."""
+
+    def __init__(self):
+        self.filas = array("q")
+        self.columnas = array("q")
+        self.valores = array("d")
+        self.indice_columna = {}
+        self.indice_fila = {}
+        self.costos = {}
+        self.ops = []
+        self.b = array("d")
+        self.sentido = "min"
+        self.constante = 0.0
+
+    def columna(self, nombre):
+        j = self.indice_columna.get(nombre)
+        if j is None:
+            j = self.indice_columna[nombre] = len(self.indice_columna)
+        return j
+
+    def agregar_fila(self, nombre, op, rhs=0.0):
+        i = len(self.ops)
+        if nombre is None:
+            nombre = f"R{i+1}"
+        self.indice_fila[nombre] = i
+        self.ops.append(op)
+        self.b.append(rhs)
+        return i
+
+    def agregar_coeficiente(self, fila, columna, valor):
+        self.filas.append(fila)
+        self.columnas.append(columna)
+        self.valores.append(valor)
+
+    def agregar_cota(self, nombre_columna, tipo, valor):
+        """Convierte una cota de variable en restricción (x >= 0 ya es implícita)."""
+        j = self.columna(nombre_columna)
+        if tipo in ("UP", "UI", "BV"):
+            if tipo == "BV":
+                valor = 1.0
+            op = "<="
+        elif tipo in ("LO", "LI"):
+            if valor == 0:
+                return
+            if valor < 0:
+                raise ValueError(f"Cota inferior negativa no soportada para {nombre_columna}.")
+            op = ">="
+        elif tipo == "FX":
+            op = "="
+        elif tipo == "PL":
+            return
+        else:  # FR, MI
+            raise ValueError(f"Variable libre no soportada: {nombre_columna} ({tipo}).")
+        i = self.agregar_fila(f"cota_{nombre_columna}_{tipo}", op, valor)
+        self.agregar_coeficiente(i, j, 1.0)
+
+    def resultado(self):
+        m, n = len(self.ops), len(self.indice_columna)
+        c = np.zeros(n)
+        for j, valor in self.costos.items():
+            c[j] = valor
+        A = MatrizDispersa.desde_coo(np.frombuffer(self.filas, dtype=np.int64),
+                                     np.frombuffer(self.columnas, dtype=np.int64),
+                                     np.frombuffer(self.valores, dtype=float), (m, n))
+        return {
+            "sentido": self.sentido,
+            "c": c,
+            "A": A,
+            "b": np.frombuffer(self.b, dtype=float).copy(),
+            "ops": self.ops,
+            "constante": self.constante,
+            "nombres_columnas": list(self.indice_columna),
+            "nombres_filas": list(self.indice_fila),
+        }
+
+
+# ==============================
+# MPS LIBRE
+# ==============================
+
+def leer_mps(ruta):
+    """Lee un archivo MPS en formato libre (secciones NAME, OBJSENSE, ROWS,
+    COLUMNS, RHS, BOUNDS y ENDATA)."""
+    modelo = _Modelo()
+    objetivo = None
+    filas_libres = set()
+    seccion = None
+
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            if not linea.strip() or linea.startswith("*"):
+                continue
+            tokens = linea.split()
+            if not linea[0].isspace():
+                seccion = tokens[0].upper()
+                if seccion == "OBJSENSE" and len(tokens) > 1:
+                    modelo.sentido = "max" if tokens[1].upper().startswith("MAX") else "min"
+                elif seccion == "RANGES":
+                    raise ValueError("La sección RANGES no está soportada.")
+                elif seccion == "ENDATA":
+                    break
+                continue
+
+            if seccion == "OBJSENSE":
+                modelo.sentido = "max" if tokens[0].upper().startswith("MAX") else "min"
+            elif seccion == "ROWS":
+                tipo, nombre = tokens[0].upper(), tokens[1]
+                if tipo == "N":
+                    if objetivo is None:
+                        objetivo = nombre
+                    else:
+                        filas_libres.add(nombre)
+                else:
+                    modelo.agregar_fila(nombre, OPS_MPS[tipo])
+            elif seccion == "COLUMNS":
+                if len(tokens) > 1 and "MARKER" in tokens[1].upper():
+                    continue
+                j = modelo.columna(tokens[0])
+                for k in range(1, len(tokens) - 1, 2):
+                    nombre_fila, valor = tokens[k], float(tokens[k + 1])
+                    if nombre_fila == objetivo:
+                        modelo.costos[j] = modelo.costos.get(j, 0.0) + valor
+                    elif nombre_fila not in filas_libres:
+                        modelo.agregar_coeficiente(modelo.indice_fila[nombre_fila], j, valor)
+            elif seccion == "RHS":
+                # Con nombre de conjunto la cantidad de tokens es impar
+                inicio = len(tokens) % 2
+                for k in range(inicio, len(tokens) - 1, 2):
+                    nombre_fila, valor = tokens[k], float(tokens[k + 1])
+                    if nombre_fila == objetivo:
+                        # Convención MPS: el objetivo es c x - RHS
+                        modelo.constante = -valor
+                    elif nombre_fila in modelo.indice_fila:
+                        modelo.b[modelo.indice_fila[nombre_fila]] = valor
+            elif seccion == "BOUNDS":
+                tipo = tokens[0].upper()
+                con_valor = tipo not in ("FR", "MI", "PL", "BV")
+                # [tipo, conjunto, columna, valor] o sin conjunto
+                if con_valor:
+                    nombre_columna, valor = tokens[-2], float(tokens[-1])
+                else:
+                    nombre_columna, valor = tokens[-1], None
+                modelo.agregar_cota(nombre_columna, tipo, valor)
+    return modelo.resultado()
+
+
+# ==============================
+# CPLEX LP
+# ==============================
+
+_SECCIONES_LP = {
+    "maximize": "max", "maximise": "max", "maximum": "max", "max": "max",
+    "minimize": "min", "minimise": "min", "minimum": "min", "min": "min",
+    "subject to": "st", "such that": "st", "st": "st", "s.t.": "st", "st.": "st",
+    "bounds": "bounds", "bound": "bounds",
+    "general": "ignorar", "generals": "ignorar", "gen": "ignorar",
+    "integer": "ignorar", "integers": "ignorar",
+    "binary": "binarias", "binaries": "binarias", "bin": "binarias",
+    "end": "end",
+}
+_PATRON_SECCION = re.compile(
+    r"^\s*(" + "|".join(sorted((re.escape(k) for k in _SECCIONES_LP), key=len, reverse=True))
+    + r")(?=\s|$)", re.IGNORECASE)
+_TOKEN_LP = re.compile(
+    r"(<=|>=|=<|=>|<|>|=)"                              # operador
+    r"|([+-])"                                          # signo
+    r"|((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"          # número
+    r"|(:)"                                             # fin de etiqueta
+    r"|([^\s:+\-<>=]+)")                                # nombre
+_OPS_LP = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "="}
+
+
+def _tokens_lp(texto):
+    for op, signo, numero, dos_puntos, nombre in _TOKEN_LP.findall(texto):
+        if op:
+            yield "op", _OPS_LP[op]
+        elif signo:
+            yield "signo", -1.0 if signo == "-" else 1.0
+        elif numero:
+            yield "num", float(numero)
+        elif dos_puntos:
+            yield ":", None
+        else:
+            yield "nombre", nombre
+
+
+def _leer_cota_lp(modelo, tokens):
+    """Procesa una línea de la sección Bounds: 'x <= u', 'l <= x <= u', 'x >= l',
+    'x = v' o 'x free'."""
+    valores, nombre, ops, signo = [], None, [], 1.0
+    for tipo, valor in tokens:
+        if tipo == "signo":
+            signo = valor
+        elif tipo == "num":
+            valores.append(signo * valor)
+            signo = 1.0
+        elif tipo == "nombre":
+            if valor.lower() in ("inf", "infinity"):
+                valores.append(signo * np.inf)
+                signo = 1.0
+            elif valor.lower() == "free":
+                modelo.agregar_cota(nombre, "FR", None)
+            else:
+                nombre = valor
+        elif tipo == "op":
+            ops.append((valor, nombre is None))  # (operador, ¿el número va antes del nombre?)
+    for (op, numero_antes), valor in zip(ops, valores):
+        if op == "=":
+            modelo.agregar_cota(nombre, "FX", valor)
+            continue
+        # Normalizar a 'x op valor'
+        if numero_antes:
+            op = "<=" if op == ">=" else ">="
+        if op == "<=" and np.isfinite(valor):
+            modelo.agregar_cota(nombre, "UP", valor)
+        elif op == ">=":
+            if valor == -np.inf:
+                modelo.agregar_cota(nombre, "MI", None)
+            else:
+                modelo.agregar_cota(nombre, "LO", valor)
+
+
+def _termino_constante(modelo, seccion, signo, coef):
+    """Un número sin variable: en el objetivo se acumula en la constante; en una
+    restricción solo puede ser el lado derecho."""
+    if seccion != "obj":
+        raise ValueError(f"Término constante {signo * coef:g} fuera del lado derecho de una restricción.")
+    modelo.constante += signo * coef
+
+
+def leer_lp(ruta):
+    """Lee un archivo en formato CPLEX LP (objetivo, Subject To, Bounds,
+    Generals/Binaries y End). Las restricciones pueden ocupar varias líneas."""
+    modelo = _Modelo()
+    seccion = None
+    fila = None          # fila en construcción (Subject To)
+    etiqueta = None
+    op = None
+    signo, coef = 1.0, None
+
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            linea = linea.split("\\", 1)[0]  # comentarios
+            if not linea.strip():
+                continue
+            encabezado = _PATRON_SECCION.match(linea)
+            if encabezado and fila is None:
+                if coef is not None:
+                    _termino_constante(modelo, seccion, signo, coef)
+                signo, coef, etiqueta = 1.0, None, None
+                seccion = _SECCIONES_LP[encabezado.group(1).lower()]
+                if seccion in ("max", "min"):
+                    modelo.sentido = seccion
+                    seccion = "obj"
+                if seccion == "end":
+                    break
+                linea = linea[encabezado.end():]
+
+            tokens = list(_tokens_lp(linea))
+            if seccion == "bounds":
+                _leer_cota_lp(modelo, tokens)
+                continue
+            if seccion in ("ignorar", "binarias"):
+                for tipo, valor in tokens:
+                    if tipo == "nombre" and seccion == "binarias":
+                        modelo.agregar_cota(valor, "BV", None)
+                continue
+
+            for k, (tipo, valor) in enumerate(tokens):
+                if tipo == "nombre" and k + 1 < len(tokens) and tokens[k + 1][0] == ":":
+                    etiqueta = valor
+                elif tipo == ":":
+                    continue
+                elif tipo == "signo":
+                    if coef is not None:
+                        _termino_constante(modelo, seccion, signo, coef)
+                        coef = None
+                    signo = valor
+                elif tipo == "num" and op is not None:
+                    # Lado derecho: la restricción está completa
+                    modelo.b[fila] = signo * valor
+                    fila, etiqueta, op, signo, coef = None, None, None, 1.0, None
+                elif tipo == "num":
+                    coef = valor
+                elif tipo == "nombre":
+                    valor_coef = signo * (1.0 if coef is None else coef)
+                    j = modelo.columna(valor)
+                    if seccion == "obj":
+                        modelo.costos[j] = modelo.costos.get(j, 0.0) + valor_coef
+                    else:
+                        if fila is None:
+                            fila = modelo.agregar_fila(etiqueta, "<=")
+                        modelo.agregar_coeficiente(fila, j, valor_coef)
+                    signo, coef = 1.0, None
+                elif tipo == "op" and seccion == "st":
+                    if coef is not None:
+                        _termino_constante(modelo, seccion, signo, coef)
+                    if fila is None:
+                        fila = modelo.agregar_fila(etiqueta, valor)
+                    modelo.ops[fila] = valor
+                    op = valor
+    if coef is not None:
+        _termino_constante(modelo, seccion, signo, coef)
+    return modelo.resultado()
+
+
+def leer_modelo(ruta):
+    """Lee un modelo .mps o .lp según su extensión."""
+    if ruta.lower().endswith(".mps"):
+        return leer_mps(ruta)
+    if ruta.lower().endswith(".lp"):
+        return leer_lp(ruta)
+    raise ValueError(f"Formato de modelo no soportado: {ruta}")
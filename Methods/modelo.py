@@ -0,0 +1,165 @@
+# modelo.py
+"""
+Modelo de datos común a todos los métodos: el problema (ProgramaLineal) y su
+resultado (Resultado). Ambos usan __slots__ y guardan los datos en arreglos
+NumPy contiguos, de modo que el problema pasa de la lectura (archivos o menús)
+al motor y a la visualización sin convertir entre listas y arreglos.
+"""
+
+import numpy as np
+
+from .Revised import construir_problema_big_m, refactorizar
+from .sparse import como_dispersa, desde_tripletes, es_dispersa, tripletes
+
+OPERADORES = {"<=": "<=", "≤": "<=", ">=": ">=", "≥": ">=", "=": "=", "==": "="}
+SENTIDOS = {"max": "max", "maximizar": "max", "min": "min", "minimizar": "min"}
+
+
+def _arreglo(valores):
+    """Arreglo contiguo (float si es numérico; object si trae Fraction) o None."""
+    if valores is None:
+        return None
+    arreglo = np.asarray(valores)
+    return np.ascontiguousarray(arreglo, dtype=float if arreglo.dtype != object else object)
+
+
+class ProgramaLineal:
+    """max/min c^T x sujeto a A x (ops) b, con x >= 0 si no_negatividad.
+
+    c y b son vectores float contiguos; A es una matriz float contigua (m x n) o
+    una MatrizDispersa; ops es un arreglo de texto con '<=', '>=' o '=' (se
+    aceptan también '≤', '≥' y '=='). nombres son los nombres de las variables,
+    si se conocen (por ejemplo, los de un archivo MPS). constante es el término
+    independiente del objetivo, que se suma al valor óptimo.
+    """
+
+    __slots__ = ("sentido", "c", "A", "b", "ops", "no_negatividad", "nombres", "constante")
+
+    def __init__(self, c, A, b, ops=None, sentido="max", no_negatividad=True, nombres=None,
+                 constante=0.0):
+        self.c = np.ascontiguousarray(c, dtype=float).ravel()
+        if es_dispersa(A):
+            self.A = como_dispersa(A)
+        else:
+            self.A = np.ascontiguousarray(A, dtype=float).reshape(-1, len(self.c))
+        self.b = np.ascontiguousarray(b, dtype=float).ravel()
+        if ops is None:
+            self.ops = np.full(len(self.b), "<=")
+        else:
+            self.ops = np.array([OPERADORES[str(op).strip()] for op in ops], dtype="<U2")
+        if not (self.A.shape[0] == len(self.b) == len(self.ops)):
+            raise ValueError("A, b y ops deben tener el mismo número de restricciones.")
+        self.sentido = SENTIDOS[str(sentido).strip().lower()]
+        self.no_negatividad = bool(no_negatividad)
+        self.nombres = None if nombres is None else tuple(nombres)
+        self.constante = float(constante)
+
+    @classmethod
+    def desde_diccionario(cls, datos):
+        """Problema a partir de un diccionario con c, A, b y opcionalmente ops,
+        sentido, no_negatividad, nombres_columnas y constante (formato de batch y
+        model_reader)."""
+        return cls(datos["c"], datos["A"], datos["b"], datos.get("ops"), datos.get("sentido", "max"),
+                   datos.get("no_negatividad", True), datos.get("nombres_columnas"),
+                   datos.get("constante", 0.0))
+
+    @property
+    def m(self):
+        return len(self.b)
+
+    @property
+    def n(self):
+        return len(self.c)
+
+    @property
+    def minimizar(self):
+        return self.sentido == "min"
+
+    def costos_max(self):
+        """c del problema equivalente de maximización (-c si se minimiza)."""
+        return -self.c if self.minimizar else self.c
+
+    def con_datos(self, c, A, b, ops):
+        """Mismo sentido, no negatividad y constante con otros datos (por ejemplo,
+        tras presolve)."""
+        return ProgramaLineal(c, A, b, ops, self.sentido, self.no_negatividad,
+                              constante=self.constante)
+
+    def con_variables_divididas(self):
+        """Problema equivalente con x >= 0 para los motores de tabla: sin
+        no_negatividad, cada variable se escribe como x = x⁺ - x⁻, con las n
+        columnas de x⁻ (-c y -A) después de las de x⁺. La solución original es
+        x[:n] - x[n:]. Si ya hay no negatividad se devuelve el mismo problema."""
+        if self.no_negatividad:
+            return self
+        n = self.n
+        filas, columnas, valores = tripletes(self.A, (self.m, n))
+        A = desde_tripletes(np.concatenate((filas, filas)), np.concatenate((columnas, columnas + n)),
+                            np.concatenate((valores, -valores)), (self.m, 2 * n), es_dispersa(self.A))
+        return ProgramaLineal(np.concatenate((self.c, -self.c)), A, self.b, self.ops, self.sentido,
+                              constante=self.constante)
+
+    def __repr__(self):
+        return f"ProgramaLineal({self.sentido}, m={self.m}, n={self.n})"
+
+
+class Resultado:
+    """Resultado de resolver un ProgramaLineal con cualquiera de los métodos.
+
+    estado: 'optimo', 'infactible', 'no_acotado', 'limite_iteraciones' o
+    'limite_tiempo'. x y objetivo están en términos del problema original (en el
+    modo exacto x es un arreglo de Fraction). base es la columna básica de cada
+    fila en el orden de columnas de construir_tabla_big_m (x, holguras, excesos,
+    artificiales) y duales los precios sombra de cada restricción (ver
+    calcular_duales); ambos son None si el método no los conoce. tiempos tiene
+    la duración en segundos de cada etapa e informe los resúmenes de presolve y
+    escalado, si se aplicaron.
+    """
+
+    __slots__ = ("estado", "x", "objetivo", "base", "duales", "iteraciones", "tiempos", "informe")
+
+    def __init__(self, estado, x=None, objetivo=None, base=None, duales=None, iteraciones=None,
+                 tiempos=None, informe=None):
+        self.estado = estado
+        self.x = _arreglo(x)
+        self.objetivo = objetivo
+        self.base = None if base is None else np.ascontiguousarray(base, dtype=int)
+        self.duales = _arreglo(duales)
+        self.iteraciones = iteraciones
+        self.tiempos = tiempos if tiempos is not None else {}
+        self.informe = informe if informe is not None else {}
+
+    def a_diccionario(self):
+        """Diccionario serializable a JSON (una línea de la salida por lotes)."""
+        datos = {
+            "estado": self.estado,
+            "x": None if self.x is None else [float(v) for v in self.x],
+            "objetivo": None if self.objetivo is None else float(self.objetivo),
+            "iteraciones": self.iteraciones,
+        }
+        if self.duales is not None:
+            datos["duales"] = [float(v) for v in self.duales]
+        datos.update(self.informe)
+        return datos
+
+    def __repr__(self):
+        return f"Resultado({self.estado}, objetivo={self.objetivo}, iteraciones={self.iteraciones})"
+
+
+def calcular_duales(c, A, b, ops, base):
+    """
+    Precios sombra y = c_B B^-1 de la base final de max c^T x, A x (ops) b.
+    base sigue el orden de columnas de construir_tabla_big_m; una artificial que
+    quede básica (en cero) cuenta con costo nulo. B^-1 se obtiene con la misma
+    factorización del motor revisado, sin formar B, así que A puede ser dispersa.
+    Devuelve un valor por restricción, con el signo de la fila original.
+    """
+    problema, base_inicial, _ = construir_problema_big_m(c, A, b, ops, M=0.0)
+    base = np.asarray(base, dtype=int)
+    fila_inicial = np.full(len(problema.costo), -1)
+    fila_inicial[base_inicial] = np.arange(problema.m)
+    fact, fila_fact = refactorizar(problema, base, fila_inicial)
+    cb = np.empty(problema.m)
+    cb[fila_fact] = problema.costo[base]
+    y = fact.btran(cb)
+    return np.where(np.asarray(b) < 0, -y, y)
@@ -0,0 +1,98 @@
+# pivot_log.py
+"""
+Historial de iteraciones del método Simplex basado en un registro de pivotes.
+En lugar de guardar una copia de la tabla por iteración, guarda la tabla
+inicial y la lista de pivotes (columna entrante, fila saliente, valor pivote);
+cualquier tabla intermedia se reconstruye bajo demanda repitiendo los pivoteos.
+Opcionalmente guarda un punto de control cada k pivotes para que el acceso
+aleatorio no tenga que repetir el historial completo.
+"""
+
+import numpy as np
+
+
+class HistorialPivotes:
+    """Secuencia de tablas del Simplex reconstruidas a partir de un registro de pivotes.
+
+    Se comporta como la antigua lista `iteraciones`: len(historial) es el número
+    de tablas (pivotes + 1), historial[i] devuelve la tabla i y al iterar se
+    reconstruyen las tablas una a una.
+    """
+
+    def __init__(self, tabla_inicial, pivotes=None, punto_control_cada=0, base_inicial=None):
+        # tabla_inicial puede ser un arreglo o una función que lo construye (carga perezosa)
+        self._tabla_inicial = tabla_inicial
+        # columna básica de cada fila en la tabla inicial (None: se detecta en la tabla)
+        self.base_inicial = base_inicial
+        self.pivotes = list(pivotes) if pivotes is not None else []
+        self.punto_control_cada = punto_control_cada
+        self.puntos_control = {}  # número de pivotes aplicados -> copia de la tabla
+        self.final = None  # tabla final, si el motor la conoce
+        self._base = None  # base tras los primeros _base_pivotes pivotes (caché de base())
+        self._base_pivotes = 0
+        # 'optimo', o 'limite_iteraciones' / 'limite_tiempo' si el motor se detuvo antes
+        self.estado = "optimo"
+
+    @property
+    def tabla_inicial(self):
+        if callable(self._tabla_inicial):
+            self._tabla_inicial = np.array(self._tabla_inicial(), dtype=float)
+        return self._tabla_inicial
+
+    def registrar(self, col_pivote, fila_pivote, valor_pivote, tabla=None):
+        """Agrega un pivote al registro. `tabla` es la tabla ya pivoteada; solo se
+        copia cuando corresponde un punto de control."""
+        self.pivotes.append((int(col_pivote), int(fila_pivote), float(valor_pivote)))
+        k = len(self.pivotes)
+        if tabla is not None and self.punto_control_cada and k % self.punto_control_cada == 0:
+            self.puntos_control[k] = tabla.copy()
+
+    def __len__(self):
+        return len(self.pivotes) + 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("iteración fuera de rango")
+        if i == len(self) - 1 and self.final is not None:
+            return self.final.copy()
+        inicio = max((k for k in self.puntos_control if k <= i), default=0)
+        tabla = (self.puntos_control[inicio] if inicio else self.tabla_inicial).copy()
+        self._repetir(tabla, inicio, i)
+        return tabla
+
+    def __iter__(self):
+        tabla = self.tabla_inicial.copy()
+        yield tabla.copy()
+        trabajo = np.empty_like(tabla)
+        for k in range(len(self.pivotes)):
+            self._repetir(tabla, k, k + 1, trabajo)
+            yield tabla.copy()
+
+    def _repetir(self, tabla, desde, hasta, trabajo=None):
+        """Aplica en el lugar los pivotes desde..hasta-1 sobre `tabla`."""
+        from .Simplex import pivotear
+        if trabajo is None and hasta > desde:
+            trabajo = np.empty_like(tabla)
+        for col_pivote, fila_pivote, _ in self.pivotes[desde:hasta]:
+            pivotear(tabla, fila_pivote, col_pivote, trabajo)
+
+    def base(self):
+        """Columnas básicas (una por fila) después del último pivote; sirve para
+        leer la solución y para reoptimizar con resolver_simplex(..., base=historial.base()).
+        Se mantiene en caché y solo aplica los pivotes registrados desde la última llamada."""
+        if self._base is None:
+            if self.base_inicial is None:
+                from .Revised import base_identidad
+                self.base_inicial = base_identidad(self.tabla_inicial)
+            self._base = np.array(self.base_inicial, dtype=int)
+            self._base_pivotes = 0
+        for col_pivote, fila_pivote, _ in self.pivotes[self._base_pivotes:]:
+            self._base[fila_pivote] = col_pivote
+        self._base_pivotes = len(self.pivotes)
+        return self._base.copy()
+
+    def pivote(self, i):
+        """Pivote que lleva de la tabla i a la i+1, o None para la tabla final."""
+        return self.pivotes[i] if 0 <= i < len(self.pivotes) else None
@@ -0,0 +1,288 @@
+# presolve.py
+"""
+Presolve: simplifica max/min c^T x sujeto a A x (ops) b, x >= 0 antes de
+construir la tabla, y postsolve: lleva la solución del problema reducido a las
+variables originales.
+
+Reducciones (se repiten hasta que ninguna cambia el problema):
+- Filas vacías: 0 (op) b se verifica y se descarta (o el problema es infactible).
+- Filas singleton a x_j (op) b: con '=' fijan x_j; con x_j >= l (l > 0) se
+  desplaza la variable (x_j = l + x'_j) y la fila desaparece; con x_j <= u la
+  fila se normaliza a coeficiente 1 (u = 0 fija x_j en cero).
+- Variables fijas: se pasan al lado derecho y a la constante del objetivo.
+- Filas duplicadas (proporcionales): se combinan en la cota más ajustada; si
+  las cotas inferior y superior coinciden queda una igualdad.
+- Columnas dominadas: si aumentar x_j no mejora el objetivo ni ayuda a ninguna
+  restricción (coeficientes >= 0 en '<=', <= 0 en '>=' y nulos en '='), x_j = 0.
+- Columnas duplicadas (proporcionales con factor positivo): se conserva la que
+  más aporta al objetivo por unidad de columna y las demás se fijan en cero.
+
+Cada reducción elimina filas (holguras o artificiales) o columnas de la tabla.
+Trabaja sobre los tripletes no nulos de A, así que acepta matrices densas o
+MatrizDispersa y devuelve A reducida en el mismo formato.
+"""
+
+import time
+from collections import Counter
+
+import numpy as np
+
+from .Simplex import TOL_FACTIBLE
+from .errors import ProblemaInfactible, ProblemaNoAcotado
+from .sparse import desde_tripletes, es_dispersa, tripletes
+
+INVERSO = {"<=": ">=", ">=": "<=", "=": "="}
+
+
+class RegistroPresolve:
+    """Lo que hizo el presolve y los datos necesarios para el postsolve.
+
+    filas / columnas: índices originales de las filas y columnas que quedan en el
+    problema reducido. desplazamiento: valor que se suma a cada variable original
+    (las fijas y las desplazadas por una cota inferior). constante: aporte de esos
+    valores al objetivo. acciones: lista de (tipo, fila, columna, valor).
+    """
+
+    def __init__(self, forma_original, no_nulos_original):
+        self.forma_original = forma_original
+        self.no_nulos_original = no_nulos_original
+        self.forma = forma_original
+        self.no_nulos = no_nulos_original
+        self.filas = np.arange(forma_original[0])
+        self.columnas = np.arange(forma_original[1])
+        self.desplazamiento = np.zeros(forma_original[1])
+        self.constante = 0.0
+        self.acciones = []
+        self.tiempo = 0.0
+
+    def registrar(self, tipo, fila=None, columna=None, valor=None):
+        self.acciones.append((tipo, fila, columna, valor))
+
+    def postsolve(self, x, valor=None):
+        """Solución y objetivo del problema original a partir de los del reducido."""
+        x_original = self.desplazamiento.copy()
+        x_original[self.columnas] += np.asarray(x, dtype=float)
+        return x_original, None if valor is None else valor + self.constante
+
+    def resumen(self):
+        """Diccionario serializable: tamaño antes y después, acciones y tiempo."""
+        return {
+            "filas": [self.forma_original[0], self.forma[0]],
+            "columnas": [self.forma_original[1], self.forma[1]],
+            "no_nulos": [self.no_nulos_original, self.no_nulos],
+            "acciones": dict(Counter(accion[0] for accion in self.acciones)),
+            "tiempo": self.tiempo,
+        }
+
+
+def _fila_vacia_factible(b, op):
+    if op == "<=":
+        return b >= -TOL_FACTIBLE
+    if op == ">=":
+        return b <= TOL_FACTIBLE
+    return abs(b) <= TOL_FACTIBLE
+
+
+def _agrupar(claves, n):
+    """Orden estable de las entradas por clave y punteros de inicio de cada grupo."""
+    orden = np.argsort(claves, kind="stable")
+    punteros = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(claves, minlength=n), out=punteros[1:])
+    return orden, punteros
+
+
+class _Presolve:
+    """Estado de trabajo: tripletes de A y máscaras de filas, columnas y entradas activas."""
+
+    def __init__(self, c, A, b, ops, minimizar):
+        self.c = np.asarray(c, dtype=float).copy()
+        self.b = np.asarray(b, dtype=float).copy()
+        self.ops = list(ops)
+        m, n = len(self.b), len(self.c)
+        self.dispersa = es_dispersa(A)
+        self.fila_e, self.col_e, self.val_e = tripletes(A, (m, n))
+        # Con minimizar se invierte el signo de c solo para decidir dominancia
+        self.signo = -1.0 if minimizar else 1.0
+        self.entrada = np.ones(len(self.val_e), dtype=bool)
+        self.fila = np.ones(m, dtype=bool)
+        self.columna = np.ones(n, dtype=bool)
+        self.por_fila = _agrupar(self.fila_e, m)
+        self.por_columna = _agrupar(self.col_e, n)
+        self.registro = RegistroPresolve((m, n), len(self.val_e))
+
+    def _entradas(self, agrupacion, k):
+        orden, punteros = agrupacion
+        entradas = orden[punteros[k]:punteros[k + 1]]
+        return entradas[self.entrada[entradas]]
+
+    def quitar_fila(self, i):
+        self.fila[i] = False
+        self.entrada[self._entradas(self.por_fila, i)] = False
+
+    def desplazar(self, j, valor):
+        """x_j = valor + x'_j: mueve el valor al lado derecho y a la constante."""
+        entradas = self._entradas(self.por_columna, j)
+        np.subtract.at(self.b, self.fila_e[entradas], self.val_e[entradas] * valor)
+        self.registro.constante += self.c[j] * valor
+        self.registro.desplazamiento[j] += valor
+
+    def fijar(self, j, valor, tipo):
+        self.desplazar(j, valor)
+        self.columna[j] = False
+        self.entrada[self._entradas(self.por_columna, j)] = False
+        self.registro.registrar(tipo, columna=int(j), valor=float(valor))
+
+    def filas_vacias_y_singleton(self):
+        cambios = False
+        conteo = np.bincount(self.fila_e[self.entrada], minlength=len(self.b))
+        for i in np.flatnonzero(self.fila & (conteo == 0)):
+            if not _fila_vacia_factible(self.b[i], self.ops[i]):
+                raise ProblemaInfactible(f"La restricción {i+1} no tiene variables y no se cumple.")
+            self.quitar_fila(i)
+            self.registro.registrar("fila_vacia", fila=int(i))
+            cambios = True
+
+        for i in np.flatnonzero(self.fila & (conteo == 1)):
+            entradas = self._entradas(self.por_fila, i)
+            if len(entradas) != 1:  # una fijación anterior de esta ronda la vació
+                continue
+            k = entradas[0]
+            j, a = self.col_e[k], self.val_e[k]
+            valor = self.b[i] / a
+            op = self.ops[i] if a > 0 else INVERSO[self.ops[i]]
+            tolerancia = TOL_FACTIBLE * max(1.0, abs(valor))
+            if op == "=":
+                if valor < -tolerancia:
+                    raise ProblemaInfactible(f"La restricción {i+1} fija x{j+1} = {valor:g} < 0.")
+                self.quitar_fila(i)
+                self.fijar(j, max(valor, 0.0), "variable_fija")
+            elif op == ">=":
+                self.quitar_fila(i)
+                if valor > tolerancia:
+                    self.desplazar(j, valor)
+                    self.registro.registrar("cota_inferior", fila=int(i), columna=int(j), valor=float(valor))
+                else:
+                    self.registro.registrar("fila_redundante", fila=int(i))
+            elif valor < -tolerancia:
+                raise ProblemaInfactible(f"La restricción {i+1} exige x{j+1} <= {valor:g} < 0.")
+            elif valor <= tolerancia:
+                self.quitar_fila(i)
+                self.fijar(j, 0.0, "variable_fija")
+            elif a != 1.0 or self.ops[i] != "<=":
+                self.val_e[k], self.b[i], self.ops[i] = 1.0, valor, "<="
+                self.registro.registrar("cota_superior", fila=int(i), columna=int(j), valor=float(valor))
+            else:
+                continue
+            cambios = True
+        return cambios
+
+    def _proporcionales(self, grupo_e, posicion_e, con_signo):
+        """Agrupa las filas (o columnas) activas cuyo vector de coeficientes es
+        proporcional. Cada vector se divide por su primer coeficiente (por su valor
+        absoluto si con_signo es False, así el factor es positivo). Genera listas
+        de (indice, entradas, escala) con al menos dos elementos."""
+        activas = np.flatnonzero(self.entrada)
+        activas = activas[np.lexsort((posicion_e[activas], grupo_e[activas]))]
+        indices, inicios = np.unique(grupo_e[activas], return_index=True)
+        grupos = {}
+        for k, entradas in zip(indices, np.split(activas, inicios[1:])):
+            escala = self.val_e[entradas[0]]
+            if not con_signo:
+                escala = abs(escala)
+            clave = (posicion_e[entradas].tobytes(), np.round(self.val_e[entradas] / escala, 10).tobytes())
+            grupos.setdefault(clave, []).append((k, entradas, escala))
+        return (grupo for grupo in grupos.values() if len(grupo) > 1)
+
+    def filas_duplicadas(self):
+        """Combina filas proporcionales: cada una se escala para que su primer
+        coeficiente sea 1 y las que coinciden se reducen a sus cotas más ajustadas."""
+        cambios = False
+        for filas in self._proporcionales(self.fila_e, self.col_e, con_signo=True):
+            grupo = [(i, entradas, escala, self.ops[i] if escala > 0 else INVERSO[self.ops[i]],
+                      self.b[i] / escala) for i, entradas, escala in filas]
+            inferior = max((rhs for _, _, _, op, rhs in grupo if op != "<="), default=None)
+            superior = min((rhs for _, _, _, op, rhs in grupo if op != ">="), default=None)
+            if inferior is not None and superior is not None:
+                tolerancia = TOL_FACTIBLE * max(1.0, abs(inferior), abs(superior))
+                if inferior > superior + tolerancia:
+                    raise ProblemaInfactible(
+                        f"Las restricciones {', '.join(str(g[0] + 1) for g in grupo)} son incompatibles.")
+                if superior - inferior <= tolerancia:
+                    cotas = [("=", superior)]
+                else:
+                    cotas = [("<=", superior), (">=", inferior)]
+            else:
+                cotas = [("<=", superior)] if superior is not None else [(">=", inferior)]
+            if len(cotas) == len(grupo):
+                continue
+            for (i, entradas, escala, _, _), (op, rhs) in zip(grupo, cotas):
+                self.val_e[entradas] /= escala
+                self.b[i], self.ops[i] = rhs, op
+            for i, _, _, _, _ in grupo[len(cotas):]:
+                self.quitar_fila(i)
+                self.registro.registrar("fila_duplicada", fila=int(i), columna=int(grupo[0][0]))
+            cambios = True
+        return cambios
+
+    def columnas_dominadas(self):
+        ops = np.array(self.ops)[self.fila_e]
+        obstaculo = (ops == "=") | ((ops == "<=") & (self.val_e < 0)) | ((ops == ">=") & (self.val_e > 0))
+        bloqueadas = np.bincount(self.col_e[self.entrada & obstaculo], minlength=len(self.c)) > 0
+        dominadas = np.flatnonzero(self.columna & ~bloqueadas & (self.signo * self.c <= 0))
+        for j in dominadas:
+            self.fijar(j, 0.0, "columna_dominada")
+        return len(dominadas) > 0
+
+    def columnas_duplicadas(self):
+        cambios = False
+        for columnas in self._proporcionales(self.col_e, self.fila_e, con_signo=False):
+            aportes = [self.signo * self.c[j] / escala for j, _, escala in columnas]
+            mejor = columnas[int(np.argmax(aportes))][0]
+            for j, _, _ in columnas:
+                if j != mejor:
+                    self.fijar(j, 0.0, "columna_duplicada")
+            cambios = True
+        return cambios
+
+    def reducido(self):
+        filas, columnas = np.flatnonzero(self.fila), np.flatnonzero(self.columna)
+        nueva_fila = np.full(len(self.fila), -1)
+        nueva_fila[filas] = np.arange(len(filas))
+        nueva_columna = np.full(len(self.columna), -1)
+        nueva_columna[columnas] = np.arange(len(columnas))
+        entradas = np.flatnonzero(self.entrada)
+        forma = (len(filas), len(columnas))
+        A = desde_tripletes(nueva_fila[self.fila_e[entradas]], nueva_columna[self.col_e[entradas]],
+                            self.val_e[entradas], forma, self.dispersa)
+
+        registro = self.registro
+        registro.filas, registro.columnas = filas, columnas
+        registro.forma, registro.no_nulos = forma, len(entradas)
+        return self.c[columnas], A, self.b[filas], [self.ops[i] for i in filas]
+
+
+def presolve(c, A, b, ops, minimizar=False, max_rondas=20):
+    """
+    Reduce el problema c, A, b, ops (x >= 0; maximizar salvo minimizar=True).
+    Devuelve (c, A, b, ops, registro) con el problema reducido y un
+    RegistroPresolve; registro.postsolve(x, valor) devuelve la solución y el
+    objetivo en las variables originales y registro.resumen() informa cuánto se
+    redujo y cuánto tardó. Si quedan 0 filas y 0 columnas el problema ya está
+    resuelto (x reducida vacía, valor 0).
+    Lanza ProblemaInfactible si alguna reducción prueba que no hay solución, y
+    ProblemaNoAcotado si no quedan restricciones y alguna variable mejora el objetivo.
+    """
+    inicio = time.perf_counter()
+    estado = _Presolve(c, A, b, ops, minimizar)
+    for _ in range(max_rondas):
+        cambios = estado.filas_vacias_y_singleton()
+        cambios |= estado.filas_duplicadas()
+        cambios |= estado.columnas_dominadas()
+        cambios |= estado.columnas_duplicadas()
+        if not cambios:
+            break
+    if not estado.fila.any() and estado.columna.any():
+        raise ProblemaNoAcotado()
+    reducido = estado.reducido()
+    estado.registro.tiempo = time.perf_counter() - inicio
+    return (*reducido, estado.registro)
@@ -0,0 +1,139 @@
+# pricing.py
+"""
+Reglas de elección de la columna entrante (pricing) para el motor de tabla.
+Cada regla implementa:
+- iniciar(tabla, base): se llama una vez con la tabla inicial y su base (columna
+  básica de cada fila).
+- elegir(tabla): devuelve la columna entrante o None si la tabla es óptima.
+- actualizar(tabla, fila_pivote, col_pivote): se llama antes de cada pivoteo,
+  con la tabla todavía sin pivotear, para las reglas que guardan pesos.
+
+Reglas disponibles (ver REGLAS): "dantzig" (coeficiente más negativo),
+"parcial" (Dantzig por bloques de columnas), "devex" (pesos de referencia
+aproximados), "steepest" (arista más empinada exacta: en la tabla se conoce
+la columna completa B^-1 a_j, así que la norma se calcula directamente) y
+"bland" (menor índice; no cicla, y es la que usa iterar_simplex como respaldo
+cuando se acumulan pivoteos degenerados).
+"""
+
+import math
+
+import numpy as np
+
+from .Revised import TOL_PIVOTE
+
+
+class Dantzig:
+    """Columna con el costo reducido más negativo (primera en caso de empate)."""
+
+    nombre = "dantzig"
+
+    def iniciar(self, tabla, base):
+        pass
+
+    def elegir(self, tabla):
+        fila_z = tabla[-1, :-1]
+        col = int(np.argmin(fila_z))
+        return col if fila_z[col] < -TOL_PIVOTE else None
+
+    def actualizar(self, tabla, fila_pivote, col_pivote):
+        pass
+
+
+class Parcial(Dantzig):
+    """Pricing parcial: revisa la fila Z por bloques de columnas y se queda en el
+    primer bloque con candidatas, eligiendo la más negativa dentro del bloque.
+    Solo recorre toda la fila cuando la tabla está cerca del óptimo."""
+
+    nombre = "parcial"
+
+    def __init__(self, tamano_bloque=None):
+        self.tamano_bloque = tamano_bloque
+
+    def iniciar(self, tabla, base):
+        n = tabla.shape[1] - 1
+        self._tamano = self.tamano_bloque or max(1, math.isqrt(n))
+        self._num_bloques = math.ceil(n / self._tamano)
+        self._bloque = 0
+
+    def elegir(self, tabla):
+        fila_z = tabla[-1, :-1]
+        for k in range(self._num_bloques):
+            bloque = (self._bloque + k) % self._num_bloques
+            inicio = bloque * self._tamano
+            col = inicio + int(np.argmin(fila_z[inicio:inicio + self._tamano]))
+            if fila_z[col] < -TOL_PIVOTE:
+                self._bloque = bloque
+                return col
+        return None
+
+
+class Devex(Dantzig):
+    """Devex: maximiza d_j^2 / w_j con pesos de referencia w_j que se actualizan en
+    cada pivoteo a partir de la fila pivote (Forrest y Goldfarb)."""
+
+    nombre = "devex"
+
+    def iniciar(self, tabla, base):
+        self._pesos = np.ones(tabla.shape[1] - 1)
+        self._base = np.array(base, dtype=int)
+
+    def elegir(self, tabla):
+        fila_z = tabla[-1, :-1]
+        negativas = fila_z < -TOL_PIVOTE
+        if not negativas.any():
+            return None
+        puntajes = np.where(negativas, fila_z ** 2 / self._pesos, -1.0)
+        return int(np.argmax(puntajes))
+
+    def actualizar(self, tabla, fila_pivote, col_pivote):
+        fila = tabla[fila_pivote, :-1]
+        razon = fila / fila[col_pivote]
+        peso_entrante = self._pesos[col_pivote]
+        np.maximum(self._pesos, razon ** 2 * peso_entrante, out=self._pesos)
+        saliente = self._base[fila_pivote]
+        self._pesos[saliente] = max(peso_entrante / fila[col_pivote] ** 2, 1.0)
+        self._pesos[col_pivote] = 1.0
+        self._base[fila_pivote] = col_pivote
+
+
+class SteepestEdge(Dantzig):
+    """Arista más empinada: maximiza d_j^2 / (1 + ||B^-1 a_j||^2)."""
+
+    nombre = "steepest"
+
+    def elegir(self, tabla):
+        fila_z = tabla[-1, :-1]
+        negativas = fila_z < -TOL_PIVOTE
+        if not negativas.any():
+            return None
+        columnas = np.flatnonzero(negativas)
+        cuerpo = tabla[:-1, columnas]
+        normas = 1.0 + np.einsum("ij,ij->j", cuerpo, cuerpo)
+        return int(columnas[np.argmax(fila_z[columnas] ** 2 / normas)])
+
+
+class Bland(Dantzig):
+    """Regla de Bland: la primera columna con costo reducido negativo."""
+
+    nombre = "bland"
+
+    def elegir(self, tabla):
+        negativas = np.flatnonzero(tabla[-1, :-1] < -TOL_PIVOTE)
+        return int(negativas[0]) if len(negativas) else None
+
+
+REGLAS = {regla.nombre: regla for regla in (Dantzig, Parcial, Devex, SteepestEdge, Bland)}
+
+
+def crear_regla(pricing=None):
+    """Devuelve una instancia de regla a partir de su nombre, de una instancia
+    (se usa tal cual) o de None (Dantzig)."""
+    if pricing is None:
+        return Dantzig()
+    if isinstance(pricing, str):
+        try:
+            return REGLAS[pricing]()
+        except KeyError:
+            raise ValueError(f"Regla de pricing desconocida: {pricing}") from None
+    return pricing
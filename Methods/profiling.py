@@ -0,0 +1,133 @@
+# profiling.py
+"""
+Perfilador de la resolución a partir de los eventos por iteración.
+
+resolver_simplex, resolver_simplex_desde_tabla, Dos Fases y los menús de Simplex y
+Big M aceptan al_iterar: una función que recibe, tras cada pivoteo, un evento con
+las claves de los registros de Simplex.iterar_simplex. evento["tiempos"] tiene los
+segundos de cada fase:
+- "pricing": elegir la columna entrante (y actualizar los pesos de Devex/steepest).
+- "razon": prueba de razón para la fila saliente.
+- "pivoteo": actualizar la tabla.
+- "registro": guardar el pivote en el historial (copias de la tabla incluidas).
+- "dibujo": armar y mostrar la tabla con rich (menús interactivos).
+Cada motor solo informa las fases que ejecuta.
+
+Perfilador acumula esos eventos y, usado como contexto, mide además la duración
+total y la memoria asignada (con tracemalloc):
+
+    with Perfilador() as perfil:
+        resolver_simplex(c, A, b, al_iterar=perfil)
+    perfil.imprimir()
+"""
+
+import time
+import tracemalloc
+
+FASES = ("pricing", "razon", "pivoteo", "registro", "dibujo")
+
+
+def _formato_bytes(n):
+    for unidad in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unidad}" if unidad == "B" else f"{n:.1f} {unidad}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+class Perfilador:
+    """Acumula tiempo por fase, pivoteos y pivoteos degenerados de los eventos
+    que recibe (se pasa directamente como al_iterar). Como contexto mide la
+    duración total y, si memoria=True, los bytes asignados durante el bloque;
+    tracemalloc encarece cada asignación, así que para comparar tiempos finos
+    conviene memoria=False."""
+
+    def __init__(self, memoria=True):
+        self.memoria = memoria
+        self.tiempos = {}
+        self.pivoteos = 0
+        self.degenerados = 0
+        self.duracion = None
+        self.bytes_netos = None
+        self.bytes_pico = None
+        self._inicio = None
+        self._memoria_inicial = 0
+        self._detener_traza = False
+
+    def __call__(self, evento):
+        self.pivoteos += 1
+        if evento.get("degenerado"):
+            self.degenerados += 1
+        for fase, segundos in (evento.get("tiempos") or {}).items():
+            self.tiempos[fase] = self.tiempos.get(fase, 0.0) + segundos
+
+    def __enter__(self):
+        if self.memoria:
+            self._detener_traza = not tracemalloc.is_tracing()
+            if self._detener_traza:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self._memoria_inicial = tracemalloc.get_traced_memory()[0]
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excepcion):
+        self.duracion = time.perf_counter() - self._inicio
+        if self.memoria:
+            actual, pico = tracemalloc.get_traced_memory()
+            self.bytes_netos = actual - self._memoria_inicial
+            self.bytes_pico = pico - self._memoria_inicial
+            if self._detener_traza:
+                tracemalloc.stop()
+        return False
+
+    def resumen(self):
+        """Diccionario serializable con el tiempo por fase (y 'otros': lo que no
+        cae en ninguna fase, si se midió la duración), pivoteos, degenerados,
+        duración y memoria."""
+        tiempos = {fase: self.tiempos[fase] for fase in FASES if fase in self.tiempos}
+        tiempos.update({fase: t for fase, t in self.tiempos.items() if fase not in tiempos})
+        if self.duracion is not None:
+            tiempos["otros"] = max(self.duracion - sum(self.tiempos.values()), 0.0)
+        return {
+            "tiempos": tiempos,
+            "pivoteos": self.pivoteos,
+            "degenerados": self.degenerados,
+            "duracion": self.duracion,
+            "bytes_netos": self.bytes_netos,
+            "bytes_pico": self.bytes_pico,
+        }
+
+    def imprimir(self, console=None, titulo="Perfil de la resolución"):
+        """Muestra el resumen como tabla de rich: tiempo total, porcentaje y
+        promedio por pivoteo de cada fase, y debajo pivoteos y memoria."""
+        from rich.console import Console
+        from rich.table import Table
+
+        console = console or Console()
+        resumen = self.resumen()
+        total = self.duracion or sum(resumen["tiempos"].values())
+        tabla = Table(title=titulo)
+        tabla.add_column("Fase", style="bold cyan")
+        tabla.add_column("Tiempo (ms)", justify="right")
+        tabla.add_column("%", justify="right")
+        tabla.add_column("µs / pivoteo", justify="right")
+        for fase, segundos in resumen["tiempos"].items():
+            tabla.add_row(fase, f"{segundos * 1e3:.3f}",
+                          f"{100 * segundos / total:.1f}" if total > 0 else "-",
+                          f"{segundos * 1e6 / self.pivoteos:.1f}" if self.pivoteos else "-")
+        console.print(tabla)
+        console.print(f"Pivoteos: {self.pivoteos} ({self.degenerados} degenerados)")
+        if self.duracion is not None:
+            console.print(f"Duración total: {self.duracion * 1e3:.3f} ms")
+        if self.bytes_netos is not None:
+            console.print(f"Memoria asignada: {_formato_bytes(self.bytes_netos)} netos, "
+                          f"{_formato_bytes(self.bytes_pico)} de pico")
+
+
+def perfilar(funcion, *args, memoria=True, **kwargs):
+    """Llama funcion(*args, al_iterar=perfil, **kwargs) dentro de un Perfilador.
+    Devuelve (resultado de la función, perfilador)."""
+    with Perfilador(memoria) as perfil:
+        resultado = funcion(*args, al_iterar=perfil, **kwargs)
+    return resultado, perfil
@@ -0,0 +1,81 @@
+# render.py
+"""
+Gráficos del método gráfico guardados en archivos, sin ventana ni pantalla.
+
+Lienzo arma una sola figura de matplotlib sobre el lienzo Agg (sin pyplot, así
+que no depende del backend configurado ni de que haya un DISPLAY) y la reutiliza
+para cada problema: limpia los ejes, vuelve a dibujar con
+Graphic.dibujar_region y guarda en PNG, SVG o PDF. Crear una figura por problema
+cuesta más que dibujarla, por eso en lotes conviene un Lienzo por proceso
+(lienzo_del_proceso), que es lo que hace el modo por lotes con --plot-dir:
+
+    python main.py solve modelos/ -m graphic --plot-dir graficos/ -j 0
+"""
+
+import os
+
+import numpy as np
+
+from .sparse import es_dispersa
+
+FORMATOS = ("png", "svg", "pdf")
+
+_lienzo = None
+
+
+class Lienzo:
+    """Figura y ejes reutilizables para guardar gráficos de problemas de 2
+    variables. tamaño en pulgadas y dpi solo afectan a los formatos de mapa de
+    bits (PNG)."""
+
+    def __init__(self, tamaño=(8, 6), dpi=100):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.figura = Figure(figsize=tamaño, dpi=dpi)
+        FigureCanvasAgg(self.figura)
+        self.ejes = self.figura.add_subplot()
+        # Márgenes fijos en lugar de tight_layout, que recalcula el texto en cada dibujo
+        self.figura.subplots_adjust(left=0.08, right=0.97, bottom=0.08, top=0.93)
+
+    def dibujar(self, programa, resultado=None):
+        """Dibuja la región factible de un ProgramaLineal de 2 variables y el
+        punto óptimo o el rayo no acotado del resultado (si no se da, se resuelve)."""
+        from .Graphic import dibujar_region, resolver_grafico, restricciones_de
+
+        if programa.n != 2:
+            raise ValueError("El método gráfico solo admite 2 variables.")
+        if es_dispersa(programa.A):
+            programa = programa.con_datos(programa.c, programa.A.toarray(), programa.b, programa.ops)
+        resuelto, region = resolver_grafico(programa)
+        resultado = resultado or resuelto
+        self.ejes.cla()
+        optimo = z_optimo = None
+        if resultado.estado == "optimo" and resultado.x is not None:
+            optimo, z_optimo = np.asarray(resultado.x, dtype=float), resultado.objetivo
+        dibujar_region(self.ejes, restricciones_de(programa), region, optimo, z_optimo,
+                       leyenda="upper right", rayo=resultado.informe.get("rayo"))
+
+    def guardar(self, ruta, programa, resultado=None, formato=None):
+        """Dibuja el problema y lo guarda en `ruta`; el formato sale de la
+        extensión si no se indica."""
+        self.dibujar(programa, resultado)
+        formato = formato or os.path.splitext(ruta)[1].lstrip(".").lower()
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato de gráfico desconocido: {formato}")
+        self.figura.savefig(ruta, format=formato)
+        return ruta
+
+
+def lienzo_del_proceso():
+    """Lienzo compartido por todas las llamadas del proceso actual (cada proceso
+    de un pool crea el suyo la primera vez que guarda un gráfico)."""
+    global _lienzo
+    if _lienzo is None:
+        _lienzo = Lienzo()
+    return _lienzo
+
+
+def guardar_grafico(ruta, programa, resultado=None, formato=None):
+    """Guarda el gráfico de `programa` en `ruta` con el Lienzo del proceso."""
+    return lienzo_del_proceso().guardar(ruta, programa, resultado, formato)
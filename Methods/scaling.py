@@ -0,0 +1,118 @@
+# scaling.py
+"""
+Escalado de filas y columnas para modelos con coeficientes de magnitudes muy
+distintas (por ejemplo de 1e-3 a 1e5), en los que la prueba de razón y las
+tolerancias absolutas de la tabla eligen mal los pivotes.
+
+Con factores positivos R (filas), S (columnas) y un factor del objetivo g:
+    A_e = R A S,  b_e = R b,  c_e = g S c
+de modo que x = S x_e y c^T x = (c_e^T x_e) / g; los operadores de cada fila
+no cambian. Los factores se redondean a potencias de 2 para que escalar y
+desescalar no introduzcan error de redondeo.
+
+Métodos (ver METODOS):
+- "geometrica": pasadas alternadas por filas y columnas que dividen cada una por
+  la media geométrica de su mayor y su menor coeficiente; se detiene cuando el
+  rango max|a| / min|a| deja de mejorar.
+- "equilibrio": divide cada fila por su mayor coeficiente y después cada columna
+  por el suyo, así el mayor coeficiente de cada fila y columna queda en 1.
+"""
+
+import time
+
+import numpy as np
+
+from .sparse import desde_tripletes, es_dispersa, tripletes
+
+METODOS = ("geometrica", "equilibrio")
+
+
+class Escalado:
+    """Factores aplicados a un problema y la transformación inversa."""
+
+    def __init__(self, metodo, filas, columnas, objetivo, rango_original, rango):
+        self.metodo = metodo
+        self.filas = filas
+        self.columnas = columnas
+        self.objetivo = objetivo
+        self.rango_original = rango_original
+        self.rango = rango
+        self.tiempo = 0.0
+
+    def desescalar(self, x, valor=None):
+        """Solución y objetivo del problema original a partir de los del escalado."""
+        x = np.asarray(x, dtype=float) * self.columnas
+        return x, None if valor is None else valor / self.objetivo
+
+    def desescalar_duales(self, y):
+        """Precios sombra del problema original: y = R y_e / g."""
+        return self.filas * np.asarray(y, dtype=float) / self.objetivo
+
+    def resumen(self):
+        """Diccionario serializable: método, rango de |a_ij| antes y después y tiempo."""
+        return {"metodo": self.metodo, "rango": [self.rango_original, self.rango],
+                "tiempo": self.tiempo}
+
+
+def _potencia_de_dos(v):
+    return np.exp2(np.round(np.log2(v)))
+
+
+def _rango(valores):
+    return float(valores.max() / valores.min()) if len(valores) else 1.0
+
+
+def _factores(grupo, valores, n, geometrica):
+    """1 / (media geométrica de max y min) o 1 / max de |valores| por grupo; 1 si está vacío."""
+    maximo = np.zeros(n)
+    np.maximum.at(maximo, grupo, valores)
+    if geometrica:
+        minimo = np.full(n, np.inf)
+        np.minimum.at(minimo, grupo, valores)
+        maximo = np.sqrt(maximo * np.where(np.isinf(minimo), 0.0, minimo))
+    return np.divide(1.0, maximo, out=np.ones(n), where=maximo > 0)
+
+
+def escalar(c, A, b, metodo="geometrica", max_pasadas=10):
+    """
+    Escala A, b y c (A densa o MatrizDispersa; se devuelve en el mismo formato).
+    Devuelve (c_e, A_e, b_e, escalado); escalado.desescalar(x_e, valor_e) da la
+    solución y el objetivo originales.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método de escalado desconocido: {metodo}")
+    inicio = time.perf_counter()
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = len(b), len(c)
+    fila_e, col_e, val_e = tripletes(A, (m, n))
+    magnitud = np.abs(val_e)
+    rango_original = _rango(magnitud)
+
+    r, s = np.ones(m), np.ones(n)
+    if metodo == "geometrica":
+        rango = rango_original
+        for _ in range(max_pasadas):
+            r_nuevo = _factores(fila_e, magnitud * s[col_e], m, geometrica=True)
+            s_nuevo = _factores(col_e, magnitud * r_nuevo[fila_e], n, geometrica=True)
+            rango_nuevo = _rango(magnitud * r_nuevo[fila_e] * s_nuevo[col_e])
+            if rango_nuevo >= rango:
+                break
+            r, s = r_nuevo, s_nuevo
+            if rango_nuevo > 0.9 * rango:
+                break
+            rango = rango_nuevo
+    else:
+        r = _factores(fila_e, magnitud, m, geometrica=False)
+        s = _factores(col_e, magnitud * r[fila_e], n, geometrica=False)
+    r, s = _potencia_de_dos(r), _potencia_de_dos(s)
+
+    c_e = s * c
+    maximo_c = np.abs(c_e).max(initial=0.0)
+    g = float(_potencia_de_dos(1.0 / maximo_c)) if maximo_c > 0 else 1.0
+    val_e = val_e * r[fila_e] * s[col_e]
+    A_e = desde_tripletes(fila_e, col_e, val_e, (m, n), es_dispersa(A))
+
+    escalado = Escalado(metodo, r, s, g, rango_original, _rango(np.abs(val_e)))
+    escalado.tiempo = time.perf_counter() - inicio
+    return g * c_e, A_e, r * b, escalado
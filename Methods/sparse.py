@@ -0,0 +1,116 @@
+# sparse.py
+"""
+Matriz dispersa mínima (formato CSC) para las restricciones del problema.
+Solo implementa lo que necesitan los motores: extraer columnas, productos
+A x y A^T y, y cambiar el signo de filas. La memoria es proporcional al número
+de entradas no nulas.
+"""
+
+import numpy as np
+
+
+class MatrizDispersa:
+    """Matriz m x n en formato CSC (columnas comprimidas)."""
+
+    def __init__(self, datos, indices, punteros, forma):
+        self.datos = np.asarray(datos, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)   # fila de cada entrada
+        self.punteros = np.asarray(punteros, dtype=np.int64)  # inicio de cada columna
+        self.shape = (int(forma[0]), int(forma[1]))
+        # Columna de cada entrada, para productos vectorizados con bincount
+        self._columnas = np.repeat(np.arange(self.shape[1]), np.diff(self.punteros))
+
+    @classmethod
+    def desde_coo(cls, filas, columnas, valores, forma):
+        """Construye la matriz a partir de tripletes (fila, columna, valor).
+        Las entradas repetidas se suman y los ceros se descartan."""
+        m, n = forma
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        claves, inversa = np.unique(columnas * m + filas, return_inverse=True)
+        valores = np.bincount(inversa.ravel(), weights=valores, minlength=len(claves))
+        no_nulos = valores != 0
+        claves, valores = claves[no_nulos], valores[no_nulos]
+        columnas, filas = np.divmod(claves, m)
+        punteros = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(columnas, minlength=n), out=punteros[1:])
+        return cls(valores, filas, punteros, forma)
+
+    @classmethod
+    def desde_csr(cls, datos, indices, punteros, forma):
+        """Construye la matriz a partir de arreglos CSR (filas comprimidas)."""
+        filas = np.repeat(np.arange(forma[0]), np.diff(punteros))
+        return cls.desde_coo(filas, indices, datos, forma)
+
+    @classmethod
+    def desde_densa(cls, A):
+        A = np.asarray(A, dtype=float)
+        filas, columnas = np.nonzero(A)
+        return cls.desde_coo(filas, columnas, A[filas, columnas], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.datos)
+
+    def columna(self, j):
+        """Devuelve la columna j como vector denso de longitud m."""
+        col = np.zeros(self.shape[0])
+        inicio, fin = self.punteros[j], self.punteros[j + 1]
+        col[self.indices[inicio:fin]] = self.datos[inicio:fin]
+        return col
+
+    def producto(self, x):
+        """A x"""
+        return np.bincount(self.indices, weights=self.datos * x[self._columnas],
+                           minlength=self.shape[0])
+
+    def producto_transpuesto(self, y):
+        """A^T y"""
+        return np.bincount(self._columnas, weights=self.datos * y[self.indices],
+                           minlength=self.shape[1])
+
+    def escalar_filas(self, s):
+        """Devuelve diag(s) A sin densificar."""
+        return MatrizDispersa(self.datos * np.asarray(s, dtype=float)[self.indices],
+                              self.indices, self.punteros, self.shape)
+
+    def toarray(self):
+        A = np.zeros(self.shape)
+        A[self.indices, self._columnas] = self.datos
+        return A
+
+
+def es_dispersa(A):
+    """True si A es una MatrizDispersa o una matriz dispersa de SciPy."""
+    return isinstance(A, MatrizDispersa) or hasattr(A, "tocsc")
+
+
+def tripletes(A, forma):
+    """Entradas no nulas de A (densa o dispersa) como (filas, columnas, valores)."""
+    if es_dispersa(A):
+        A = como_dispersa(A)
+        return A.indices.copy(), np.repeat(np.arange(A.shape[1]), np.diff(A.punteros)), A.datos.copy()
+    A = np.asarray(A, dtype=float).reshape(forma)
+    filas, columnas = np.nonzero(A)
+    return filas, columnas, A[filas, columnas]
+
+
+def desde_tripletes(filas, columnas, valores, forma, dispersa):
+    """Inversa de tripletes: MatrizDispersa si dispersa, si no un arreglo denso."""
+    if dispersa:
+        return MatrizDispersa.desde_coo(filas, columnas, valores, forma)
+    A = np.zeros(forma)
+    A[filas, columnas] = valores
+    return A
+
+
+def como_dispersa(A):
+    """Convierte A (MatrizDispersa, matriz de SciPy o arreglo denso) a MatrizDispersa."""
+    if isinstance(A, MatrizDispersa):
+        return A
+    if hasattr(A, "tocsc"):
+        csc = A.tocsc()
+        csc.sum_duplicates()
+        return MatrizDispersa(csc.data, csc.indices, csc.indptr, csc.shape)
+    return MatrizDispersa.desde_densa(A)
@@ -4,11 +4,11 @@ Módulo para la visualización y formateo de tablas del método Simplex.
 Contiene todas las funciones relacionadas con la presentación visual de datos.
 """
 
+from fractions import Fraction
+
 import numpy as np
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from .consola import console
 
 def formatear_expresion(coefs):
     """Devuelve una cadena como '3x1 - 2x2 + 5x3' a partir de coeficientes.
@@ -35,7 +35,10 @@ def formatear_expresion(coefs):
 
 def fmt_num(x, ndigits=4, eps=5e-5):
     """Formatea números evitando '-0.0000'. Aplica redondeo a ndigits.
-    Si |x| < eps, devuelve '0.0000'."""
+    Si |x| < eps, devuelve '0.0000'. Las Fraction (modo exacto) se muestran
+    exactas, como '7/3'."""
+    if isinstance(x, Fraction):
+        return str(x)
     if abs(x) < eps:
         return f"{0.0:.{ndigits}f}"
     s = f"{x:.{ndigits}f}"
@@ -48,8 +51,14 @@ def fmt_num(x, ndigits=4, eps=5e-5):
             pass
     return s
 
-def show_simplex_table(tabla, iteracion=1, variables_basicas=None):
-    """Muestra una tabla del método Simplex con formato profesional."""
+def show_simplex_table(tabla, iteracion=1, variables_basicas=None, pivote=None, base=None):
+    """Muestra una tabla del método Simplex con formato profesional.
+    pivote: entrada opcional del registro de pivotes (columna, fila, valor) que se
+    aplica sobre esta tabla; se resalta y se indican las variables que entran y salen.
+    base: columna básica de cada fila (registro["base"] de iterar_simplex); si se
+    da, las etiquetas de fila se leen de ahí en lugar de buscar columnas identidad."""
+    from rich.table import Table
+
     console.print(f"\n[bold underline]📊 Iteración {iteracion}[/bold underline]\n")
 
     tabla_rich = Table(
@@ -71,7 +80,10 @@ def show_simplex_table(tabla, iteracion=1, variables_basicas=None):
     # Agregar filas
     # Calcular nombres de variables básicas por fila (columna identidad)
     vb_labels = ["Z"]
-    if variables_basicas and len(variables_basicas) >= 3:
+    if base is not None:
+        var_names = variables_basicas[1:-1]
+        vb_labels += [var_names[j] for j in base]
+    elif variables_basicas and len(variables_basicas) >= 3:
         var_names = variables_basicas[1:-1]  # nombres de columnas numéricas
         num_rows = len(tabla) - 1
         num_cols = len(var_names)
@@ -81,7 +93,7 @@ def show_simplex_table(tabla, iteracion=1, variables_basicas=None):
             for j in range(num_cols):
                 col_vec = [tabla[row_idx][j] for row_idx in range(len(tabla))]
                 # ignorar fila Z (index 0); identidad en filas 1..n
-                col_body = col_vec[1:-1] if len(col_vec) > 1 else []
+                col_body = col_vec[1:]
                 # Para fila de datos r, en tabla la fila es r+1
                 if len(col_body) == num_rows and col_body.count(0) == num_rows - 1 and abs(col_body[r] - 1.0) < 1e-9:
                     vb_name = var_names[j]
@@ -92,9 +104,17 @@ def show_simplex_table(tabla, iteracion=1, variables_basicas=None):
 
     for i, fila in enumerate(tabla):
         celdas = [vb_labels[i]] + [fmt_num(x) for x in fila]
+        # La fila Z va primero en la visualización: la fila r de la tabla es la r+1
+        if pivote is not None and i == pivote[1] + 1:
+            celdas[pivote[0] + 1] = f"[black on bright_yellow]{celdas[pivote[0] + 1]}[/]"
         tabla_rich.add_row(*celdas)
 
     console.print(tabla_rich)
+    if pivote is not None:
+        col, fila_pivote, valor = pivote
+        console.print(f"Variable entrante: {variables_basicas[col + 1]}, "
+                      f"Variable saliente: {vb_labels[fila_pivote + 1]}, "
+                      f"Elemento pivote: ({fmt_num(valor)})")
     console.print("")  # espacio extra
 
 def preparar_tabla_para_mostrar(tabla_np):
@@ -1,26 +1,38 @@
 # main.py
+import argparse
+import json
 import sys
-from pyfiglet import Figlet
-from rich.console import Console
-from rich.align import Align
-import questionary
 
-# Metodos
-from Methods.Graphic import metodo_grafico
-from Methods.Simplex import simplex
-from Methods.BigM import big_m
-
-console = Console()
+# Los métodos, rich, pyfiglet y questionary se importan al usarlos: así el modo
+# por lotes y el menú arrancan sin cargar matplotlib
+from Methods.consola import banner, console
 
 def show_logo():
-    """Muestra un logo ASCII centrado con estilo."""
-    f = Figlet(font='big')
-    logo = f.renderText('LinOpt')
+    """Muestra un logo ASCII centrado con estilo (el texto se dibuja una sola vez)."""
+    from rich.align import Align
+
+    logo = banner('LinOpt')
     console.print(Align.center(logo, vertical="middle"), style="bold cyan")
     console.print(Align.center("📊 Optimización Lineal en Terminal 🧮\n", style="italic green"))
 
-def interactive_menu():
-    """Menú principal con questionary que llama a módulos externos."""
+def _ejecutar_metodo(metodo, perfilar):
+    """Ejecuta un método del menú; con perfilar muestra al final el perfil de la resolución."""
+    if not perfilar:
+        return metodo()
+    from Methods.profiling import Perfilador
+
+    with Perfilador() as perfil:
+        metodo(al_iterar=perfil)
+    perfil.duracion = None  # incluye la espera del usuario: no se informa
+    perfil.imprimir(console)
+    console.input("\n[bold cyan]Presiona Enter para volver al menú...[/bold cyan]")
+
+def interactive_menu(perfilar=False):
+    """Menú principal con questionary que llama a módulos externos.
+    Con perfilar, los métodos Simplex, Gran M y Dos Fases muestran al terminar el
+    tiempo por fase de cada pivoteo (ver Methods/profiling.py)."""
+    import questionary
+
     while True:
         console.clear()
         show_logo()
@@ -29,6 +41,7 @@ def interactive_menu():
             "Método Gráfico",
             "Método Simplex",
             "Método Gran M",
+            "Método de las Dos Fases",
             "Salir"
         ]
 
@@ -47,15 +60,137 @@ def interactive_menu():
             console.print("\n👋 ¡Gracias por usar LinOpt! Hasta pronto.", style="bold green")
             break
         elif seleccion == "Método Gráfico":
+            from Methods.Graphic import metodo_grafico
             metodo_grafico()
         elif seleccion == "Método Simplex":
-            simplex()
+            from Methods.Simplex import simplex
+            _ejecutar_metodo(simplex, perfilar)
         elif seleccion == "Método Gran M":
-            big_m()
+            from Methods.BigM import big_m
+            _ejecutar_metodo(big_m, perfilar)
+        elif seleccion == "Método de las Dos Fases":
+            from Methods.TwoPhase import dos_fases
+            _ejecutar_metodo(dos_fases, perfilar)
+
+def solve_command(args):
+    """Modo por lotes: resuelve archivos de problemas sin preguntas interactivas."""
+    from Methods.batch import resolver_archivos
+    from Methods.pricing import REGLAS
+    from Methods.scaling import METODOS
+
+    pricing = list(REGLAS) if args.pricing == "all" else args.pricing
+    escalado = [None, *METODOS] if args.scaling == "all" else args.scaling
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as salida:
+            errores = resolver_archivos(args.entradas, args.method, salida, args.jobs, args.timeout,
+                                        pricing, args.max_iter, args.presolve, escalado,
+                                        args.plot_dir, args.plot_format)
+    else:
+        errores = resolver_archivos(args.entradas, args.method, sys.stdout, args.jobs, args.timeout,
+                                    pricing, args.max_iter, args.presolve, escalado,
+                                    args.plot_dir, args.plot_format)
+    return 1 if errores else 0
+
+def bench_command(args):
+    """Banco de pruebas: mide los motores o compara dos archivos de resultados."""
+    from rich.console import Console
+    from rich.table import Table
+    from Methods import benchmark
+
+    if args.compare:
+        filas = benchmark.comparar(benchmark.cargar(args.compare[0]), benchmark.cargar(args.compare[1]),
+                                   args.threshold)
+        tabla = Table(title=f"Comparación (umbral {args.threshold:.0%})")
+        tabla.add_column("Caso", no_wrap=True)
+        for columna in ("Familia", "Tamaño", "Anterior (s)", "Actual (s)", "Razón", "Estado"):
+            tabla.add_column(columna)
+        colores = {"regresion": "red", "objetivo_distinto": "red", "error": "red", "mejora": "green"}
+        for fila in filas:
+            estado = fila["estado"]
+            color = colores.get(estado, "white")
+            tabla.add_row(fila["caso"], fila["familia"], str(fila["tamaño"]),
+                          "-" if fila["anterior"] is None else f"{fila['anterior']:.6f}",
+                          "-" if fila["actual"] is None else f"{fila['actual']:.6f}",
+                          "-" if fila["razon"] is None else f"{fila['razon']:.2f}",
+                          f"[{color}]{estado}[/{color}]")
+        console.print(tabla)
+        return 1 if benchmark.hay_regresiones(filas) else 0
+
+    # El avance va a stderr para no mezclarse con el JSON en la salida estándar
+    consola_avance = Console(stderr=True)
+
+    def progreso(resultado):
+        detalle = resultado.get("error") or f"{resultado['mediana']:.6f} s, {resultado['iteraciones']} iteraciones"
+        consola_avance.print(f"{resultado['caso']} / {resultado['familia']} / {resultado['tamaño']}: {detalle}",
+                             style="dim", highlight=False)
+
+    datos = benchmark.ejecutar_suite(repeticiones=args.repeat, rapido=args.quick, casos=args.case,
+                                     progreso=progreso)
+    if args.output:
+        benchmark.guardar(datos, args.output)
+    else:
+        json.dump(datos, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="LinOpt: sin argumentos abre el menú interactivo.")
+    parser.add_argument("--profile", action="store_true",
+                        help="En el menú interactivo, muestra el tiempo por fase de cada resolución.")
+    subparsers = parser.add_subparsers(dest="comando")
+    solve = subparsers.add_parser(
+        "solve", help="Resuelve problemas desde archivos JSON, CSV, NPZ, MPS o LP (una línea JSON por problema).")
+    solve.add_argument("entradas", nargs="+", help="Archivos, directorios o patrones glob.")
+    solve.add_argument("--method", "-m", choices=["simplex", "twophase", "bigm", "graphic"], default="simplex",
+                       help="Método de resolución (por defecto: simplex).")
+    solve.add_argument("--output", "-o", help="Archivo de salida (por defecto: salida estándar).")
+    solve.add_argument("--jobs", "-j", type=int, default=1,
+                       help="Procesos en paralelo (0 = uno por CPU; por defecto: 1).")
+    solve.add_argument("--pricing", choices=["dantzig", "parcial", "devex", "steepest", "bland", "all"],
+                       default=None,
+                       help="Regla de columna entrante; 'all' resuelve con cada regla para compararlas.")
+    solve.add_argument("--max-iter", type=int, default=None,
+                       help="Pivoteos máximos por problema; al alcanzarlos el estado es 'limite_iteraciones'.")
+    solve.add_argument("--presolve", action="store_true",
+                       help="Reduce cada problema antes de resolverlo e informa la reducción.")
+    solve.add_argument("--scaling", choices=["geometrica", "equilibrio", "all"], default=None,
+                       help="Escala filas y columnas antes de resolver; 'all' compara sin escalar y con cada método.")
+    solve.add_argument("--timeout", type=float, default=None,
+                       help="Tiempo límite en segundos por problema.")
+    solve.add_argument("--plot-dir",
+                       help="Con --method graphic, guarda el gráfico de cada problema en este directorio.")
+    solve.add_argument("--plot-format", choices=["png", "svg", "pdf"], default="png",
+                       help="Formato de los gráficos de --plot-dir (por defecto: png).")
+    bench = subparsers.add_parser(
+        "bench", help="Mide el tiempo de los motores con problemas generados (resultados en JSON).")
+    bench.add_argument("--output", "-o", help="Archivo JSON de resultados (por defecto: salida estándar).")
+    bench.add_argument("--repeat", "-r", type=int, default=5,
+                       help="Repeticiones medidas por caso (por defecto: 5).")
+    bench.add_argument("--quick", action="store_true", help="Solo el tamaño menor de cada familia.")
+    bench.add_argument("--case", action="append",
+                       choices=["resolver_simplex", "resolver_simplex_desde_tabla", "big_m", "grafico", "grafico_png",
+                                "arranque"],
+                       help="Mide solo este caso (se puede repetir).")
+    bench.add_argument("--compare", nargs=2, metavar=("ANTERIOR", "ACTUAL"),
+                       help="Compara dos archivos de resultados; termina con código 1 si hay regresiones.")
+    bench.add_argument("--threshold", type=float, default=0.10,
+                       help="Aumento relativo de la mediana que cuenta como regresión (por defecto: 0.10).")
+    args = parser.parse_args(argv)
+    if args.comando == "solve" and args.plot_dir and args.method != "graphic":
+        parser.error("--plot-dir solo se usa con --method graphic")
+    return args
 
 if __name__ == "__main__":
+    args = parse_args()
+    if args.comando == "solve":
+        sys.exit(solve_command(args))
+    if args.comando == "bench":
+        sys.exit(bench_command(args))
     try:
-        interactive_menu()
+        interactive_menu(args.profile)
     except KeyboardInterrupt:
         console.print("\n\n🛑 Interrumpido por el usuario. ¡Adiós!", style="bold red")
         sys.exit(0)
\ No newline at end of file
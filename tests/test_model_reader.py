@@ -0,0 +1,43 @@
+import pytest
+
+from Methods.batch import cargar_problema, resolver_problema
+
+# max 3x + 2y + 5 sujeto a x + y <= 4, x + 3y <= 6, x <= 3 (óptimo 16 en x=3, y=1)
+MODELO_LP = """\\ mismo modelo que MODELO_MPS
+Maximize
+ obj: 3 x + 2 y + 5
+Subject To
+ x + y <= 4
+ x + 3 y <= 6
+ c3: x <= 3
+End
+"""
+
+MODELO_MPS = """NAME prueba
+OBJSENSE
+    MAX
+ROWS
+ N obj
+ L R1
+ L R2
+ L c3
+COLUMNS
+    x obj 3 R1 1
+    x R2 1 c3 1
+    y obj 2 R1 1
+    y R2 3
+RHS
+    RHS obj -5 R1 4
+    RHS R2 6 c3 3
+ENDATA
+"""
+
+
+def test_constante_del_objetivo_en_mps_y_lp(tmp_path):
+    (tmp_path / "modelo.lp").write_text(MODELO_LP, encoding="utf-8")
+    (tmp_path / "modelo.mps").write_text(MODELO_MPS, encoding="utf-8")
+    lp = resolver_problema(cargar_problema(str(tmp_path / "modelo.lp")))
+    mps = resolver_problema(cargar_problema(str(tmp_path / "modelo.mps")))
+    assert lp.estado == mps.estado == "optimo"
+    assert lp.objetivo == pytest.approx(16.0)
+    assert mps.objetivo == pytest.approx(lp.objetivo)